@@ -0,0 +1,120 @@
+"""Micro-benchmarks for the XCon Console.
+
+Usage: python bench.py [dispatch] [eval] [startup]
+
+startup exits with status 1 when the time to the first prompt goes over STARTUP_BUDGET_MS.
+"""
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+import xcon
+
+RESOLVE = getattr(xcon, "__resolve_command")
+SAFE_EVAL = getattr(xcon, "__safe_eval")
+SANITIZE = getattr(xcon, "__sanitize_context")
+
+PROMPTS = [
+    "chgpath up", "inspect folder current", "inspect file text 'x' log.txt", "echo hello",
+    "varmake x set 1", "see x", "check x > 0", "fmake out.txt ^ a | b", "dircopy a b",
+    "numpy info", "help", "what is reality", "some shell command",
+]
+
+def __linear_resolve(prompt: str):
+    # The dispatch XCon used before the command table: one startswith/equality check per command, in order.
+    for COMMAND in xcon.COMMANDS.values():
+        VERB = COMMAND.name
+        if VERB.startswith("* "):
+            if prompt.endswith(VERB[1:]):
+                return COMMAND, prompt.removesuffix(VERB[1:])
+            continue
+        if COMMAND.args and prompt.startswith(VERB + " "):
+            return COMMAND, prompt.removeprefix(VERB + " ")
+        if COMMAND.bare and prompt == VERB:
+            return COMMAND, ""
+    return None, ""
+
+def __time_per_call(resolve, prompt: str, rounds: int) -> float:
+    START = time.perf_counter()
+    for _ in range(rounds):
+        resolve(prompt)
+    return (time.perf_counter() - START) / rounds * 1e9
+
+def bench_dispatch(rounds: int = 20000):
+    print(f"Dispatch latency per command ({len(xcon.COMMANDS)} commands registered, {rounds} rounds):\n")
+    print(f"{'prompt':<34}{'linear (ns)':>14}{'trie (ns)':>12}")
+    for prompt in PROMPTS:
+        BEFORE = __time_per_call(__linear_resolve, prompt, rounds)
+        AFTER = __time_per_call(RESOLVE, prompt, rounds)
+        print(f"{prompt:<34}{BEFORE:>14.0f}{AFTER:>12.0f}")
+
+EXPRESSIONS = ["1 + 1", "len(PROTECTED_NAMES) > 3", "max(1, 2, 3) * 2 == 6", "'a' in 'abc'"]
+
+def __uncached_eval(expr: str):
+    # What __safe_eval did before the compile cache: sanitize everything, build the builtins, then eval the source text.
+    CONTEXT = SANITIZE({**vars(xcon), **xcon.DECLARELIST})
+    return eval(expr, {"__builtins__": dict(xcon.SAFE_GLOBALS["__builtins__"])}, CONTEXT)
+
+def bench_eval(rounds: int = 5000):
+    print(f"Expression evaluation per call ({rounds} rounds):\n")
+    print(f"{'expression':<34}{'uncached (ns)':>14}{'cached (ns)':>12}")
+    for expr in EXPRESSIONS:
+        BEFORE = __time_per_call(__uncached_eval, expr, rounds)
+        AFTER = __time_per_call(SAFE_EVAL, expr, rounds)
+        print(f"{expr:<34}{BEFORE:>14.0f}{AFTER:>12.0f}")
+
+STARTUP_BUDGET_MS = 50 # Import of xcon plus loading variables and modules, everything before the first prompt.
+STARTUP_PROBE = """import time
+START = time.perf_counter()
+import xcon
+getattr(xcon, "__load_vars")()
+getattr(xcon, "__load_modules")()
+print(f"\\n{(time.perf_counter() - START) * 1000:.3f}")
+"""
+
+def __startup_ms(*FLAGS):
+    result = subprocess.run([sys.executable, *FLAGS, "-c", STARTUP_PROBE], cwd=os.path.dirname(os.path.abspath(__file__)), capture_output=True, text=True, check=True)
+    return float(result.stdout.strip().splitlines()[-1]), result.stderr
+
+def __slowest_imports(REPORT: str, COUNT: int):
+    # The modules xcon imports itself, by cumulative time, from a python -X importtime report.
+    ROWS = []
+    for line in REPORT.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        _, CUMULATIVE, NAME = line.split("|")
+        if CUMULATIVE.strip().isdigit():
+            ROWS.append((int(CUMULATIVE), len(NAME) - len(NAME.lstrip()), NAME.strip()))
+    TOP = next((i for i, ROW in enumerate(ROWS) if ROW[2] == "xcon"), None)
+    if TOP is None:
+        return []
+    DIRECT = []
+    for CUMULATIVE, DEPTH, NAME in reversed(ROWS[:TOP]):
+        if DEPTH <= ROWS[TOP][1]:
+            break
+        if DEPTH == ROWS[TOP][1] + 2:
+            DIRECT.append((CUMULATIVE, NAME))
+    return sorted(DIRECT, reverse=True)[:COUNT]
+
+def bench_startup(runs: int = 10) -> bool:
+    __startup_ms() # Warm-up, so the bytecode cache is written.
+    TIMES = [__startup_ms()[0] for _ in range(runs)]
+    MEDIAN = statistics.median(TIMES)
+    print(f"Time to first prompt ({runs} runs): median {MEDIAN:.1f} ms, min {min(TIMES):.1f} ms, max {max(TIMES):.1f} ms, budget {STARTUP_BUDGET_MS} ms\n")
+    print(f"{'slowest imports of xcon':<34}{'cumulative (us)':>16}")
+    for CUMULATIVE, NAME in __slowest_imports(__startup_ms("-X", "importtime")[1], 10):
+        print(f"{NAME:<34}{CUMULATIVE:>16}")
+    if MEDIAN > STARTUP_BUDGET_MS:
+        print(f"\nStartup is over budget by {MEDIAN - STARTUP_BUDGET_MS:.1f} ms.")
+        return False
+    return True
+
+BENCHMARKS = {"dispatch": bench_dispatch, "eval": bench_eval, "startup": bench_startup}
+
+if __name__ == "__main__":
+    OK = True
+    for name in sys.argv[1:] or BENCHMARKS:
+        OK = BENCHMARKS[name]() is not False and OK
+    sys.exit(0 if OK else 1)
@@ -0,0 +1,444 @@
+import io
+import json
+import os
+import re
+import sys
+import tempfile
+
+# xcon reads its data directory at import time, so point it somewhere disposable first.
+os.environ["XDG_DATA_HOME"] = tempfile.mkdtemp(prefix="xcon-test-")
+os.environ["APPDATA"] = os.environ["XDG_DATA_HOME"]
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+
+import xcon
+
+
+def private(name):
+    return getattr(xcon, name)
+
+
+def run(*prompts):
+    for prompt in prompts:
+        private("__handle_prompt")(prompt)
+
+
+def plain(text):
+    return re.sub(r"\x1b\[[0-9;]*m", "", text)
+
+
+@pytest.fixture(autouse=True)
+def sandbox(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
+
+
+def test_script_runs_trailing_ampersand_as_job(sandbox):
+    (sandbox / "job.xcon").write_text("echo 1+1 &\n")
+    BEFORE = set(xcon.JOBS)
+    run("xcon script job.xcon")
+    NEW = [xcon.JOBS[ID] for ID in set(xcon.JOBS) - BEFORE]
+    assert [JOB.prompt for JOB in NEW] == ["echo 1+1"]
+    NEW[0].thread.join(5)
+    assert NEW[0].status == "done"
+    assert "2" in NEW[0].take_output()
+
+
+def test_job_cannot_ask_for_confirmation(monkeypatch):
+    EMPTIED = []
+    monkeypatch.setattr(xcon, "__empty_bin", lambda: EMPTIED.append(True))
+    BEFORE = set(xcon.JOBS)
+    run("empty bin &")
+    (JOB,) = [xcon.JOBS[ID] for ID in set(xcon.JOBS) - BEFORE]
+    JOB.thread.join(5)
+    assert JOB.status == "failed"
+    assert xcon.JOB_INPUT_ERROR in JOB.take_output()
+    assert not EMPTIED
+
+
+def test_expressions_see_python_run_names(capsys):
+    run("python run zq = 41", "echo zq+1", "varmake zq_next set zq+1")
+    assert capsys.readouterr().out.splitlines()[2] == "42"
+    assert xcon.DECLARELIST["zq_next"] == 42
+    run("python run zq = 1", "echo zq+1")
+    assert capsys.readouterr().out.splitlines()[-1] == "2"
+
+
+def test_cached_results_follow_nested_and_shadowed_values(capsys):
+    run("python run lst = [1]", "python run tup = (lst,)", "echo tup[0][0]", "python run lst.append(2); lst[0] = 7", "echo tup[0][0]")
+    assert capsys.readouterr().out.splitlines()[-1] == "7"
+    run("python run shadow = (1,)", "echo [shadow for shadow in shadow]", "python run shadow = (2,)", "echo [shadow for shadow in shadow]")
+    assert capsys.readouterr().out.splitlines()[-1] == "[2]"
+    run("varmake max set 1", "check max", "varmake max set 2", "check max")
+    assert "evaluated to: 2" in capsys.readouterr().out.splitlines()[-1]
+    run("vardel max", "echo max(1, 3)")
+    assert capsys.readouterr().out.splitlines()[-1] == "3"
+
+
+def test_dircopy_rejects_destination_inside_source(sandbox, capsys):
+    (sandbox / "loop" / "sub").mkdir(parents=True)
+    (sandbox / "loop" / "file.txt").write_text("x")
+    run("dircopy loop loop", "dircopy loop loop/sub")
+    assert sorted(os.listdir(sandbox / "loop")) == ["file.txt", "sub"]
+    assert os.listdir(sandbox / "loop" / "sub") == []
+    assert capsys.readouterr().out.count("into itself or into one of its subdirectories") == 2
+    (sandbox / "copy").mkdir()
+    run("dircopy loop copy")
+    assert (sandbox / "copy" / "loop" / "file.txt").read_text() == "x"
+
+
+def test_script_cache_checks_command_table_and_drops_old_scripts(sandbox, monkeypatch):
+    monkeypatch.setattr(xcon, "SCRIPT_CACHE_ENTRIES", 2)
+    monkeypatch.setattr(xcon, "SCRIPT_CACHE", None)
+    for NAME in ("a", "b", "c"):
+        (sandbox / f"{NAME}.xcon").write_text(f"echo '{NAME}'\n")
+    run("xcon script a.xcon", "xcon script b.xcon", "xcon script a.xcon", "xcon script c.xcon")
+    CACHED = [os.path.basename(PATH) for PATH in private("__load_script_cache")()]
+    assert CACHED == ["a.xcon", "c.xcon"]
+    monkeypatch.setattr(xcon, "SCRIPT_CACHE", None)
+    assert len(private("__load_script_cache")()) == 2
+    monkeypatch.setattr(xcon, "SCRIPT_CACHE", None)
+    monkeypatch.setattr(xcon, "SCRIPT_CACHE_VERSION", xcon.SCRIPT_CACHE_VERSION + 1)
+    assert private("__load_script_cache")() == {}
+
+
+def test_console_exits_at_end_of_input(monkeypatch, capsys):
+    monkeypatch.setattr(sys, "stdin", io.StringIO("echo 40+2\n"))
+    with pytest.raises(SystemExit) as EXIT:
+        private("__console")()
+    assert EXIT.value.code == 0
+    OUT = capsys.readouterr().out
+    assert "42" in OUT and "Thank you for using the XCon Console!" in OUT
+    assert "Preventing shutdown" not in OUT
+
+
+def test_shell_keeps_lines_over_the_line_limit(capsys):
+    SIZE = 3 * xcon.SHELL_LINE_LIMIT
+    run(f"{sys.executable} -c \"import sys; sys.stdout.write('a' * {SIZE} + chr(10) + chr(233) * {SIZE})\"")
+    OUT = capsys.readouterr().out
+    assert OUT.count("a") == SIZE
+    assert OUT.count(chr(233)) == SIZE
+
+
+def test_dirdel_allows_protected_names_below_the_target(sandbox, monkeypatch):
+    (sandbox / "dst" / "src" / "music").mkdir(parents=True)
+    (sandbox / "dst" / "src" / "music" / "song.txt").write_text("x")
+    monkeypatch.setattr("builtins.input", lambda prompt="": "y")
+    run("dirdel dst")
+    assert not (sandbox / "dst").exists()
+
+
+def test_dirdel_refuses_tree_with_system_folder(sandbox, monkeypatch, capsys):
+    (sandbox / "dst" / "system").mkdir(parents=True)
+    monkeypatch.setattr(xcon, "PATH_GUARD", xcon.PathGuard([str(sandbox / "dst" / "system")], xcon.PROTECTED_NAMES))
+    monkeypatch.setattr("builtins.input", lambda prompt="": "y")
+    run("dirdel dst")
+    assert (sandbox / "dst" / "system").is_dir()
+    assert "Nothing has been removed" in capsys.readouterr().out
+
+
+def test_job_that_exits_is_reported_as_failed(monkeypatch):
+    monkeypatch.setattr(xcon, "__save_vars", lambda: None)
+    BEFORE = set(xcon.JOBS)
+    run("close &")
+    (JOB,) = [xcon.JOBS[ID] for ID in set(xcon.JOBS) - BEFORE]
+    JOB.thread.join(5)
+    assert JOB.status == "failed"
+    assert "tried to exit XCon" in JOB.take_output()
+
+
+def test_job_paths_resolve_against_the_path_it_started_in(sandbox, tmp_path_factory, monkeypatch):
+    (sandbox / "src").mkdir()
+    (sandbox / "src" / "a.txt").write_text("a")
+    (sandbox / "dst").mkdir()
+    JOBS = [xcon.Job(-1, "dircopy src dst"), xcon.Job(-2, "fcopy src/a.txt out")]
+    OTHER = tmp_path_factory.mktemp("other")
+    monkeypatch.chdir(OTHER) # A chgpath in the foreground after the jobs were started.
+    for JOB in JOBS:
+        private("__run_job")(JOB)
+        assert JOB.status == "done"
+    assert (sandbox / "dst" / "src" / "a.txt").read_text() == "a"
+    assert (sandbox / "out" / "a.txt").read_text() == "a"
+    assert os.listdir(OTHER) == []
+
+
+def test_kill_stops_a_running_job():
+    BEFORE = set(xcon.JOBS)
+    run("python run import time", "python run kill_spin = True")
+    run("python run while kill_spin: time.sleep(0.01) &")
+    (JOB,) = [xcon.JOBS[ID] for ID in set(xcon.JOBS) - BEFORE]
+    run(f"kill {JOB.id}")
+    JOB.thread.join(5)
+    run("python run kill_spin = False")
+    assert JOB.status == "killed"
+
+
+def test_fmake_repeat_flag_only_at_the_end(sandbox):
+    run("fmake a ^ x !repeat 3", "fmake b ^ use !repeat 5 here", "fmake c ^ y | !repeat 2 !nodef")
+    assert (sandbox / "a.txt").read_text() == "x\n" * 3
+    assert (sandbox / "b.txt").read_text() == "use !repeat 5 here\n"
+    assert (sandbox / "c").read_text() == "y\n" * 2
+
+
+def test_fdel_expands_patterns_in_every_path_part(sandbox, monkeypatch):
+    for NAME in ("a", "b"):
+        (sandbox / "build" / NAME).mkdir(parents=True)
+        (sandbox / "build" / NAME / "x.obj").write_text("x")
+    (sandbox / "build" / "a" / "keep.txt").write_text("x")
+    monkeypatch.setattr("builtins.input", lambda prompt="": "y")
+    run("fdel build/*/x.obj !nodef")
+    assert sorted(str(PATH.relative_to(sandbox)) for PATH in sandbox.rglob("*") if PATH.is_file()) == [os.path.join("build", "a", "keep.txt")]
+
+
+def test_dircopy_copies_files_changed_within_the_same_second(sandbox):
+    (sandbox / "src").mkdir()
+    (sandbox / "dst").mkdir()
+    FILE = sandbox / "src" / "a.txt"
+    FILE.write_text("one")
+    SECOND = 1_700_000_000 * 10**9
+    os.utime(FILE, ns=(SECOND, SECOND + 100_000_000))
+    run("dircopy src dst")
+    FILE.write_text("two")
+    os.utime(FILE, ns=(SECOND, SECOND + 600_000_000))
+    run("dircopy src dst")
+    assert (sandbox / "dst" / "src" / "a.txt").read_text() == "two"
+
+
+@pytest.mark.parametrize("prompt, name, args", [
+    ("python run x = 1", "python run", "x = 1"),
+    ("python", "python", ""),
+    ("python block !x def f():", "python block !x", "def f():"),
+    ("echo hi", "echo", "hi"),
+    ("inspect help", "inspect help", ""),
+    ("requests info", "* info", "requests"),
+    ("info", "info", ""),
+])
+def test_commands_resolve_through_the_trie(prompt, name, args):
+    COMMAND, ARGS = private("__resolve_command")(prompt)
+    assert (COMMAND.name, ARGS) == (name, args)
+
+
+@pytest.mark.parametrize("prompt", ["ls -la", "echoes", "pythonx run"])
+def test_unknown_commands_go_to_the_shell(prompt):
+    assert private("__resolve_command")(prompt)[0] is None
+
+
+def test_at_variables_expand_and_double_at_escapes(capsys):
+    run("varmake who set 'bob'", "echo 'hi @who'", "echo 'mail me@@who'", "echo '@nobody_here'")
+    OUT = capsys.readouterr().out.splitlines()
+    assert "hi bob" in OUT
+    assert "mail me@who" in OUT
+    assert OUT[-1] == "nobody_here"
+
+
+def test_at_variables_follow_changes_inside_tuples(capsys):
+    run("varmake parts set [1]", "varmake shown set (parts,)", "echo '@shown'")
+    run("python run parts.append(2)", "echo '@shown'")
+    assert capsys.readouterr().out.splitlines()[-1] == "([1, 2],)"
+
+
+def write_lines(sandbox):
+    (sandbox / "f.txt").write_text("one\ntwo x\nthree x x\nfour\n")
+
+
+def test_inspect_file_text_counts_and_lists_lines(sandbox, capsys):
+    write_lines(sandbox)
+    (sandbox / "empty.txt").write_text("")
+    run("inspect file text 'x' f.txt", "inspect file text 'x' f.txt !lines", "inspect file text 'x' empty.txt")
+    OUT = capsys.readouterr().out.splitlines()
+    assert "counted 3 times" in OUT[0]
+    assert [line.split(": ", 1)[1] for line in OUT[1:3]] == ["two x", "three x x"]
+    assert "aren't any lines" in OUT[-1]
+
+
+@pytest.mark.parametrize("flags, expected", [
+    ("!head 2", ["one", "two x"]),
+    ("!tail 1", ["four"]),
+    ("!range 2:3", ["two x", "three x x"]),
+    ("", ["one", "two x", "three x x", "four"]),
+])
+def test_inspect_file_modes(sandbox, capsys, flags, expected):
+    write_lines(sandbox)
+    run(f"inspect file f.txt {flags}".strip())
+    assert [line for line in capsys.readouterr().out.splitlines() if line] == expected
+
+
+def test_inspect_grep_searches_trees_with_several_patterns(sandbox, capsys):
+    (sandbox / "sub").mkdir()
+    (sandbox / "a.py").write_text("foo\nbar\nfoo foo\n")
+    (sandbox / "sub" / "b.txt").write_text("foo\n")
+    run("inspect grep 'fo+' current all .py")
+    assert plain(capsys.readouterr().out).splitlines()[:2] == ["a.py:1: foo", "a.py:3: foo foo"]
+    run("inspect grep 'ba[rz]' 'fo+' current !count")
+    OUT = plain(capsys.readouterr().out).splitlines()
+    assert sorted(OUT[:2]) == ["a.py: 3", f"{os.path.join('sub', 'b.txt')}: 1"]
+    assert "4 matching lines in 2 of 2" in OUT[2]
+    run("inspect grep '(' current")
+    assert "not a valid regular expression" in plain(capsys.readouterr().out)
+
+
+def test_path_guard_checks_names_and_system_folders(sandbox):
+    SYSTEM = sandbox / "system"
+    GUARD = xcon.PathGuard([str(SYSTEM)], ["Music"])
+    assert GUARD.is_protected(sandbox / "project" / "music")
+    assert GUARD.is_protected(SYSTEM)
+    assert GUARD.is_protected(SYSTEM / "deep" / "file.txt")
+    assert not GUARD.is_protected(sandbox / "project" / "src")
+    PATHS = [str(sandbox / "a" / "music"), str(SYSTEM / "x"), str(sandbox / "b")]
+    assert GUARD.check_many(PATHS) == PATHS[:2]
+    assert GUARD.check_many(PATHS, names=False) == [PATHS[1]]
+
+
+def test_fdel_asks_once_for_several_files(sandbox, monkeypatch):
+    for NAME in ("a.txt", "b.txt", "c.log"):
+        (sandbox / NAME).write_text("x")
+    ANSWERS = iter(["n", "y"])
+    PROMPTS = []
+    monkeypatch.setattr("builtins.input", lambda prompt="": PROMPTS.append(prompt) or next(ANSWERS))
+    run("fdel *.txt c.log !nodef")
+    assert len(PROMPTS) == 1 and "3 files" in PROMPTS[0]
+    assert sorted(os.listdir(sandbox)) == ["a.txt", "b.txt", "c.log"]
+    run("fdel *.txt c.log !nodef")
+    assert os.listdir(sandbox) == []
+
+
+def test_fmake_writes_content_and_source_files(sandbox, capsys):
+    (sandbox / "src.bin").write_bytes(b"ab\x00")
+    run("fmake lines ^ one | two || three")
+    assert (sandbox / "lines.txt").read_text() == "one\ntwo | three\n"
+    run("fmake copy ^< src.bin !repeat 3", "fmake copy ^< src.bin !append")
+    assert (sandbox / "copy.txt").read_bytes() == b"ab\x00" * 4
+    run("fmake copy ^< copy.txt")
+    assert "cannot be written from itself" in capsys.readouterr().out
+    assert (sandbox / "copy.txt").read_bytes() == b"ab\x00" * 4
+
+
+def new_session():
+    # Acts like a console restart: the log is closed and the variables are read back from the data directory.
+    if xcon.VARS_LOG_HANDLE is not None:
+        xcon.VARS_LOG_HANDLE.close()
+        xcon.VARS_LOG_HANDLE = None
+    private("__load_vars")()
+
+
+@pytest.fixture
+def store(tmp_path, monkeypatch):
+    DATA = tmp_path / "data"
+    monkeypatch.setattr(xcon, "XCON_DATA_DIR", str(DATA))
+    for NAME, FILE in (("VARS_FILE", "vardecl.json"), ("VARS_INDEX_FILE", "vardecl.idx"), ("VARS_LOG", "vardecl.log")):
+        monkeypatch.setattr(xcon, NAME, str(DATA / FILE))
+    new_session()
+    yield DATA
+    new_session() # Closes the log inside DATA before the paths are put back.
+
+
+def test_variable_changes_go_to_the_log_until_compacted(store, monkeypatch):
+    run("varmake kept set [1, 2]", "varmake gone set 2", "vardel gone")
+    assert not (store / "vardecl.json").exists()
+    assert len((store / "vardecl.log").read_text().splitlines()) == 3
+    new_session()
+    assert xcon.DECLARELIST == {"kept": [1, 2]}
+    run("save vars")
+    assert not (store / "vardecl.log").exists()
+    assert json.loads((store / "vardecl.json").read_text()) == {"kept": [1, 2]}
+    monkeypatch.setattr(xcon, "VARS_LOG_LIMIT", 2)
+    run("varmake a set 1", "varmake b set 2")
+    assert not (store / "vardecl.log").exists()
+    assert json.loads((store / "vardecl.json").read_text()) == {"kept": [1, 2], "a": 1, "b": 2}
+
+
+def test_saved_variables_load_on_first_use(store, capsys):
+    run("varmake lazy set 'later'", "varmake unused set {'a': [1]}", "save vars")
+    new_session()
+    assert xcon.DECLARELIST == {}
+    assert sorted(xcon.VARS_INDEX) == ["lazy", "unused"]
+    capsys.readouterr()
+    run("echo lazy")
+    assert capsys.readouterr().out.splitlines()[-1] == "later"
+    assert list(xcon.VARS_INDEX) == ["unused"]
+    run("varmake lazy set 'changed'", "save vars")
+    new_session()
+    assert sorted(xcon.VARS_INDEX) == ["lazy", "unused"]
+    private("__load_all_vars")()
+    assert xcon.DECLARELIST == {"lazy": "changed", "unused": {"a": [1]}}
+
+
+def test_stale_variable_index_reads_the_whole_file(store):
+    run("varmake a set 1", "save vars")
+    (store / "vardecl.json").write_text('{"a": 2, "b": 3}')
+    new_session()
+    assert xcon.VARS_INDEX == {}
+    assert xcon.DECLARELIST == {"a": 2, "b": 3}
+
+
+def test_python_script_reuses_marshalled_code(sandbox, monkeypatch, capsys):
+    monkeypatch.setattr(xcon, "CODE_CACHE_DIR", str(sandbox / "pycache"))
+    monkeypatch.setattr(xcon, "CODE_CACHE", {})
+    COMPILED = []
+    monkeypatch.setattr(xcon, "compile", lambda *args: COMPILED.append(args[1]) or compile(*args), raising=False)
+    SCRIPT = sandbox / "s.py"
+    SCRIPT.write_text("print('first')\n")
+    run("python script s.py")
+    xcon.CODE_CACHE.clear() # A new session, only the file in pycache is left.
+    run("python script s.py")
+    assert len(COMPILED) == 1
+    assert len(os.listdir(sandbox / "pycache")) == 1
+    SCRIPT.write_text("print('second!')\n")
+    run("python script s.py")
+    assert len(COMPILED) == 2
+    assert [line for line in capsys.readouterr().out.splitlines() if "first" in line or "second" in line][-3:] == ["first", "first", "second!"]
+
+
+def test_inspect_folder_lists_and_sums_subfolders(sandbox, capsys):
+    (sandbox / "d" / "e").mkdir(parents=True)
+    (sandbox / "d" / "a.py").write_text("12345\n")
+    (sandbox / "d" / "e" / "b.txt").write_text("1\n")
+    run("inspect folder d all .py")
+    assert plain(capsys.readouterr().out).splitlines() == ["Folder d contains:", "", "Folders: e", "Files: a.py"]
+    run("inspect folder d !r")
+    OUT = plain(capsys.readouterr().out)
+    assert OUT.startswith("Folder d contains (recursively):")
+    assert "e: 1 file, 2 B" in OUT and "Total: 2 files, 8 B" in OUT
+
+
+def test_fcopy_copies_several_sources_into_a_new_folder(sandbox):
+    for NAME in ("a.txt", "b.txt", "c.log"):
+        (sandbox / NAME).write_text(NAME)
+    (sandbox / "out").mkdir()
+    run("fcopy *.txt c.log out !nodef")
+    assert sorted(os.listdir(sandbox / "out_1")) == ["a.txt", "b.txt", "c.log"]
+    assert (sandbox / "out_1" / "c.log").read_text() == "c.log"
+
+
+def test_python_contexts_snapshot_restore_and_switch(capsys):
+    run("python run cx = 1", "python ctx snapshot s1", "python run cx = 2", "python ctx restore s1", "echo cx")
+    assert capsys.readouterr().out.splitlines()[-1] == "1"
+    run("python ctx new scratch", "python run cx = 3", "echo cx", "python ctx use main", "echo cx", "python ctx del scratch")
+    OUT = capsys.readouterr().out.splitlines()
+    assert [line for line in OUT if line.isdigit()] == ["3", "1"]
+    assert "scratch" not in xcon.PYTHON_CONTEXTS
+
+
+def test_restored_snapshot_keeps_variables_in_sync(capsys):
+    run("python ctx snapshot s2", "varmake synced set 5", "python ctx restore s2", "echo synced")
+    assert capsys.readouterr().out.splitlines()[-1] == "5"
+    run("python ctx snapshot s3", "vardel synced", "python ctx restore s3")
+    assert "synced" not in xcon.PYTHON_CONTEXT
+
+
+def test_script_reads_stdin_with_continued_lines_and_comments(monkeypatch, capsys):
+    monkeypatch.setattr(sys, "stdin", io.StringIO("echo 20 + >\n  22 $ the answer\n\n$ only a comment\necho 'done'\n"))
+    run("xcon script -")
+    OUT = plain(capsys.readouterr().out).splitlines()
+    assert OUT[:4] == ["[.xcon script] echo 20 + 22", "42", "[.xcon script] echo 'done'", "done"]
+    assert "Execution of script 'stdin' done." in OUT[-1]
+
+
+def test_lazy_import_runs_the_module_on_first_use(monkeypatch):
+    monkeypatch.delitem(sys.modules, "colorsys", raising=False)
+    monkeypatch.delitem(xcon.MODULE_TIMINGS, "colorsys", raising=False)
+    MODULE = private("__lazy_import")("colorsys")
+    assert xcon.MODULE_TIMINGS["colorsys"] is None
+    assert MODULE.rgb_to_hsv(1.0, 0.0, 0.0) == (0.0, 1.0, 1.0)
+    assert xcon.MODULE_TIMINGS["colorsys"] >= 0.0
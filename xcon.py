@@ -1,13 +1,17 @@
 import os
-import subprocess
-import shutil # To remove directories with files in case there are files or subfolders inside of the parent folder.
 import sys
 import time
-import ast # For safer eval() inputs.
-import ctypes
 import json
 import types
 import re
+import stat
+import threading
+import itertools
+import collections
+import importlib.util
+import functools
+# Everything else (ast, subprocess, shutil, asyncio, ctypes, importlib.metadata, concurrent.futures, ...) is imported
+# inside the functions that use it, so the console does not pay for it before the first prompt.
 MODULES = {}
 
 HEADER = '\033[95m'
@@ -28,27 +32,203 @@ PROTECTED_NAMES = ["downloads", "documents", "pictures", "videos", "music", "con
 CURRENT_DIR = os.path.abspath(os.getcwd())
 SYSTEM_DIRS = [os.path.normcase(os.path.normpath(os.path.abspath(p))) for p in ["C:\\Windows", "C:\\Program Files", "C:\\Program Files (x86)",os.path.expanduser("~"), os.getenv("USERPROFILE")] if p]
 
-APPDATA = os.getenv('APPDATA')
-XCON_DATA_DIR = os.path.join(APPDATA, "XCon")
-os.makedirs(XCON_DATA_DIR, exist_ok=True)
+def __data_dir() -> str:
+    # %APPDATA% on Windows, ~/Library/Application Support on macOS and $XDG_DATA_HOME (~/.local/share) elsewhere.
+    if os.name == "nt":
+        BASE = os.getenv("APPDATA") or os.path.join(os.path.expanduser("~"), "AppData", "Roaming")
+    elif sys.platform == "darwin":
+        BASE = os.path.join(os.path.expanduser("~"), "Library", "Application Support")
+    else:
+        BASE = os.getenv("XDG_DATA_HOME") or os.path.join(os.path.expanduser("~"), ".local", "share")
+    return os.path.join(BASE, "XCon")
+
+XCON_DATA_DIR = __data_dir() # Created by __ensure_data_dir before the first file is written to it.
 VARS_FILE = os.path.join(XCON_DATA_DIR, "vardecl.json")
+VARS_INDEX_FILE = os.path.join(XCON_DATA_DIR, "vardecl.idx") # Offsets of the values inside vardecl.json.
+VARS_LOG = os.path.join(XCON_DATA_DIR, "vardecl.log") # Changes made since vardecl.json was last written.
+VARS_LOG_LIMIT = 1000 # Log entries after which the log gets compacted into vardecl.json.
+VARS_LOG_ENTRIES = 0
+VARS_LOG_HANDLE = None
+VARS_LOCK = threading.Lock()
+SCRIPT_CACHE_FILE = os.path.join(XCON_DATA_DIR, "scriptcache.json")
+MODULES_FILE = os.path.join(XCON_DATA_DIR, "modules.json") # Modules accessed again at startup.
+CODE_CACHE_DIR = os.path.join(XCON_DATA_DIR, "pycache") # Marshalled code objects of the files run with python script.
 
 LAST = None
 DECLARELIST: dict = {}
 DECLARELIST = {k: v for k, v in DECLARELIST.items() if not isinstance(v, types.ModuleType)}
+NAME_PATTERN = re.compile(r"[A-Za-z_]\w*")
+VARS_INDEX: dict = {} # Saved variables not used yet this session: name -> [offset, length] of the value in vardecl.json.
 PACKAGELIST: list = []
 COMMAND_HISTORY = []
 
+def __load_var(varname) -> bool:
+    # Reads a single saved value from vardecl.json the first time it is used.
+    SPAN = VARS_INDEX.pop(varname, None)
+    if SPAN is None:
+        return False
+    with open(VARS_FILE, "rb") as f:
+        f.seek(SPAN[0])
+        DECLARELIST[varname] = json.loads(f.read(SPAN[1]))
+    __context_set(varname, DECLARELIST[varname])
+    return True
+
+def __load_all_vars():
+    for varname in list(VARS_INDEX):
+        __load_var(varname)
+
+def __load_used_vars(expr: str):
+    if VARS_INDEX:
+        for varname in NAME_PATTERN.findall(expr):
+            if varname in VARS_INDEX:
+                __load_var(varname)
+
+def __ensure_data_dir():
+    os.makedirs(XCON_DATA_DIR, exist_ok=True)
+
+def __compact_vars():
+    # Rewrites vardecl.json from DECLARELIST through a temporary file and an atomic rename, then empties the log.
+    # A crash before the rename keeps the old file and log, a crash after it only replays the log over the new file.
+    # Values that were never used are copied over as raw JSON and stay unloaded.
+    global VARS_LOG_HANDLE, VARS_LOG_ENTRIES, VARS_INDEX
+    with VARS_LOCK:
+        RAW = {}
+        if VARS_INDEX:
+            with open(VARS_FILE, "rb") as f:
+                for varname, (OFFSET, LENGTH) in VARS_INDEX.items():
+                    f.seek(OFFSET)
+                    RAW[varname] = f.read(LENGTH)
+        ENTRIES = []
+        INDEX = {}
+        OFFSET = 2 # len(b"{\n")
+        for varname, varval in [*DECLARELIST.items(), *RAW.items()]:
+            try:
+                VALUE = varval if varname in RAW else json.dumps(varval).encode()
+            except (TypeError, ValueError):
+                print(f"{WARNING}Variable {OKCYAN}{varname} {WARNING}of type {type(varval).__name__} cannot be saved and has been skipped.{ENDC}")
+                continue
+            KEY = f"{json.dumps(varname)}: ".encode()
+            INDEX[varname] = [OFFSET + len(KEY), len(VALUE)]
+            ENTRIES.append(KEY + VALUE)
+            OFFSET += len(KEY) + len(VALUE) + 2 # len(b",\n")
+        if ENTRIES:
+            __ensure_data_dir()
+            TEMP = VARS_FILE + ".tmp"
+            with open(TEMP, "wb") as f:
+                f.write(b"{\n" + b",\n".join(ENTRIES) + b"\n}\n") # One variable per line.
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(TEMP, VARS_FILE)
+            STAT = os.stat(VARS_FILE)
+            with open(VARS_INDEX_FILE + ".tmp", "w", encoding="utf-8") as f:
+                json.dump({"size": STAT.st_size, "mtime": STAT.st_mtime_ns, "vars": INDEX}, f)
+            os.replace(VARS_INDEX_FILE + ".tmp", VARS_INDEX_FILE)
+        else:
+            for PATH in (VARS_FILE, VARS_INDEX_FILE):
+                if os.path.exists(PATH):
+                    os.remove(PATH)
+        VARS_INDEX = {varname: INDEX[varname] for varname in RAW}
+        if VARS_LOG_HANDLE is not None:
+            VARS_LOG_HANDLE.close()
+            VARS_LOG_HANDLE = None
+        if os.path.exists(VARS_LOG):
+            os.remove(VARS_LOG)
+        VARS_LOG_ENTRIES = 0
+
+def __log_var(*ENTRY):
+    # Appends one change to vardecl.log, so varmake and vardel cost the same no matter how many variables exist.
+    global VARS_LOG_HANDLE, VARS_LOG_ENTRIES
+    with VARS_LOCK:
+        if VARS_LOG_HANDLE is None:
+            __ensure_data_dir()
+            VARS_LOG_HANDLE = open(VARS_LOG, "a", encoding="utf-8")
+        VARS_LOG_HANDLE.write("\t".join(ENTRY) + "\n")
+        VARS_LOG_HANDLE.flush()
+        VARS_LOG_ENTRIES += 1
+    if VARS_LOG_ENTRIES >= VARS_LOG_LIMIT:
+        __compact_vars()
+
+def __var_set(varname, varval):
+    globals()[varname] = varval
+    DECLARELIST[varname] = varval
+    VARS_INDEX.pop(varname, None)
+    __context_set(varname, varval)
+    try:
+        ENCODED = json.dumps(varval)
+    except (TypeError, ValueError):
+        print(f"{WARNING}Variable {OKCYAN}{varname} {WARNING}of type {type(varval).__name__} will not be saved for the next session.{ENDC}")
+        __log_var("del", json.dumps(varname))
+        return
+    __log_var("set", json.dumps(varname), ENCODED)
+
+def __var_del(varname):
+    globals().pop(varname, None)
+    DECLARELIST.pop(varname, None)
+    VARS_INDEX.pop(varname, None)
+    __context_del(varname)
+    __log_var("del", json.dumps(varname))
+
+def __var_clear():
+    for varname in [*DECLARELIST, *VARS_INDEX]:
+        globals().pop(varname, None)
+        __context_del(varname)
+    DECLARELIST.clear()
+    VARS_INDEX.clear()
+    __log_var("clear")
+
+def __read_index():
+    # The index is only trusted if it was written for the vardecl.json that is on disk now.
+    if not os.path.exists(VARS_INDEX_FILE):
+        return None
+    try:
+        with open(VARS_INDEX_FILE, "r", encoding="utf-8") as f:
+            INDEX = json.load(f)
+        STAT = os.stat(VARS_FILE)
+    except (OSError, ValueError):
+        return None
+    if INDEX.get("size") != STAT.st_size or INDEX.get("mtime") != STAT.st_mtime_ns:
+        return None
+    return INDEX["vars"]
+
+def __read_vars():
+    # Returns the values to load right away (from the log or an unindexed vardecl.json) and the index of the rest.
+    VARS = {}
+    INDEX = {}
+    if os.path.exists(VARS_FILE) and os.path.getsize(VARS_FILE) > 0:
+        INDEX = __read_index()
+        if INDEX is None:
+            INDEX = {}
+            with open(VARS_FILE, "r", encoding="utf-8") as f:
+                VARS = json.load(f)
+    ENTRIES = 0
+    if os.path.exists(VARS_LOG):
+        with open(VARS_LOG, "r", encoding="utf-8") as f:
+            for line in f:
+                ENTRIES += 1
+                OP, *FIELDS = line.rstrip("\n").split("\t")
+                try:
+                    if OP == "set":
+                        varname = json.loads(FIELDS[0])
+                        VARS[varname] = json.loads(FIELDS[1])
+                        INDEX.pop(varname, None)
+                    elif OP == "del":
+                        varname = json.loads(FIELDS[0])
+                        VARS.pop(varname, None)
+                        INDEX.pop(varname, None)
+                    elif OP == "clear":
+                        VARS.clear()
+                        INDEX.clear()
+                except (IndexError, ValueError):
+                    continue # Torn line from a crash while writing.
+    return VARS, INDEX, ENTRIES
+
 def __save_vars():
     print(f"{WARNING}Attempting to save variables inside of {OKCYAN}vardecl.json{WARNING}...{ENDC}")
     try:
-        if DECLARELIST == {}:
-            if os.path.exists(VARS_FILE):
-                os.remove(VARS_FILE)
+        __compact_vars()
+        if not DECLARELIST and not VARS_INDEX:
             print(f"{WARNING}No variables found to save.{ENDC}")
             return
-        with open(VARS_FILE, "w") as f:
-            json.dump(DECLARELIST, f, indent=2)
         print(f"{OKGREEN}Successfully saved variables inside of {OKCYAN}vardecl.json{OKGREEN}.{ENDC}")
         return
     except Exception as e:
@@ -56,17 +236,24 @@ def __save_vars():
         return
 
 def __load_vars():
-    global DECLARELIST
+    global VARS_LOG_ENTRIES, EVAL_CONTEXT
     try:
-        if not os.path.exists(VARS_FILE) or os.path.getsize(VARS_FILE) == 0:
-            DECLARELIST = {}
+        VARS, INDEX, VARS_LOG_ENTRIES = __read_vars()
+        for varname in [*DECLARELIST, *VARS_INDEX]:
+            __context_del(varname)
+        EVAL_CONTEXT = None # Rebuilt from the reloaded variables on the next evaluation.
+        DECLARELIST.clear()
+        DECLARELIST.update(VARS)
+        for varname, varval in DECLARELIST.items():
+            __context_set(varname, varval)
+        VARS_INDEX.clear()
+        VARS_INDEX.update(INDEX)
+        COUNT = len(DECLARELIST) + len(VARS_INDEX)
+        if not COUNT:
             print(f"{WARNING}No variables found to load.{ENDC}")
             return
-        with open(VARS_FILE, "r") as f:
-            DECLARELIST = json.load(f)
-            VARS = ', '.join(f"{OKCYAN}{varname} {OKGREEN}({varval!r})" for varname, varval in DECLARELIST.items())
-            print(f"{OKGREEN}{'Variables' if len(DECLARELIST) > 1 else 'Variable'} {VARS} successfully loaded from {OKCYAN}vardecl.json {OKGREEN}at {OKCYAN}{XCON_DATA_DIR}{OKGREEN}.{ENDC}")
-            return
+        print(f"{OKGREEN}{COUNT} {'variables' if COUNT > 1 else 'variable'} successfully loaded from {OKCYAN}vardecl.json {OKGREEN}at {OKCYAN}{XCON_DATA_DIR}{OKGREEN}.{ENDC}")
+        return
     except Exception as e:
         print(f"{FAIL}Failed to load variables from previous session. Reason:\n\n{ENDC}{e}")
         return
@@ -87,7 +274,50 @@ def __set_volume(LEVEL):
         print(f"{FAIL}Failed to set volume. Reason:\n\n{ENDC}{e}")
         return
     
-PYTHON_CONTEXT = {**globals(), **DECLARELIST, **MODULES}
+class PythonContext:
+    """A namespace for python run and python block, kept in sync with declared variables and accessed modules."""
+    __slots__ = ("name", "namespace", "snapshots")
+
+    def __init__(self, name, base):
+        self.name = name
+        self.namespace = dict(base)
+        self.snapshots = {}
+
+    @staticmethod
+    def copy_namespace(namespace) -> dict:
+        # Deep copies the values so later runs cannot change a snapshot. Modules and anything that cannot be copied are shared.
+        import copy
+        MEMO = {id(value): value for value in namespace.values() if isinstance(value, types.ModuleType)}
+        COPY = {}
+        for name, value in namespace.items():
+            try:
+                COPY[name] = copy.deepcopy(value, MEMO)
+            except Exception:
+                COPY[name] = value
+        return COPY
+
+    def snapshot(self, label, synced):
+        self.snapshots[label] = (self.copy_namespace(self.namespace), set(synced))
+
+    def restore(self, label, synced) -> bool:
+        # The snapshot comes back as a fresh copy, so it can be restored again. Synced names are re-applied on top,
+        # and the ones that were synced at snapshot time but have been removed since are dropped.
+        if label not in self.snapshots:
+            return False
+        NAMESPACE, SYNCED = self.snapshots[label]
+        self.namespace.clear()
+        self.namespace.update(self.copy_namespace(NAMESPACE))
+        for name in SYNCED.difference(synced):
+            self.namespace.pop(name, None)
+        self.namespace.update(synced)
+        return True
+
+def __context_base() -> dict:
+    return {**globals(), **DECLARELIST, **MODULES}
+
+PYTHON_CONTEXTS = {"main": PythonContext("main", __context_base())}
+PYTHON_CONTEXT = PYTHON_CONTEXTS["main"].namespace # Namespace of the context python run and python block use.
+PYTHON_CONTEXT_NAME = "main"
         
 def __run_python_block(PROMPT, _BLOCK, *args, **kwargs):
     if PROMPT.startswith("python block !x "):
@@ -112,8 +342,9 @@ def __run_python_block(PROMPT, _BLOCK, *args, **kwargs):
                 CURRENT_INDENT = max(INDENT, CURRENT_INDENT - INDENT)
         try:
             CODE = "\n".join(COMMAND)
+            __load_used_vars(CODE)
             print(f"\n{OKBLUE}Executing block:\n{COMMENT}{CODE}{ENDC}")
-            exec(CODE, PYTHON_CONTEXT)
+            __exec_python(CODE)
             if _BLOCK.startswith("def "):
                 FUNCTION = _BLOCK.removeprefix("def ").removesuffix(":")
                 print(f"{OKGREEN}Function {FUNCTION} has successfully been defined.{ENDC}") 
@@ -124,6 +355,7 @@ def __run_python_block(PROMPT, _BLOCK, *args, **kwargs):
             return
 
 def __empty_bin():
+    import ctypes
     if os.name != "nt":
         print(f"{WARNING}Emptying the recycle bin is only supported on Windows machines in the console.{ENDC}")
         return
@@ -143,71 +375,242 @@ def __empty_bin():
         return
     return True
 
+class PathGuard:
+    """Checks paths against the system folders and protected folder names, normalized once when XCon starts."""
+
+    def __init__(self, system_dirs, protected_names):
+        self.dirs = frozenset(self.normalize(p) for p in system_dirs)
+        self.names = frozenset(name.lower() for name in protected_names)
+
+    @staticmethod
+    def normalize(path) -> str:
+        return os.path.normcase(os.path.abspath(path))
+
+    def in_system_dir(self, norm, safe=None) -> bool:
+        # Walks up the ancestors of a normalized path. Ancestors found safe are added to safe,
+        # so vetting a whole tree only looks at every folder once.
+        current = norm
+        checked = []
+        while True:
+            if current in self.dirs:
+                return True
+            if safe is not None and current in safe:
+                break
+            checked.append(current)
+            parent = os.path.dirname(current)
+            if parent == current:
+                break
+            current = parent
+        if safe is not None:
+            safe.update(checked)
+        return False
+
+    def is_protected(self, path) -> bool:
+        norm = self.normalize(path)
+        return os.path.basename(norm).lower() in self.names or self.in_system_dir(norm)
+
+    def is_sensitive(self, path) -> bool:
+        return self.is_protected(path)
+
+    def check_many(self, paths, names=True) -> list:
+        """Returns the paths that are protected, normalizing each path only once. With names=False only system folders count."""
+        flagged = []
+        safe = set()
+        for path in paths:
+            norm = self.normalize(path)
+            if (names and os.path.basename(norm).lower() in self.names) or self.in_system_dir(norm, safe):
+                flagged.append(path)
+        return flagged
+
+PATH_GUARD = PathGuard(SYSTEM_DIRS, PROTECTED_NAMES)
+
 def __is_protected(path, msg=True) -> bool:
-    NORM = os.path.normcase(os.path.normpath(os.path.abspath(path)))
     path = os.path.abspath(path)
     display_path = os.path.basename(path)
     if msg:
         print(f"{WARNING}Note: {OKCYAN}{display_path} {FAIL}cannot {WARNING}contain a protected system folder inside of it.")
         print(f"{WARNING}[XCON_SECURITY] Checking path: {OKCYAN}{path}{ENDC}")
-    if os.path.basename(NORM).lower() in PROTECTED_NAMES:
-        return True
-    for dir in SYSTEM_DIRS:
-        if NORM == dir or NORM.startswith(dir + os.sep):
-            return True
-    return False
+    return PATH_GUARD.is_protected(path)
 
 def __is_sensitive(path, msg=True) -> bool:
-    NORM = os.path.normcase(os.path.normpath(os.path.abspath(path)))
     path = os.path.abspath(path)
     display_path = os.path.basename(path)
     if msg:
         print(f"{WARNING}Note: {OKCYAN}{display_path} {FAIL}cannot {WARNING}have a protected path affix in it.")
         print(f"{WARNING}[XCON_SECURITY] Checking directory: {OKCYAN}{path}{ENDC}")
-    for protected in SYSTEM_DIRS:
-        if NORM == protected or NORM.startswith(protected + os.sep):
-            return True
-    if __is_protected(NORM, False):
-        return True
-    return False
+    return PATH_GUARD.is_sensitive(path)
+
+SAFE_TYPES = (int, float, str, bool, list, dict, tuple, set, types.ModuleType)
+SAFE_GLOBALS = {
+    "__builtins__": {
+        "True": True,
+        "False": False,
+        "None": None,
+        "len": len,
+        "str": str,
+        "int": int,
+        "float": float,
+        "bool": bool,
+        "list": list,
+        "dict": dict,
+        "set": set,
+        "tuple": tuple,
+        "abs": abs,
+        "min": min,
+        "max": max,
+        "sum": sum,
+        "any": any,
+        "all": all,
+        "round": round,
+    }
+}
+EVAL_CACHE_SIZE = 256 # Compiled check/echo/varmake expressions kept around.
+EVAL_CONTEXT = None # Sanitized PYTHON_CONTEXT, built on first use and kept current by __context_set/__context_del and __exec_python.
 
 def __sanitize_context(context):
-    SAFE_TYPES = (int, float, str, bool, list, dict, tuple, set, types.ModuleType)
     sanitized = {}
     for k, v in context.items():
         if isinstance(v, SAFE_TYPES):
             sanitized[k] = v
     return sanitized
 
+def __eval_context() -> dict:
+    global EVAL_CONTEXT
+    if EVAL_CONTEXT is None:
+        EVAL_CONTEXT = __sanitize_context(PYTHON_CONTEXT)
+    return EVAL_CONTEXT
+
+def __context_set(name, value):
+    for CONTEXT in PYTHON_CONTEXTS.values():
+        CONTEXT.namespace[name] = value
+    if EVAL_CONTEXT is None:
+        return
+    if isinstance(value, SAFE_TYPES):
+        EVAL_CONTEXT[name] = value
+    else:
+        EVAL_CONTEXT.pop(name, None)
+
+def __context_del(name):
+    for CONTEXT in PYTHON_CONTEXTS.values():
+        CONTEXT.namespace.pop(name, None)
+    if EVAL_CONTEXT is not None:
+        EVAL_CONTEXT.pop(name, None)
+
+def __exec_python(SOURCE: str):
+    # Runs python run/python block code in the active context. Only the names the code refers to can have been
+    # rebound, so those are copied into EVAL_CONTEXT afterwards, also when the code fails halfway.
+    CODE = compile(SOURCE, "<xcon>", "exec")
+    try:
+        exec(CODE, PYTHON_CONTEXT)
+    finally:
+        if EVAL_CONTEXT is not None:
+            for name in __code_names(CODE):
+                if isinstance(PYTHON_CONTEXT.get(name), SAFE_TYPES):
+                    EVAL_CONTEXT[name] = PYTHON_CONTEXT[name]
+                else:
+                    EVAL_CONTEXT.pop(name, None)
+
+@functools.lru_cache(maxsize=EVAL_CACHE_SIZE)
+def __compile_expr(expr: str):
+    return compile(expr, "<xcon>", "eval")
+
+EXPR_DISALLOWED = ("Attribute", "Lambda", "NamedExpr") # Node types rejected in check and echo expressions.
+EXPR_IMMUTABLE = (int, float, str, bool, bytes, complex, type(None)) # Tuples and frozensets count when their items do.
+EXPR_FOLD_LIMIT = 4096 # Largest operand folded for **, << and sequence repetition.
+EXPR_RESULTS: dict = {} # Expression -> (values of its dependencies, result), while those values stay the same objects.
+EXPR_RESULTS_SIZE = 256
+EXPR_MISSING = object()
+
+@functools.lru_cache(maxsize=None)
+def __constant_folder():
+    # Built on the first check/echo expression, so ast is not imported when the console starts.
+    import ast
+
+    class ConstantFolder(ast.NodeTransformer):
+        """Replaces operations on literals with their result, so they are not recomputed on every evaluation."""
+
+        FOLDABLE = (ast.BinOp, ast.UnaryOp, ast.BoolOp, ast.Compare)
+
+        def generic_visit(self, node):
+            node = super().generic_visit(node)
+            if not isinstance(node, self.FOLDABLE) or not self.foldable(node):
+                return node
+            try:
+                VALUE = eval(compile(ast.fix_missing_locations(ast.Expression(node)), "<xcon>", "eval"), SAFE_GLOBALS, {})
+            except Exception:
+                return node # Left for eval, which reports the error when the expression runs.
+            return ast.copy_location(ast.Constant(VALUE), node)
+
+        @staticmethod
+        def foldable(node) -> bool:
+            CHILDREN = list(ast.iter_child_nodes(node))
+            OPERANDS = [child for child in CHILDREN if not isinstance(child, (ast.operator, ast.unaryop, ast.boolop, ast.cmpop))]
+            if not all(isinstance(child, ast.Constant) for child in OPERANDS):
+                return False
+            if isinstance(node, ast.BinOp) and isinstance(node.op, (ast.Pow, ast.LShift, ast.Mult)):
+                return all(not isinstance(child.value, int) or abs(child.value) <= EXPR_FOLD_LIMIT for child in OPERANDS)
+            return True
+
+    return ConstantFolder
+
+@functools.lru_cache(maxsize=EVAL_CACHE_SIZE)
+def __analyze_expr(expr: str):
+    # Parses a check/echo expression once: rejects disallowed syntax, folds literals and collects the names it reads.
+    import ast
+    TREE = ast.parse(expr.strip(), mode="eval")
+    LOADED = set()
+    for node in ast.walk(TREE):
+        if type(node).__name__ in EXPR_DISALLOWED:
+            raise ValueError(f"{type(node).__name__} is not allowed in expressions.")
+        if isinstance(node, ast.Name):
+            if node.id.startswith("__"):
+                raise ValueError(f"Name {node.id} is not allowed in expressions.")
+            if isinstance(node.ctx, ast.Load):
+                LOADED.add(node.id)
+    TREE = ast.fix_missing_locations(__constant_folder()().visit(TREE))
+    # Comprehension targets are kept in, as the same name can also be read from the context by another
+    # scope of the expression, like the outer x in [x for x in x]. So are builtins, as a variable can shadow them.
+    DEPS = tuple(sorted(LOADED))
+    return compile(TREE, "<xcon>", "eval"), DEPS
+
+def __immutable(value) -> bool:
+    if type(value) in (tuple, frozenset):
+        return all(__immutable(item) for item in value)
+    return isinstance(value, EXPR_IMMUTABLE)
+
+def __expr_deps(expr: str) -> list:
+    # Declared variables (loaded or not) the expression depends on.
+    return [name for name in __analyze_expr(expr)[1] if name in DECLARELIST or name in VARS_INDEX]
+
+def __eval_checked(expr: str):
+    # __safe_eval for check and echo, with the expression validated up front and the result reused while its inputs are unchanged.
+    try:
+        CODE, DEPS = __analyze_expr(expr)
+    except (SyntaxError, ValueError) as e:
+        raise RuntimeError(f"{WARNING}Evaluation failed for expression {OKCYAN}{expr!r}{ENDC}. Reason:\n\n{ENDC}{e}")
+    for name in DEPS:
+        if name in VARS_INDEX:
+            __load_var(name)
+    CONTEXT = __eval_context()
+    VALUES = tuple(CONTEXT.get(name, EXPR_MISSING) for name in DEPS)
+    CACHED = EXPR_RESULTS.get(expr)
+    if CACHED is not None and all(a is b for a, b in zip(CACHED[0], VALUES)):
+        return CACHED[1]
+    try:
+        RESULT = eval(CODE, SAFE_GLOBALS, CONTEXT)
+    except Exception as e:
+        raise RuntimeError(f"{WARNING}Evaluation failed for expression {OKCYAN}{expr!r}{ENDC}. Reason:\n\n{ENDC}{e}")
+    if all(value is EXPR_MISSING or __immutable(value) for value in VALUES):
+        if len(EXPR_RESULTS) >= EXPR_RESULTS_SIZE:
+            EXPR_RESULTS.pop(next(iter(EXPR_RESULTS)))
+        EXPR_RESULTS[expr] = (VALUES, RESULT)
+    return RESULT
+
 def __safe_eval(expr, context=None):
-    if context is None:
-        context = {}
-    context = __sanitize_context(context)  # Filter out functions/modules
-    GLOBALS = {
-        "__builtins__": {
-            "True": True,
-            "False": False,
-            "None": None,
-            "len": len,
-            "str": str,
-            "int": int,
-            "float": float,
-            "bool": bool,
-            "list": list,
-            "dict": dict,
-            "set": set,
-            "tuple": tuple,
-            "abs": abs,
-            "min": min,
-            "max": max,
-            "sum": sum,
-            "any": any,
-            "all": all,
-            "round": round,
-        }
-    }
+    # Without a context, the expression sees the declared variables and the sanitized globals.
+    context = __eval_context() if context is None else __sanitize_context(context)  # Filter out functions
     try:
-        return eval(expr, GLOBALS, context)
+        return eval(__compile_expr(expr), SAFE_GLOBALS, context)
     except Exception as e:
         raise RuntimeError(f"{WARNING}Evaluation failed for expression {OKCYAN}{expr!r}{ENDC}. Reason:\n\n{ENDC}{e}")
         return
@@ -215,19 +618,109 @@ def __safe_eval(expr, context=None):
 PROMPT = ""
 RESERVED = {
     "chgpath", 
-    "inspect folder", "inspect file", 
-    "access module", "module", "install", "uninstall",
+    "inspect folder", "inspect file", "inspect grep", 
+    "access module", "module", "module timings", "forget module", "install", "uninstall",
     "process", "mute volume", "set volume",
     "fmake", "dirmake", "fdel", "fcopy", "dirdel", "dircopy",
     "varmake", "vardel", "see", "save vars", "load vars",  
     "xcon script", "python script", "run python", "python block", "path help", "inspect help", 
     "check",
     "modules help", "internal help", "io help", "script help", "variable help", "condition help", 
-    "utilities help", "$", "info", "version", "close", "wipe", "python"
+    "utilities help", "$", "info", "version", "close", "wipe", "python",
+    "jobs", "wait", "kill", "fg"
 }
 
+
+class Command:
+    """A console command, registered under a verb of one or more words."""
+    __slots__ = ("name", "handler", "args", "bare")
+
+    def __init__(self, name, handler, args=True, bare=False):
+        self.name = name # Unique id of the command, usually the verb itself.
+        self.handler = handler
+        self.args = args # The verb may be followed by arguments.
+        self.bare = bare # The verb may be used on its own.
+
+    def __repr__(self):
+        return f"Command({self.name!r})"
+
+COMMANDS: dict = {} # Command id -> Command.
+COMMAND_TRIE: dict = {} # Word -> child node, with the Command of a node stored under the key None.
+SUFFIX_COMMANDS: dict = {} # Trailing word -> Command, for commands like "<package> info".
+
+def __command(*verbs, args=True, bare=False, suffix=False):
+    def register(handler):
+        for verb in verbs:
+            if suffix:
+                COMMAND = Command(f"* {verb}", handler, args, bare)
+                SUFFIX_COMMANDS[verb] = COMMAND
+            else:
+                COMMAND = Command(verb, handler, args, bare)
+                NODE = COMMAND_TRIE
+                for word in verb.split(" "):
+                    NODE = NODE.setdefault(word, {})
+                NODE[None] = COMMAND
+            COMMANDS[COMMAND.name] = COMMAND
+        return handler
+    return register
+
+def __resolve_command(prompt: str):
+    # Walks the verb trie one word at a time and keeps the longest verb that accepts the rest of the prompt,
+    # so the cost only depends on the length of the verb and not on the amount of registered commands.
+    NODE = COMMAND_TRIE
+    FOUND, ARGS = None, ""
+    LENGTH = len(prompt)
+    POS = 0
+    while True:
+        END = prompt.find(" ", POS)
+        if END == -1:
+            END = LENGTH
+        NODE = NODE.get(prompt[POS:END])
+        if NODE is None:
+            break
+        COMMAND = NODE.get(None)
+        if COMMAND is not None:
+            if END == LENGTH:
+                if COMMAND.bare:
+                    FOUND, ARGS = COMMAND, ""
+            elif COMMAND.args:
+                FOUND, ARGS = COMMAND, prompt[END + 1:]
+        if END == LENGTH:
+            break
+        POS = END + 1
+    if FOUND is None and SUFFIX_COMMANDS:
+        BODY, _, WORD = prompt.rpartition(" ")
+        if BODY and WORD in SUFFIX_COMMANDS:
+            return SUFFIX_COMMANDS[WORD], BODY
+    return FOUND, ARGS
+
+VAR_PATTERN = re.compile(r"@@|@(\w+)")
+VAR_TEXT_CACHE: dict = {} # Variable name -> (value, text) for the latest immutable values expanded with @var.
+VAR_TEXT_CACHE_SIZE = 64
+
+def __expand_var(match, MISSING: list) -> str:
+    var = match.group(1)
+    if var is None:
+        return "@" # "@@" escapes a literal @.
+    if var in DECLARELIST or __load_var(var):
+        VARVAL = DECLARELIST[var]
+    elif var in globals():
+        VARVAL = globals()[var]
+    else:
+        MISSING.append(var)
+        return var
+    CACHED = VAR_TEXT_CACHE.get(var)
+    if CACHED is not None and CACHED[0] is VARVAL:
+        return CACHED[1]
+    TEXT = str(VARVAL)
+    if __immutable(VARVAL):
+        if len(VAR_TEXT_CACHE) >= VAR_TEXT_CACHE_SIZE:
+            VAR_TEXT_CACHE.pop(next(iter(VAR_TEXT_CACHE)))
+        VAR_TEXT_CACHE[var] = (VARVAL, TEXT)
+    return TEXT
+
 def __handle_prompt(prompt: str):
-    global MODULES, CURRENT_DIR, RESERVED, LAST, DECLARELIST, PACKAGELIST
+    global DECLARELIST
     prompt = prompt.strip()
     if "$" in prompt:
         if "$$" in prompt:
@@ -240,868 +733,2275 @@ def __handle_prompt(prompt: str):
     if not prompt:
         return
     if "@" in prompt:
-        VARS = re.findall(r"@(\w+)", prompt)
-        for var in VARS:
-            try:
-                if var in DECLARELIST:
-                    VARVAL = str(DECLARELIST[var])
-                elif var in globals():
-                    VARVAL = str(globals()[var])
-                else:
-                    print(f"{WARNING}The {'variables' if len(VARS) > 1 else 'variable'} {', '.join(VARS)} could not be found associated with a value in the current context.\nDefaulting to string literal.{ENDC}")
-                    VARVAL = var
-                prompt = prompt.replace(f"@{var}", VARVAL)
-            except Exception as e:
-                print(f"{FAIL}The {'variables' if len(VARS) > 1 else 'variable'} {OKCYAN}{', '.join(VARS)} {FAIL}could not be evaluated, as {OKCYAN}{', '.join(VARS)} {FAIL}{'do' if len(VARS) > 1 else 'does'} have a value in the current context, or the {'variables' if len(VARS) > 1 else 'variable'} could not be accessed.{ENDC}")
-                return
-    if prompt.startswith("chgpath "):
-        path = prompt.removeprefix("chgpath ").strip()
-        path = os.path.normpath(path) 
-        if path == "last":
-            if LAST is None:
-                print(f"{WARNING}No previous folder path available yet.{ENDC}")
-                return
-            path, LAST = LAST, os.getcwd()
-            os.chdir(path)
-            return
-        elif path == "up":
-            CURRENT = os.getcwd()
-            PARENT = os.path.dirname(CURRENT)
-            if CURRENT == PARENT:
-                print(f"{OKBLUE}You are already in the root directory ({CURRENT}).{ENDC}")
-            else:
-                LAST = CURRENT
-                os.chdir(PARENT)
-            return
-        elif path == "root":
-            CURRENT = os.getcwd()
-            ROOT = f"{CURRENT[0]}:\\"
-            os.chdir(ROOT)
-            return
-        if not os.path.exists(path):
-            if path == "":
-                print(f"{FAIL}Expected path, got {repr(path)} (Please input a valid path).{ENDC}")
-            else:
-                print(f"{WARNING}Directory {repr(path)} is not available.\n{ENDC}")
-                return
-        elif not os.access(path, os.F_OK):
-            print(f"{WARNING}{path}: Access denied.\n{ENDC}")
+        MISSING = []
+        try:
+            prompt = VAR_PATTERN.sub(lambda match: __expand_var(match, MISSING), prompt)
+        except Exception as e:
+            print(f"{FAIL}The variables in {OKCYAN}{prompt} {FAIL}could not be evaluated, as they do not have a value in the current context, or the variables could not be accessed. Reason:\n\n{ENDC}{e}")
             return
+        if MISSING:
+            print(f"{WARNING}The {'variables' if len(MISSING) > 1 else 'variable'} {', '.join(MISSING)} could not be found associated with a value in the current context.\nDefaulting to string literal.{ENDC}")
+    if prompt.endswith("&") and not prompt.endswith("&&"):
+        __start_job(prompt[:-1].strip())
+        return
+    __dispatch_prompt(prompt)
+
+def __dispatch_prompt(prompt: str):
+    COMMAND, ARGS = __resolve_command(prompt)
+    if COMMAND is None:
+        __run_shell(prompt)
+        return
+    COMMAND.handler(prompt, ARGS)
+
+SCRIPT_CACHE = None # Compiled .xcon scripts, loaded from SCRIPT_CACHE_FILE on first use.
+SCRIPT_CACHE_LIMIT = 4 * 1024 * 1024
+SCRIPT_CACHE_ENTRIES = 64 # Scripts kept in the cache. The ones run least recently are dropped first.
+SCRIPT_CACHE_VERSION = 2 # Raised when the layout of a compiled instruction changes.
+
+def __compile_line(line: str) -> list:
+    # An instruction is [command id, arguments, line, background]. Lines that depend on variables ("see <var>", "@var")
+    # or need a warning ("#") get the id None, so they are resolved by __handle_prompt at run time instead,
+    # which also takes care of a trailing "&" on them.
+    if "@" in line or "#" in line or "see " in line:
+        return [None, None, line, False]
+    BACKGROUND = line.endswith("&") and not line.endswith("&&")
+    if BACKGROUND:
+        line = line[:-1].strip()
+    COMMAND, ARGS = __resolve_command(line)
+    if COMMAND is None:
+        return ["", None, line, BACKGROUND]
+    return [COMMAND.name, ARGS, line, BACKGROUND]
+
+def __logical_lines(RAWL):
+    # Joins lines ending in ">" with the next one and strips "$" comments, one line at a time,
+    # so a script of any length is read in constant memory.
+    buf = ""
+    for raw in RAWL:
+        line = raw.strip()
+        if not line:
+            continue
+        if line.endswith(">"):
+            buf += line[:-1].rstrip() + " "
+            continue
+        line = (buf + line).split("$", 1)[0].strip()
+        buf = ""
+        if line:
+            yield line
+    if buf:
+        line = buf.split("$", 1)[0].strip()
+        if line:
+            yield line
+
+def __command_table() -> str:
+    # Compiled instructions refer to commands by id, so they are only valid for the command table they were compiled with.
+    import hashlib
+    TABLE = sorted(f"{COMMAND.name}:{COMMAND.args:d}{COMMAND.bare:d}" for COMMAND in COMMANDS.values())
+    return hashlib.sha1("\n".join([str(SCRIPT_CACHE_VERSION), *TABLE]).encode()).hexdigest()
+
+def __load_script_cache():
+    # Returns the cached scripts (absolute path -> entry), least recently run first.
+    global SCRIPT_CACHE
+    if SCRIPT_CACHE is None:
+        TABLE = __command_table()
+        SCRIPT_CACHE = {"table": TABLE, "scripts": {}}
+        try:
+            with open(SCRIPT_CACHE_FILE, "r") as f:
+                CACHE = json.load(f)
+            if CACHE.get("table") == TABLE:
+                SCRIPT_CACHE = CACHE
+        except (OSError, ValueError, AttributeError):
+            pass
+    return SCRIPT_CACHE["scripts"]
+
+def __save_script_cache():
+    try:
+        __ensure_data_dir()
+        TEMP = SCRIPT_CACHE_FILE + ".tmp"
+        with open(TEMP, "w") as f:
+            json.dump(SCRIPT_CACHE, f)
+        os.replace(TEMP, SCRIPT_CACHE_FILE)
+    except OSError as e:
+        print(f"{WARNING}Compiled script could not be cached inside of {OKCYAN}scriptcache.json{WARNING}. Reason:\n\n{ENDC}{e}")
+
+def __script_instructions(SCRIPT):
+    # Yields each instruction as soon as its logical line is complete. "-" reads the script from stdin.
+    # Scripts up to SCRIPT_CACHE_LIMIT bytes are compiled into the cache while they run, bigger ones are only streamed.
+    if SCRIPT == "-":
+        for line in __logical_lines(sys.stdin):
+            yield __compile_line(line)
+        return
+    PATH = os.path.abspath(SCRIPT)
+    STAT = os.stat(PATH)
+    CACHE = __load_script_cache()
+    ENTRY = CACHE.get(PATH)
+    if ENTRY and ENTRY["mtime"] == STAT.st_mtime_ns and ENTRY["size"] == STAT.st_size:
+        CACHE[PATH] = CACHE.pop(PATH) # Most recently run, written out with the next compiled script.
+        yield from ENTRY["code"]
+        return
+    CACHEABLE = STAT.st_size <= SCRIPT_CACHE_LIMIT
+    INSTRUCTIONS = []
+    with open(PATH, "r") as f:
+        for line in __logical_lines(f):
+            INSTRUCTION = __compile_line(line)
+            if CACHEABLE:
+                INSTRUCTIONS.append(INSTRUCTION)
+            yield INSTRUCTION
+    if CACHEABLE:
+        CACHE.pop(PATH, None)
+        CACHE[PATH] = {"mtime": STAT.st_mtime_ns, "size": STAT.st_size, "code": INSTRUCTIONS}
+        while len(CACHE) > SCRIPT_CACHE_ENTRIES:
+            del CACHE[next(iter(CACHE))]
+        __save_script_cache()
+
+def __run_instruction(ID, ARGS, line: str, BACKGROUND: bool = False):
+    if ID is None:
+        __load_used_vars(line)
+        for varname, varval in DECLARELIST.items():
+            line = line.replace(f"see {varname}", str(varval))
+        if not line:
+            return
+    print(f"{OKCYAN}[.xcon script] {line}{' &' if BACKGROUND else ''}{ENDC}")
+    if BACKGROUND:
+        __start_job(line)
+        return
+    COMMAND = COMMANDS.get(ID) if ID else None
+    if COMMAND is not None:
+        COMMAND.handler(line, ARGS)
+    elif ID == "":
+        __run_shell(line)
+    else:
+        __handle_prompt(line)
+
+@__command("chgpath")
+def __cmd_chgpath(prompt: str, args: str):
+    global LAST
+    path = args.strip()
+    path = os.path.normpath(path) 
+    if path == "last":
+        if LAST is None:
+            print(f"{WARNING}No previous folder path available yet.{ENDC}")
+            return
+        path, LAST = LAST, os.getcwd()
+        os.chdir(path)
+        return
+    elif path == "up":
+        CURRENT = os.getcwd()
+        PARENT = os.path.dirname(CURRENT)
+        if CURRENT == PARENT:
+            print(f"{OKBLUE}You are already in the root directory ({CURRENT}).{ENDC}")
         else:
-            LAST = os.getcwd()
-            os.chdir(path)
-            return
-    if prompt.startswith("access module "):
-        MODULE = prompt.removeprefix("access module ").strip()
-        if MODULE == "":
-            print(f"{WARNING}Please input a valid module to access.{ENDC}")
+            LAST = CURRENT
+            os.chdir(PARENT)
+        return
+    elif path == "root":
+        CURRENT = os.getcwd()
+        ROOT = f"{CURRENT[0]}:\\"
+        os.chdir(ROOT)
+        return
+    if not os.path.exists(path):
+        if path == "":
+            print(f"{FAIL}Expected path, got {repr(path)} (Please input a valid path).{ENDC}")
+        else:
+            print(f"{WARNING}Directory {repr(path)} is not available.\n{ENDC}")
             return
+    elif not os.access(path, os.F_OK):
+        print(f"{WARNING}{path}: Access denied.\n{ENDC}")
+        return
+    else:
+        LAST = os.getcwd()
+        os.chdir(path)
+        return
+
+MODULE_TIMINGS: dict = {} # Module name -> seconds its import took, None while a lazily accessed module is unused.
+SAVED_MODULES = None # Names from MODULES_FILE, read on first use.
+
+class TimedLoader:
+    """Wraps a module loader to record how long executing the module takes, for module timings."""
+
+    def __init__(self, loader, name):
+        self.loader = loader
+        self.name = name
+
+    def create_module(self, spec):
+        return self.loader.create_module(spec)
+
+    def exec_module(self, module):
+        START = time.perf_counter()
         try:
-            MODULES[MODULE] = __import__(MODULE)
-            globals()[MODULE] = MODULES[MODULE]
-            PYTHON_CONTEXT[MODULE] = MODULES[MODULE]
-            print(f"{OKGREEN}Module {MODULE} accessed successfully.{ENDC}")
-            return
-        except (ImportError, ModuleNotFoundError) as e:
-            print(f"{FAIL}Accessing module {MODULE} failed. Reason:\n\n{ENDC}{e}")
-            return
-    if prompt.startswith("module "):
-        MODULE = prompt.removeprefix("module ")
-        mod = __safe_eval(MODULE, PYTHON_CONTEXT)
+            self.loader.exec_module(module)
+        finally:
+            MODULE_TIMINGS[self.name] = time.perf_counter() - START
+
+    def __getattr__(self, name):
+        return getattr(self.loader, name)
+
+def __lazy_import(MODULE):
+    # Like __import__, but the module itself only runs when one of its attributes is first used.
+    if MODULE in sys.modules:
+        MODULE_TIMINGS.setdefault(MODULE, 0.0)
+        return __import__(MODULE)
+    SPEC = importlib.util.find_spec(MODULE) # Imports the parent packages of a dotted name.
+    if SPEC is None:
+        raise ModuleNotFoundError(f"No module named '{MODULE}'", name=MODULE)
+    if SPEC.loader is None or not hasattr(SPEC.loader, "exec_module"):
+        return __import__(MODULE)
+    SPEC.loader = importlib.util.LazyLoader(TimedLoader(SPEC.loader, MODULE))
+    LOADED = importlib.util.module_from_spec(SPEC)
+    sys.modules[MODULE] = LOADED
+    SPEC.loader.exec_module(LOADED)
+    MODULE_TIMINGS[MODULE] = None
+    # Not through __import__ again: checking a module in sys.modules reads its __spec__, which would load it right away.
+    PARENT, _, CHILD = MODULE.rpartition(".")
+    if PARENT:
+        setattr(sys.modules[PARENT], CHILD, LOADED)
+    return sys.modules[MODULE.partition(".")[0]]
+
+def __saved_modules() -> list:
+    global SAVED_MODULES
+    if SAVED_MODULES is None:
+        SAVED_MODULES = []
         try:
-            print(f"{OKCYAN}The type of module {MODULE} is: {type(__safe_eval(MODULE, PYTHON_CONTEXT))}.\n(Origin is {mod.__file__}.)")
-            return
-        except Exception as e:
-            print(f"{FAIL}Checking the type of the module {MODULE} failed (did you access it first? Does the module exist?). Reason:\n\n{ENDC}{e}")
-            return
-    if prompt.startswith("install "):
-        PACKAGE = prompt.removeprefix("install ")
-        if PACKAGE == "":
-            print(f"{WARNING}Package name is empty, please input a package name.{ENDC}")
-            return
+            with open(MODULES_FILE, "r", encoding="utf-8") as f:
+                SAVED_MODULES = json.load(f)
+        except (OSError, ValueError):
+            pass
+    return SAVED_MODULES
+
+def __save_modules():
+    try:
+        __ensure_data_dir()
+        TEMP = MODULES_FILE + ".tmp"
+        with open(TEMP, "w", encoding="utf-8") as f:
+            json.dump(__saved_modules(), f)
+        os.replace(TEMP, MODULES_FILE)
+    except OSError as e:
+        print(f"{WARNING}The accessed modules could not be saved inside of {OKCYAN}modules.json{WARNING}. Reason:\n\n{ENDC}{e}")
+
+def __bind_module(MODULE, LOADED):
+    MODULES[MODULE] = LOADED
+    globals()[MODULE] = LOADED
+    __context_set(MODULE, LOADED)
+
+def __load_modules():
+    # Accesses the modules of previous sessions lazily, so they cost nothing until they are used.
+    LOADED = []
+    for MODULE in __saved_modules():
         try:
-            if len(PACKAGE.split(" ")) > 1:
-                print(f"{WARNING}Uninstalling packages {', '.join(PACKAGE.split())}...{ENDC}")
-            else:
-                print(f"{WARNING}Uninstalling package {PACKAGE}...{ENDC}")
-            result = subprocess.run(f"pip install {PACKAGE}")
-            if result.returncode == 0:
-                list_package = PACKAGE.split()
-                for p in list_package:
-                    PACKAGELIST.append(p)
-                print(f"{OKGREEN}Successfully installed {'packages' if len(list_package) > 1 else 'package'} {', '.join(PACKAGELIST)}.{ENDC}")
-                return
-            else:
-                print(f"{FAIL}Package {PACKAGE} could not be installed. Please try again.{ENDC}")
-                return
+            __bind_module(MODULE, __lazy_import(MODULE))
+            LOADED.append(MODULE)
         except Exception as e:
-            print(f"{FAIL}An exception occurred while trying to install package {PACKAGE}. Reason:\n\n{ENDC}{e}")
+            print(f"{WARNING}Module {MODULE} from a previous session could not be accessed. Reason:\n\n{ENDC}{e}")
+    if LOADED:
+        print(f"{OKGREEN}{len(LOADED)} {'modules' if len(LOADED) > 1 else 'module'} accessed from the previous session, imported on first use.{ENDC}")
+
+@__command("access module")
+def __cmd_access_module(prompt: str, args: str):
+    MODULE = args.strip()
+    if MODULE == "":
+        print(f"{WARNING}Please input a valid module to access.{ENDC}")
+        return
+    try:
+        START = time.perf_counter()
+        IMPORTED = MODULE in sys.modules
+        __bind_module(MODULE, __import__(MODULE))
+        if not IMPORTED or MODULE not in MODULE_TIMINGS:
+            MODULE_TIMINGS[MODULE] = time.perf_counter() - START
+        if MODULE not in __saved_modules():
+            __saved_modules().append(MODULE)
+            __save_modules()
+        print(f"{OKGREEN}Module {MODULE} accessed successfully.{ENDC}")
+        return
+    except (ImportError, ModuleNotFoundError) as e:
+        print(f"{FAIL}Accessing module {MODULE} failed. Reason:\n\n{ENDC}{e}")
+        return
+
+@__command("forget module")
+def __cmd_forget_module(prompt: str, args: str):
+    MODULE = args.strip()
+    if MODULE not in __saved_modules():
+        print(f"{WARNING}Module {MODULE} is not accessed automatically.{ENDC}")
+        return
+    __saved_modules().remove(MODULE)
+    __save_modules()
+    print(f"{OKGREEN}Module {MODULE} will not be accessed in the next sessions. It stays accessed in this one.{ENDC}")
+
+@__command("module timings", args=False, bare=True)
+def __cmd_module_timings(prompt: str, args: str):
+    if not MODULE_TIMINGS:
+        print(f"{WARNING}No modules have been accessed yet.{ENDC}")
+        return
+    print(f"{OKCYAN}{'MODULE':<30}{'IMPORT TIME':>12}{ENDC}")
+    for MODULE, SECONDS in sorted(MODULE_TIMINGS.items(), key=lambda item: -1 if item[1] is None else item[1], reverse=True):
+        TIME = f"{COMMENT}{'not used yet':>12}{ENDC}" if SECONDS is None else f"{SECONDS * 1000:>10.1f}ms"
+        print(f"{MODULE:<30}{TIME}")
+
+@__command("module")
+def __cmd_module(prompt: str, args: str):
+    MODULE = args
+    mod = __safe_eval(MODULE, PYTHON_CONTEXT)
+    try:
+        print(f"{OKCYAN}The type of module {MODULE} is: {type(__safe_eval(MODULE, PYTHON_CONTEXT))}.\n(Origin is {mod.__file__}.)")
+        return
+    except Exception as e:
+        print(f"{FAIL}Checking the type of the module {MODULE} failed (did you access it first? Does the module exist?). Reason:\n\n{ENDC}{e}")
+        return
+
+PACKAGE_CACHE = None # Normalized name -> installed distribution, read through importlib.metadata on first use.
+PACKAGE_REQUIRED_BY = None # Normalized name -> names of the installed distributions that require it.
+REQUIREMENT_NAME = re.compile(r"^\s*([A-Za-z0-9][A-Za-z0-9._-]*)")
+
+def __normalize_package(name: str) -> str:
+    return re.sub(r"[-_.]+", "-", name).lower()
+
+def __installed_packages() -> dict:
+    import importlib.metadata
+    global PACKAGE_CACHE
+    if PACKAGE_CACHE is None:
+        PACKAGE_CACHE = {}
+        for DIST in importlib.metadata.distributions():
+            NAME = DIST.metadata["Name"]
+            if NAME:
+                PACKAGE_CACHE.setdefault(__normalize_package(NAME), DIST) # The first one on sys.path wins, as for imports.
+    return PACKAGE_CACHE
+
+def __invalidate_packages():
+    # Called after pip changed the environment.
+    global PACKAGE_CACHE, PACKAGE_REQUIRED_BY
+    PACKAGE_CACHE = None
+    PACKAGE_REQUIRED_BY = None
+    importlib.invalidate_caches()
+
+def __package_requires(DIST) -> list:
+    # Requirements that are always installed, leaving out the ones only pulled in by extras (like pip show).
+    NAMES = []
+    for REQUIREMENT in DIST.requires or []:
+        MATCH = REQUIREMENT_NAME.match(REQUIREMENT)
+        if MATCH and "extra ==" not in REQUIREMENT.partition(";")[2]:
+            NAMES.append(MATCH.group(1))
+    return NAMES
+
+def __package_required_by(name: str) -> list:
+    global PACKAGE_REQUIRED_BY
+    if PACKAGE_REQUIRED_BY is None:
+        PACKAGE_REQUIRED_BY = collections.defaultdict(list)
+        for DIST in __installed_packages().values():
+            for REQUIRED in __package_requires(DIST):
+                PACKAGE_REQUIRED_BY[__normalize_package(REQUIRED)].append(DIST.metadata["Name"])
+    return sorted(PACKAGE_REQUIRED_BY.get(name, []), key=str.lower)
+
+def __package_info(PACKAGE) -> str:
+    DIST = __installed_packages().get(__normalize_package(PACKAGE))
+    if DIST is None:
+        return f"(No information found for {PACKAGE})"
+    META = DIST.metadata
+    HOME = META.get("Home-page") or next((URL.partition(", ")[2] for URL in META.get_all("Project-URL") or []), "")
+    return "\n".join([
+        f"Name: {META['Name']}",
+        f"Version: {DIST.version}",
+        f"Summary: {META.get('Summary') or ''}",
+        f"Home-page: {HOME}",
+        f"Author: {META.get('Author') or ''}",
+        f"Author-email: {META.get('Author-email') or ''}",
+        f"License: {META.get('License') or ''}",
+        f"Location: {DIST.locate_file('')}",
+        f"Requires: {', '.join(__package_requires(DIST))}",
+        f"Required-by: {', '.join(__package_required_by(__normalize_package(META['Name'])))}",
+    ])
+
+def __run_pip(*ARGS) -> int:
+    # One pip call for all the packages, so the resolver and pip's startup only run once.
+    import subprocess
+    try:
+        return subprocess.run([sys.executable, "-m", "pip", *ARGS]).returncode
+    finally:
+        __invalidate_packages()
+
+@__command("install")
+def __cmd_install(prompt: str, args: str):
+    PACKAGE = args
+    if PACKAGE == "":
+        print(f"{WARNING}Package name is empty, please input a package name.{ENDC}")
+        return
+    try:
+        list_package = PACKAGE.split()
+        if len(list_package) > 1:
+            print(f"{WARNING}Installing packages {', '.join(list_package)}...{ENDC}")
+        else:
+            print(f"{WARNING}Installing package {PACKAGE}...{ENDC}")
+        if __run_pip("install", *list_package) == 0:
+            for p in list_package:
+                if p not in PACKAGELIST:
+                    PACKAGELIST.append(p)
+            print(f"{OKGREEN}Successfully installed {'packages' if len(list_package) > 1 else 'package'} {', '.join(list_package)}.{ENDC}")
             return
-    if prompt.startswith("uninstall "):
-        PACKAGE = prompt.removeprefix("uninstall ")
-        if PACKAGE == "":
-            print(f"{WARNING}Package name is empty, please input a package name.{ENDC}")
+        else:
+            print(f"{FAIL}Package {PACKAGE} could not be installed. Please try again.{ENDC}")
             return
-        try:
-            if len(PACKAGE.split()) > 1:
-                print(f"{WARNING}Uninstalling packages {', '.join(PACKAGE.split())}...{ENDC}")
-            else:
-                print(f"{WARNING}Uninstalling package {PACKAGE}...{ENDC}")
-            result = subprocess.run(f"pip uninstall {PACKAGE}")
-            if result.returncode == 0:
-                list_package = PACKAGE.split()
-                for p in list_package:
+    except Exception as e:
+        print(f"{FAIL}An exception occurred while trying to install package {PACKAGE}. Reason:\n\n{ENDC}{e}")
+        return
+
+@__command("uninstall")
+def __cmd_uninstall(prompt: str, args: str):
+    PACKAGE = args
+    if PACKAGE == "":
+        print(f"{WARNING}Package name is empty, please input a package name.{ENDC}")
+        return
+    try:
+        list_package = PACKAGE.split()
+        if len(list_package) > 1:
+            print(f"{WARNING}Uninstalling packages {', '.join(list_package)}...{ENDC}")
+        else:
+            print(f"{WARNING}Uninstalling package {PACKAGE}...{ENDC}")
+        if __run_pip("uninstall", *list_package) == 0:
+            for p in list_package:
+                if p in PACKAGELIST:
                     PACKAGELIST.remove(p)
-                print(f"{OKGREEN}Successfully uninstalled {'packages' if len(list_package) > 1 else 'package'} {', '.join(PACKAGELIST)}.{ENDC}")
-                return
-            else:
-                print(f"{FAIL}Package {PACKAGE} could not be uninstalled. Please try again.{ENDC}")
-                return
-        except Exception as e:
-            print(f"{FAIL}An exception occurred while trying to uninstall package {PACKAGE}. Reason:\n\n{ENDC}{e}")
-            return
-    if prompt == "installer upgrade":
-        print(f"{WARNING}Attempting to upgrade installer...{ENDC}")
-        try:
-            PY = sys.executable
-            subprocess.run([PY, "-m", "pip", "install", "--upgrade", "pip"])
-            result = subprocess.run([PY, "-m", "pip", "--version"], capture_output=True, text=True)
-            if result.returncode == 0:
-                version = result.stdout.split()[1]
-            else:
-                version = "unknown (version not found)"
-            print(f"{OKGREEN}Installer successfully upgraded to version {version}.{ENDC}")
+            print(f"{OKGREEN}Successfully uninstalled {'packages' if len(list_package) > 1 else 'package'} {', '.join(list_package)}.{ENDC}")
             return
-        except Exception as e:
-            print(f"{FAIL}An exception has occurred while attempting to upgrade installer. Reason:\n\n{e}")
-            return
-    if prompt.endswith(" info"):
-        PACKAGE = prompt.removesuffix(" info")
-        if PACKAGE == "":
-            print(f"{WARNING}Please input a valid package name.{ENDC}")
+        else:
+            print(f"{FAIL}Package {PACKAGE} could not be uninstalled. Please try again.{ENDC}")
             return
+    except Exception as e:
+        print(f"{FAIL}An exception occurred while trying to uninstall package {PACKAGE}. Reason:\n\n{ENDC}{e}")
+        return
+
+@__command("installer upgrade", args=False, bare=True)
+def __cmd_installer_upgrade(prompt: str, args: str):
+    print(f"{WARNING}Attempting to upgrade installer...{ENDC}")
+    try:
+        __run_pip("install", "--upgrade", "pip")
+        DIST = __installed_packages().get("pip")
+        version = DIST.version if DIST is not None else "unknown (version not found)"
+        print(f"{OKGREEN}Installer successfully upgraded to version {version}.{ENDC}")
+        return
+    except Exception as e:
+        print(f"{FAIL}An exception has occurred while attempting to upgrade installer. Reason:\n\n{e}")
+        return
+
+@__command("info", suffix=True)
+def __cmd_package_info(prompt: str, args: str):
+    PACKAGE = args.strip()
+    if PACKAGE == "":
+        print(f"{WARNING}Please input a valid package name.{ENDC}")
+        return
+    try:
+        print(f"{OKCYAN}Getting info about package {OKCYAN}{PACKAGE}{OKCYAN}...{ENDC}")
+        info = "\n---\n".join(__package_info(NAME) for NAME in PACKAGE.split())
+        print(f"{OKGREEN}Information gathered. Information:{ENDC}\n\n{info}")
+        return
+    except Exception as e:
+        print(f"{FAIL}Something went wrong while trying to check package info {OKCYAN}{PACKAGE}{FAIL}. Reason:\n\n{ENDC}{e}")
+        return
+
+@__command("echo")
+def __cmd_echo(prompt: str, args: str):
+    STRING = args
+    if STRING == "":
+        print("\n")
+        return
+    if STRING in DECLARELIST or __load_var(STRING):
+        result = DECLARELIST[STRING]
+        print(result)
+        return
+    else:
         try:
-            print(f"{OKCYAN}Getting info about package {OKCYAN}{PACKAGE}{OKCYAN}...{ENDC}")
-            result = subprocess.run(f"pip show {PACKAGE}", capture_output=True, text=True, shell=True)
-            if result.returncode == 0:
-                info = result.stdout
+            if isinstance(STRING, str):
+                result = __eval_checked(STRING)
             else:
-                info = "(No information found)"
-            print(f"{OKGREEN}Information gathered. Information:{ENDC}\n\n{info}")
-            return
-        except Exception as e:
-            print(f"{FAIL}Something went wrong while trying to check package info {OKCYAN}{PACKAGE}{FAIL}. Reason:\n\n{ENDC}{e}")
-            return
-    if prompt.startswith("echo "):
-        STRING = prompt.removeprefix("echo ")
-        if STRING == "":
-            print("\n")
-            return
-        if STRING in DECLARELIST:
-            result = DECLARELIST[STRING]
+                result = __eval_checked(f'"{STRING}"')
             print(result)
             return
-        else:
+        except Exception:
             try:
-                if isinstance(STRING, str):
-                    result = __safe_eval(STRING, PYTHON_CONTEXT)
-                else:
-                    result = __safe_eval(f'"{STRING}"', PYTHON_CONTEXT)
-                print(result)
+                print(STRING)
                 return
-            except Exception:
-                try:
-                    print(STRING)
-                    return
-                except Exception as e:
-                    print(f"{FAIL}Could not return object {STRING}. Reason:\n\n{ENDC}{e}")
+            except Exception as e:
+                print(f"{FAIL}Could not return object {STRING}. Reason:\n\n{ENDC}{e}")
+            return
+
+INSPECT_TOP_FILES = 3 # Amount of largest files reported per subtree by inspect folder !r.
+
+def __format_size(SIZE) -> str:
+    for UNIT in ("B", "KB", "MB", "GB", "TB"):
+        if SIZE < 1024 or UNIT == "TB":
+            return f"{SIZE:.0f} {UNIT}" if UNIT == "B" else f"{SIZE:.1f} {UNIT}"
+        SIZE /= 1024
+
+def __scan_tree(path, EXTENSIONS=None, TOP=INSPECT_TOP_FILES):
+    # Walks a tree with os.scandir, so the file type comes from the cached directory entry instead of an extra stat call.
+    # Returns the amount of files, their total size, the TOP largest files as (size, path) and the amount of unreadable entries.
+    import heapq
+    FILES = 0
+    SIZE = 0
+    LARGEST = []
+    ERRORS = 0
+    STACK = [path]
+    while STACK:
+        try:
+            with os.scandir(STACK.pop()) as entries:
+                for entry in entries:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            STACK.append(entry.path)
+                            continue
+                        if not entry.is_file(follow_symlinks=False):
+                            continue
+                        if EXTENSIONS and not entry.name.endswith(EXTENSIONS):
+                            continue
+                        BYTES = entry.stat(follow_symlinks=False).st_size
+                        FILES += 1
+                        SIZE += BYTES
+                        if len(LARGEST) < TOP:
+                            heapq.heappush(LARGEST, (BYTES, entry.path))
+                        elif BYTES > LARGEST[0][0]:
+                            heapq.heapreplace(LARGEST, (BYTES, entry.path))
+                    except OSError:
+                        ERRORS += 1
+        except OSError:
+            ERRORS += 1
+    return FILES, SIZE, sorted(LARGEST, reverse=True), ERRORS
+
+def __inspect_tree(FOLDER, EXTENSIONS=None, NAME=None):
+    from concurrent.futures import ThreadPoolExecutor
+    START = time.perf_counter()
+    SUBTREES = []
+    FILES = 0
+    SIZE = 0
+    with os.scandir(FOLDER) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                SUBTREES.append(entry)
+            elif entry.is_file(follow_symlinks=False) and (not EXTENSIONS or entry.name.endswith(EXTENSIONS)):
+                FILES += 1
+                SIZE += entry.stat(follow_symlinks=False).st_size
+    print(f"{OKCYAN}Folder {NAME or FOLDER} contains (recursively):{ENDC}\n")
+    TOTAL_FILES, TOTAL_SIZE, TOTAL_ERRORS = FILES, SIZE, 0
+    with ThreadPoolExecutor() as pool:
+        RESULTS = pool.map(lambda entry: __scan_tree(entry.path, EXTENSIONS), SUBTREES)
+        for entry, (files, size, largest, errors) in zip(SUBTREES, RESULTS):
+            TOTAL_FILES += files
+            TOTAL_SIZE += size
+            TOTAL_ERRORS += errors
+            print(f"{OKBLUE}{entry.name}{ENDC}: {OKCYAN}{files} {'file' if files == 1 else 'files'}, {__format_size(size)}{ENDC}")
+            if largest:
+                print(f"    {COMMENT}Largest: {', '.join(f'{os.path.relpath(path, entry.path)} ({__format_size(bytes)})' for bytes, path in largest)}{ENDC}")
+    if FILES:
+        print(f"{OKBLUE}(files in {os.path.basename(FOLDER) or FOLDER}){ENDC}: {OKCYAN}{FILES} {'file' if FILES == 1 else 'files'}, {__format_size(SIZE)}{ENDC}")
+    if TOTAL_ERRORS:
+        print(f"{WARNING}{TOTAL_ERRORS} {'entry' if TOTAL_ERRORS == 1 else 'entries'} could not be read.{ENDC}")
+    print(f"\n{OKGREEN}Total: {TOTAL_FILES} {'file' if TOTAL_FILES == 1 else 'files'}, {__format_size(TOTAL_SIZE)} in {len(SUBTREES)} {'folder' if len(SUBTREES) == 1 else 'folders'} (took {time.perf_counter() - START:.2f}s).{ENDC}")
+
+@__command("inspect folder")
+def __cmd_inspect_folder(prompt: str, args: str):
+    FOLDER = args.strip()
+    EXTENSION = None
+    RECURSIVE = False
+    if FOLDER.endswith(" !r"):
+        RECURSIVE = True
+        FOLDER = FOLDER.removesuffix(" !r").rstrip()
+    if " all " in FOLDER:
+        FOLDER, EXTENSION = FOLDER.split(" all ", 1)
+        EXTENSION = EXTENSION.strip()
+    if FOLDER == "":
+        print(f"{WARNING}Folder name is empty, please specify a folder.{ENDC}")
+        return
+    elif FOLDER == "current":
+        FOLDER = __cwd()
+    elif FOLDER == "root":
+        if os.path.exists(FOLDER):
+            pass
+        else:
+            FOLDER = f"{__cwd()[0]}:\\"
+    elif FOLDER == "last":
+        if LAST is None:
+            print(f"{WARNING}No previous folder path available.{ENDC}")
+            return
+        FOLDER = LAST
+    PATH = os.path.join(__cwd(), FOLDER)
+    if not os.path.exists(PATH):
+        print(f"{WARNING}Please specify a valid folder (did you forget to change the console path to the root folder of the folder {OKCYAN}{FOLDER}{WARNING}?).{ENDC}")
+        return
+    EXTENSIONS = tuple(EXTENSION.split()) if EXTENSION else None
+    try:
+        if RECURSIVE:
+            __inspect_tree(PATH, EXTENSIONS, FOLDER)
+            return
+        SUBFOLDERS = []
+        FILES = []
+        with os.scandir(PATH) as entries:
+            for entry in entries:
+                if entry.is_dir():
+                    SUBFOLDERS.append(entry.name)
+                elif entry.is_file() and (not EXTENSIONS or entry.name.endswith(EXTENSIONS)):
+                    FILES.append(entry.name)
+        if EXTENSIONS and not FILES:
+            print(f"{WARNING}No files with file {'extension' if len(EXTENSIONS) == 1 else 'extensions'} {', '.join(EXTENSIONS)} found.{ENDC}")
+            return
+        print(f"{OKCYAN}Folder {FOLDER} contains:\n\nFolders: {', '.join(SUBFOLDERS)}\nFiles: {', '.join(FILES)}{ENDC}")
+        return
+    except Exception as e:
+        print(f"{FAIL}Folder {FOLDER} could not be inspected. Reason:\n\n{ENDC} {e}")
+    return
+
+INSPECT_BLOCK_SIZE = 64 * 1024
+INSPECT_PAGE_LINES = 40
+
+def __tail_lines(PATH, COUNT) -> list:
+    # Reads blocks backwards from the end of the file until it holds enough lines, so only the tail is ever read.
+    with open(PATH, "rb") as f:
+        POS = f.seek(0, os.SEEK_END)
+        DATA = b""
+        while POS > 0 and DATA.count(b"\n") <= COUNT:
+            STEP = min(INSPECT_BLOCK_SIZE, POS)
+            POS -= STEP
+            f.seek(POS)
+            DATA = f.read(STEP) + DATA
+    return DATA.splitlines()[-COUNT:]
+
+def __page_lines(f, COUNT):
+    for i, line in enumerate(f, start=1):
+        sys.stdout.write(line if line.endswith("\n") else line + "\n")
+        if i % COUNT == 0:
+            ANSWER = input(f"{COMMENT}-- More ({OKCYAN}Enter{COMMENT}: next page, {OKCYAN}q{COMMENT}: quit) --{ENDC} ").strip()
+            if ANSWER.lower() == "q":
                 return
-    if prompt.startswith("inspect folder "):
-        FOLDER = prompt.removeprefix("inspect folder ").strip()
-        EXTENSION = None
-        if " all " in FOLDER:
-            FOLDER, EXTENSION = FOLDER.split(" all ", 1)
-            EXTENSION = EXTENSION.strip()
-        if FOLDER == "":
-            print(f"{WARNING}Folder name is empty, please specify a folder.{ENDC}")
+
+def __count_in_file(PATH, NEEDLE: bytes) -> int:
+    # Counts the bytes of NEEDLE through a read-only memory map, so the file is never decoded or loaded as a whole.
+    import mmap
+    if os.path.getsize(PATH) == 0:
+        return 0
+    COUNT = 0
+    with open(PATH, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        POS = mm.find(NEEDLE)
+        while POS != -1:
+            COUNT += 1
+            POS = mm.find(NEEDLE, POS + len(NEEDLE))
+    return COUNT
+
+def __matching_lines(PATH, NEEDLE: bytes):
+    with open(PATH, "rb") as f:
+        for number, line in enumerate(f, start=1):
+            if NEEDLE in line:
+                yield number, line
+
+@__command("inspect file")
+def __cmd_inspect_file(prompt: str, args: str):
+    FILE = args
+    if FILE.startswith("text "):
+        PARAMS = FILE.removeprefix("text ").strip()
+        LINES = False
+        if PARAMS.endswith(" !lines"):
+            LINES = True
+            PARAMS = PARAMS.removesuffix(" !lines").rstrip()
+        PARAMS = PARAMS.split(" ", 1)
+        if len(PARAMS) < 2:
+            print(f"{WARNING}Please execute the command in this order: inspect file text 'x' file.txt{ENDC}")
+            return
+        TEXT, FILE = PARAMS
+        PATH = os.path.join(__cwd(), FILE)
+        if TEXT.startswith(("'", '"')) and TEXT.endswith(("'", '"')):
+            TEXT = TEXT[1:-1]
+        if not TEXT:
+            print(f"{WARNING}Please input the text to search for: inspect file text 'x' file.txt{ENDC}")
             return
-        elif FOLDER == "current":
-            FOLDER = os.getcwd()
-        elif FOLDER == "root":
-            if os.path.exists(FOLDER):
-                pass
-            else:
-                FOLDER = f"{os.getcwd()[0]}:\\"
-        elif FOLDER == "last":
-            if LAST is None:
-                print(f"{WARNING}No previous folder path available.{ENDC}")
-            FOLDER = LAST
-        if not os.path.exists(FOLDER):
-            print(f"{WARNING}Please specify a valid folder (did you forget to change the console path to the root folder of the folder {OKCYAN}{FOLDER}{WARNING}?).{ENDC}")
+        if not os.path.exists(PATH):
+            print(f"{WARNING}File {FILE} cannot be read, because it does not exist in the current context. Please try again.{ENDC}")
             return
+        NEEDLE = TEXT.encode("utf-8")
         try:
-            SUBFOLDERS = [d for d in os.listdir(FOLDER) if os.path.isdir(os.path.join(FOLDER, d))]
-            FILES = [f for f in os.listdir(FOLDER) if os.path.isfile(os.path.join(FOLDER, f))]
-            if EXTENSION:
-                RAW = FOLDER
-                EXTENSIONS = tuple(EXTENSION.split())
-                FILES = [f for f in os.listdir(RAW) if os.path.isfile(os.path.join(RAW, f)) and f.endswith(EXTENSIONS)]
-                if not FILES:
-                    print(f"{WARNING}No files with file {'extension' if len(EXTENSIONS) == 1 else 'extensions'} {', '.join(EXTENSIONS)} found.{ENDC}")
+            if LINES:
+                if b"\n" in NEEDLE:
+                    print(f"{WARNING}Text spanning multiple lines cannot be reported per line, please leave out {OKCYAN}!lines{WARNING}.{ENDC}")
                     return
-                else:
-                    files = ', '.join(FILES)
-                    print(f"{OKCYAN}Folder {FOLDER} contains:\n\nFolders: {', '.join(SUBFOLDERS)}\nFiles: {files}{ENDC}")
+                count = 0
+                for number, line in __matching_lines(PATH, NEEDLE):
+                    count += line.count(NEEDLE)
+                    print(f"{OKBLUE}{number}{ENDC}: {line.decode('utf-8', errors='replace').rstrip()}")
             else:
-                print(f"{OKCYAN}Folder {FOLDER} contains:\n\nFolders: {', '.join(SUBFOLDERS)}\nFiles: {', '.join(FILES)}{ENDC}")
+                count = __count_in_file(PATH, NEEDLE)
+        except OSError as e:
+            print(f"{FAIL}File {FILE} could not be searched. Reason:\n\n{ENDC}{e}")
             return
-        except Exception as e:
-            print(f"{FAIL}Folder {FOLDER} could not be inspected. Reason:\n\n{ENDC} {e}")
-        return
-    if prompt.startswith("inspect file "):
-        FILE = prompt.removeprefix("inspect file ")
-        if FILE.startswith("text "):
-            PARAMS = FILE.removeprefix("text ").strip().split(" ", 1)
-            if len(PARAMS) < 2:
-                print(f"{WARNING}Please execute the command in this order: inspect file text 'x' file.txt{ENDC}")
+        if count == 0:
+            print(f"{WARNING}There aren't any lines with text {TEXT} in the file {FILE}.{ENDC}")
+        else:
+            print(f"{OKCYAN}The amount of times {TEXT} has been counted {count} times in the file {FILE}.{ENDC}")
+        return
+    MODE, VALUE = None, ""
+    if " !" in FILE:
+        PATH_PART, FLAG = FILE.rsplit(" !", 1)
+        FLAG_NAME, _, FLAG_VALUE = FLAG.partition(" ")
+        if FLAG_NAME in ("head", "tail", "range", "page"):
+            FILE, MODE, VALUE = PATH_PART.rstrip(), FLAG_NAME, FLAG_VALUE.strip()
+    PATH = os.path.join(__cwd(), FILE)
+    if not os.path.exists(PATH):
+        print(f"{WARNING}File {FILE} does not exist in the current context.{ENDC}")
+        return
+    try:
+        if MODE == "range":
+            START, _, STOP = VALUE.partition(":")
+            START = int(START) if START.strip() else 1
+            STOP = int(STOP) if STOP.strip() else None
+            if START < 1 or (STOP is not None and STOP < START):
+                print(f"{WARNING}Please input a valid line range, for example: inspect file {FILE} !range 10:20{ENDC}")
                 return
-            TEXT, FILE = PARAMS
-            PATH = os.path.join(os.getcwd(), FILE)
-            if TEXT.startswith(("'", '"')) and TEXT.endswith(("'", '"')):
-                TEXT = TEXT[1:-1]
-            if not os.path.exists(PATH):
-                print(f"{WARNING}File {FILE} cannot be read, because it does not exist in the current context. Please try again.{ENDC}")
+        elif MODE:
+            COUNT = int(VALUE) if VALUE else (INSPECT_PAGE_LINES if MODE == "page" else 10)
+            if COUNT < 1:
+                print(f"{WARNING}Please input a positive amount of lines, not {COUNT}.{ENDC}")
                 return
+    except ValueError:
+        print(f"{WARNING}{VALUE!r} is not a valid amount of lines for {OKCYAN}!{MODE}{WARNING}.{ENDC}")
+        return
+    try:
+        print()
+        if MODE == "tail":
+            for line in __tail_lines(PATH, COUNT):
+                print(line.decode("utf-8", errors="replace"))
+            return
+        if MODE is None:
             with open(PATH, "r") as f:
-                lines = f.read()
-                count = lines.count(TEXT)
-                if count == 0:
-                    print(f"{WARNING}There aren't any lines with text {TEXT} in the file {FILE}.{ENDC}")
-                    return
-                else:
-                    print(f"{OKCYAN}The amount of times {TEXT} has been counted {count} times in the file {FILE}.{ENDC}")
-                return
-            if not os.path.exists(PATH):
-                print(f"{WARNING}File {FILE} does not exist in the current context.{ENDC}")
+                while BLOCK := f.read(INSPECT_BLOCK_SIZE):
+                    sys.stdout.write(BLOCK)
+            print()
+            return
+        with open(PATH, "r", encoding="utf-8", errors="replace") as f:
+            if MODE == "head":
+                LINES = itertools.islice(f, COUNT)
+            elif MODE == "range":
+                LINES = itertools.islice(f, START - 1, STOP)
+            else:
+                __page_lines(f, COUNT)
                 return
-        PATH = os.path.join(os.getcwd(), FILE)
-        if not os.path.exists(PATH):
-            print(f"{WARNING}File {FILE} does not exist in the current context.{ENDC}")
-            return
+            for line in LINES:
+                sys.stdout.write(line if line.endswith("\n") else line + "\n")
+        return
+    except (Exception, UnicodeDecodeError, UnicodeError) as e:
+        print(f"{FAIL}File {FILE} could not be inspected. Reason:\n\n{ENDC}{e}")
+        return
+
+GREP_MAX_RESULTS = 1000
+GREP_WINDOW = 64 # Files searched ahead of the one being printed.
+
+def __iter_files(path, EXTENSIONS=None):
+    if os.path.isfile(path):
+        yield path
+        return
+    STACK = [path]
+    while STACK:
         try:
-            with open(FILE, "r+") as f:
-                CONTENT = f.read()
-                print(f"\n{CONTENT}")
-            return
-        except (Exception, UnicodeDecodeError, UnicodeError) as e:
-            print(f"{FAIL}File {FILE} could not be inspected. Reason:\n\n{ENDC}{e}")
-            return
-    if prompt.startswith("check "):
-        CONDITION = prompt.removeprefix("check ")
-        if CONDITION in RESERVED:
-            print(f"{FAIL}XCon commands are not checkable.{ENDC}")
-            return
-        CONTEXT = dict(globals())
-        CONTEXT.update(DECLARELIST)
-        if CONDITION.startswith("type "):
-            TYPECONDITION = __safe_eval(CONDITION.removeprefix("type "), CONTEXT)
-            try:    
-                print(f"{OKCYAN}{TYPECONDITION} has the type {type(TYPECONDITION).__name__}.")
-                return
-            except Exception as e:
-                print(f"{FAIL}Could not check condition {TYPECONDITION}. Reason:\n\n{ENDC}{e}")
-                return
+            with os.scandir(STACK.pop()) as entries:
+                for entry in entries:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            STACK.append(entry.path)
+                        elif entry.is_file(follow_symlinks=False) and (not EXTENSIONS or entry.name.endswith(EXTENSIONS)):
+                            yield entry.path
+                    except OSError:
+                        continue
+        except OSError:
+            continue
+
+def __grep_file(PATH, PATTERN, LIMIT):
+    # Runs inside a worker process. Returns the path, the amount of matching lines (-1 if unreadable) and at most LIMIT matches.
+    COUNT = 0
+    MATCHES = []
+    try:
+        with open(PATH, "rb") as f:
+            if b"\0" in f.read(8192):
+                return PATH, 0, MATCHES # Binary file.
+            f.seek(0)
+            for number, line in enumerate(f, start=1):
+                if PATTERN.search(line):
+                    COUNT += 1
+                    if len(MATCHES) < LIMIT:
+                        MATCHES.append((number, line.decode("utf-8", errors="replace").rstrip()))
+    except OSError:
+        return PATH, -1, MATCHES
+    return PATH, COUNT, MATCHES
+
+def __grep_tree(path, PATTERN, EXTENSIONS, LIMIT):
+    # Yields the result of every file in walk order, while the next GREP_WINDOW files are already being searched.
+    from concurrent.futures import ProcessPoolExecutor
+    with ProcessPoolExecutor() as pool:
+        PENDING = collections.deque()
         try:
-            if CONDITION.endswith(" exists"):
-                OBJECT = CONDITION.removesuffix(" exists")
-                PATH = os.path.join(os.getcwd(), OBJECT)
-                short = 'File' if os.path.isfile(OBJECT) else 'Directory'
-                print(f"{WARNING}Checking if {short.lower()} {OBJECT} exists...{ENDC}")
-                if os.path.exists(PATH):
-                    print(f"{OKGREEN}{short} {OBJECT} exists in the current context.{ENDC}")
-                    return
-                else:
-                    print(f"{FAIL}{short} {OBJECT} does not exist in the current context. Please try again.{ENDC}")
-                    return
-        except Exception as e:
-            print(f"{FAIL}An exception has occurred while checking existence of {short.lower()} {OBJECT}. Reason:\n\n{ENDC}{e}")
-            return   
-        RESULT = __safe_eval(CONDITION, CONTEXT)
-        if RESULT is True: 
-            print(f"{OKGREEN}Condition \"{CONDITION}\" is true.{ENDC}")
+            for FILE in __iter_files(path, EXTENSIONS):
+                PENDING.append(pool.submit(__grep_file, FILE, PATTERN, LIMIT))
+                if len(PENDING) >= GREP_WINDOW:
+                    yield PENDING.popleft().result()
+            while PENDING:
+                yield PENDING.popleft().result()
+        finally:
+            pool.shutdown(wait=True, cancel_futures=True)
+
+def __split_patterns(args: str):
+    PATTERNS = []
+    args = args.strip()
+    while args[:1] in ("'", '"'):
+        END = args.find(args[0], 1)
+        if END == -1:
+            break
+        PATTERNS.append(args[1:END])
+        args = args[END + 1:].strip()
+    if not PATTERNS:
+        PATTERN, _, args = args.partition(" ")
+        PATTERNS.append(PATTERN)
+    return PATTERNS, args.strip()
+
+@__command("inspect grep")
+def __cmd_inspect_grep(prompt: str, args: str):
+    COUNT_ONLY = False
+    LIMIT = GREP_MAX_RESULTS
+    if args.endswith(" !count"):
+        COUNT_ONLY = True
+        args = args.removesuffix(" !count").rstrip()
+    if " !max " in args:
+        args, _, MAX = args.rpartition(" !max ")
+        try:
+            LIMIT = int(MAX)
+        except ValueError:
+            print(f"{WARNING}{MAX!r} is not a valid maximum amount of results.{ENDC}")
+            return
+    PATTERNS, TARGET = __split_patterns(args)
+    EXTENSIONS = None
+    if " all " in f" {TARGET}":
+        TARGET, _, EXTENSION = f" {TARGET}".partition(" all ")
+        TARGET = TARGET.strip()
+        EXTENSIONS = tuple(EXTENSION.split())
+    if not PATTERNS[0] or not TARGET:
+        print(f"{WARNING}Please execute the command in this order: inspect grep 'pattern' folder [all .ext]{ENDC}")
+        return
+    TARGET = __cwd() if TARGET == "current" else os.path.join(__cwd(), TARGET)
+    if not os.path.exists(TARGET):
+        print(f"{WARNING}{TARGET} does not exist in the current context.{ENDC}")
+        return
+    try:
+        PATTERN = re.compile("|".join(f"(?:{p})" for p in PATTERNS).encode("utf-8"))
+    except re.error as e:
+        print(f"{FAIL}The pattern {OKCYAN}{' '.join(PATTERNS)} {FAIL}is not a valid regular expression. Reason:\n\n{ENDC}{e}")
+        return
+    START = time.perf_counter()
+    FILES = MATCHED_FILES = MATCHES = SHOWN = 0
+    try:
+        for FILE, COUNT, LINES in __grep_tree(TARGET, PATTERN, EXTENSIONS, LIMIT):
+            FILES += 1
+            if COUNT <= 0:
+                continue
+            MATCHED_FILES += 1
+            MATCHES += COUNT
+            NAME = os.path.relpath(FILE, __cwd()) if os.path.isdir(TARGET) else FILE
+            if COUNT_ONLY:
+                print(f"{OKCYAN}{NAME}{ENDC}: {COUNT}")
+            else:
+                for number, line in LINES[:LIMIT - SHOWN]:
+                    print(f"{OKCYAN}{NAME}{ENDC}:{OKBLUE}{number}{ENDC}: {line}")
+                SHOWN += min(len(LINES), LIMIT - SHOWN)
+            if SHOWN >= LIMIT or (COUNT_ONLY and MATCHED_FILES >= LIMIT):
+                print(f"{WARNING}Stopped after {LIMIT} results (use {OKCYAN}!max <n>{WARNING} to show more).{ENDC}")
+                break
+    except KeyboardInterrupt:
+        print(f"{WARNING}Search stopped.{ENDC}")
+    print(f"{OKGREEN}Found {MATCHES} matching {'line' if MATCHES == 1 else 'lines'} in {MATCHED_FILES} of {FILES} searched {'file' if FILES == 1 else 'files'} (took {time.perf_counter() - START:.2f}s).{ENDC}")
+
+@__command("check")
+def __cmd_check(prompt: str, args: str):
+    CONDITION = args
+    if CONDITION in RESERVED:
+        print(f"{FAIL}XCon commands are not checkable.{ENDC}")
+        return
+    if CONDITION.startswith("deps "):
+        EXPR = CONDITION.removeprefix("deps ")
+        try:
+            DEPS = __expr_deps(EXPR)
+        except (SyntaxError, ValueError) as e:
+            print(f"{FAIL}Could not analyze condition {EXPR}. Reason:\n\n{ENDC}{e}")
             return
-        elif RESULT is False:
-            print(f"{FAIL}Condition \"{CONDITION}\" is false.{ENDC}")
+        if not DEPS:
+            print(f"{OKCYAN}Condition \"{EXPR}\" does not depend on any declared variables.{ENDC}")
             return
-        else:
-            print(f"{OKCYAN}Condition \"{CONDITION}\" has been evaluated to: {RESULT}{ENDC}")
+        print(f"{OKCYAN}Condition \"{EXPR}\" depends on {'variables' if len(DEPS) > 1 else 'variable'} {', '.join(DEPS)}.{ENDC}")
+        return
+    if CONDITION.startswith("type "):
+        TYPECONDITION = __eval_checked(CONDITION.removeprefix("type "))
+        try:    
+            print(f"{OKCYAN}{TYPECONDITION} has the type {type(TYPECONDITION).__name__}.")
             return
-    if prompt.startswith("xcon script "):
-        SCRIPT = prompt.removeprefix("xcon script ").strip()
-        if not SCRIPT:
-            print("{WARNING}Please provide a script file to run.{ENDC}")
+        except Exception as e:
+            print(f"{FAIL}Could not check condition {TYPECONDITION}. Reason:\n\n{ENDC}{e}")
             return
+    try:
+        if CONDITION.endswith(" exists"):
+            OBJECT = CONDITION.removesuffix(" exists")
+            PATH = os.path.join(__cwd(), OBJECT)
+            short = 'File' if os.path.isfile(PATH) else 'Directory'
+            print(f"{WARNING}Checking if {short.lower()} {OBJECT} exists...{ENDC}")
+            if os.path.exists(PATH):
+                print(f"{OKGREEN}{short} {OBJECT} exists in the current context.{ENDC}")
+                return
+            else:
+                print(f"{FAIL}{short} {OBJECT} does not exist in the current context. Please try again.{ENDC}")
+                return
+    except Exception as e:
+        print(f"{FAIL}An exception has occurred while checking existence of {short.lower()} {OBJECT}. Reason:\n\n{ENDC}{e}")
+        return   
+    RESULT = __eval_checked(CONDITION)
+    if RESULT is True: 
+        print(f"{OKGREEN}Condition \"{CONDITION}\" is true.{ENDC}")
+        return
+    elif RESULT is False:
+        print(f"{FAIL}Condition \"{CONDITION}\" is false.{ENDC}")
+        return
+    else:
+        print(f"{OKCYAN}Condition \"{CONDITION}\" has been evaluated to: {RESULT}{ENDC}")
+        return
+
+@__command("xcon script")
+def __cmd_xcon_script(prompt: str, args: str):
+    SCRIPT = args.strip()
+    if not SCRIPT:
+        print(f"{WARNING}Please provide a script file to run.{ENDC}")
+        return
+    if SCRIPT != "-":
         if not os.path.exists(SCRIPT):
             print(f"{WARNING}Script file '{SCRIPT}' not found.{ENDC}")
             return
         if not SCRIPT.endswith(".xcon"):
             print(f"{WARNING}Please run a script file with a .xcon file extension.{ENDC}")
             return
-        try: 
-            with open(SCRIPT, "r+") as f:
-                RAWL = f.readlines()
-            if not RAWL:
-                print(f"{FAIL}The script file '{OKCYAN}{SCRIPT}{FAIL}' is empty, please provide a script with a valid (set of) commands.{ENDC}")
-                return
-            logiclines = []
-            buf = ""
-            for raw in RAWL:
-                line = raw.strip()
-                if not line:
-                    continue
-                if line.endswith(">"):
-                    buf += line[:-1].rstrip() + " "
-                    continue
-                else:
-                    buf += line
-                    logiclines.append(buf)
-                    buf = ""
-            if buf:
-                logiclines.append(buf)
-            for rawline in logiclines:
-                line = rawline.split("$", 1)[0].strip()
-                for varname, varval in DECLARELIST.items():
-                    line = line.replace(f"see {varname}", str(varval))
-                if not line:
-                    continue
-                print(f"{OKCYAN}[.xcon script] {line}{ENDC}")
-                __handle_prompt(line)
-            print(f"{OKGREEN}Execution of script '{OKCYAN}{SCRIPT}{OKGREEN}' done.{ENDC}")
-            return
-        except Exception as e:
-            print(f"{FAIL}Could not run script '{OKCYAN}{SCRIPT}{FAIL}'. Reason:\n\n{ENDC}{e}")
-            return
-    if prompt.startswith("python script"):
-        SCRIPT = prompt.removeprefix("python script ")
-        if not SCRIPT:
-            print(f"{WARNING}Please provide a script file to run.{ENDC}")
-            return
-        if not os.path.exists(SCRIPT):
-            print(f"{WARNING}Script file {SCRIPT} not found.{ENDC}")
-            return
-        if not SCRIPT.endswith(".py"):
-            print(f"{WARNING}Please run a script file with a .py file extension.{ENDC}")
+        if os.path.getsize(SCRIPT) == 0:
+            print(f"{FAIL}The script file '{OKCYAN}{SCRIPT}{FAIL}' is empty, please provide a script with a valid (set of) commands.{ENDC}")
             return
+    try:
+        for INSTRUCTION in __script_instructions(SCRIPT):
+            __run_instruction(*INSTRUCTION)
+        print(f"{OKGREEN}Execution of script '{OKCYAN}{'stdin' if SCRIPT == '-' else SCRIPT}{OKGREEN}' done.{ENDC}")
+        return
+    except Exception as e:
+        print(f"{FAIL}Could not run script '{OKCYAN}{SCRIPT}{FAIL}'. Reason:\n\n{ENDC}{e}")
+        return
+
+CODE_CACHE: dict = {} # Absolute path -> ((mtime, size), code object, global names it uses).
+
+def __code_names(CODE) -> set:
+    NAMES = set(CODE.co_names)
+    for CONST in CODE.co_consts:
+        if isinstance(CONST, types.CodeType):
+            NAMES |= __code_names(CONST)
+    return NAMES
+
+def __load_code(SCRIPT):
+    # Compiles a Python script once. The code object is kept in memory and marshalled into CODE_CACHE_DIR,
+    # both keyed by the path, mtime and size of the file, so an edited file is compiled again.
+    import hashlib
+    import marshal
+    import struct
+    PATH = os.path.abspath(SCRIPT)
+    STAT = os.stat(PATH)
+    KEY = (STAT.st_mtime_ns, STAT.st_size)
+    CACHED = CODE_CACHE.get(PATH)
+    if CACHED is not None and CACHED[0] == KEY:
+        return CACHED[1], CACHED[2]
+    CACHE_FILE = os.path.join(CODE_CACHE_DIR, hashlib.blake2b(os.path.normcase(PATH).encode(), digest_size=16).hexdigest() + ".bin")
+    HEADER = importlib.util.MAGIC_NUMBER + struct.pack("<qQ", *KEY)
+    CODE = None
+    try:
+        with open(CACHE_FILE, "rb") as f:
+            DATA = f.read()
+        if DATA.startswith(HEADER):
+            CODE = marshal.loads(DATA[len(HEADER):])
+    except (OSError, ValueError, EOFError, TypeError):
+        pass
+    if CODE is None:
+        with open(PATH, "rb") as f:
+            CODE = compile(f.read(), PATH, "exec")
         try:
-            with open(SCRIPT, "r") as f:
-                lines = f.read()
-                exec(lines, {"__name__": "__main__"})
-                print(f"{OKGREEN}Execution of script file {SCRIPT} succeeded.{ENDC}")
+            os.makedirs(CODE_CACHE_DIR, exist_ok=True)
+            TEMP = CACHE_FILE + ".tmp"
+            with open(TEMP, "wb") as f:
+                f.write(HEADER + marshal.dumps(CODE))
+            os.replace(TEMP, CACHE_FILE)
+        except OSError as e:
+            print(f"{WARNING}Compiled script could not be cached inside of {OKCYAN}{CODE_CACHE_DIR}{WARNING}. Reason:\n\n{ENDC}{e}")
+    CODE_CACHE[PATH] = (KEY, CODE, __code_names(CODE))
+    return CODE, CODE_CACHE[PATH][2]
+
+@__command("python script", bare=True)
+def __cmd_python_script(prompt: str, args: str):
+    SCRIPT = args
+    if not SCRIPT:
+        print(f"{WARNING}Please provide a script file to run.{ENDC}")
+        return
+    if not os.path.exists(SCRIPT):
+        print(f"{WARNING}Script file {SCRIPT} not found.{ENDC}")
+        return
+    if not SCRIPT.endswith(".py"):
+        print(f"{WARNING}Please run a script file with a .py file extension.{ENDC}")
+        return
+    try:
+        CODE, NAMES = __load_code(SCRIPT)
+        for varname in NAMES.intersection(VARS_INDEX):
+            __load_var(varname)
+        exec(CODE, {**DECLARELIST, **MODULES, "__name__": "__main__"})
+        print(f"{OKGREEN}Execution of script file {SCRIPT} succeeded.{ENDC}")
+        return
+    except Exception as e:
+        print(f"{FAIL}Could not run script {SCRIPT}. Reason:\n\n{ENDC}{e}")
+        return
+
+@__command("python run")
+def __cmd_python_run(prompt: str, args: str):
+    COMMAND = args
+    if COMMAND == "":
+        print(f"{WARNING}Please run a valid command.{ENDC}")
+        return
+    try:
+        print(f"{BOLD}Executing command '{COMMAND}'...{ENDC}")
+        __load_used_vars(COMMAND)
+        __exec_python(COMMAND)
+        print(f"{OKGREEN}Execution of command {COMMAND} succeeded.{ENDC}")
+        return
+    except Exception as e:
+        print(f"{FAIL}An exception has occurred while executing command '{COMMAND}.' Reason:\n\n{ENDC}{e}")
+        return
+
+@__command("python ctx", bare=True)
+def __cmd_python_ctx(prompt: str, args: str):
+    global PYTHON_CONTEXT, PYTHON_CONTEXT_NAME, EVAL_CONTEXT
+    ACTION, _, NAME = args.strip().partition(" ")
+    NAME = NAME.strip()
+    CURRENT = PYTHON_CONTEXTS[PYTHON_CONTEXT_NAME]
+    if ACTION == "list":
+        for CONTEXT in PYTHON_CONTEXTS.values():
+            SNAPSHOTS = f" {COMMENT}(snapshots: {', '.join(CONTEXT.snapshots)}){ENDC}" if CONTEXT.snapshots else ""
+            print(f"{OKGREEN if CONTEXT is CURRENT else OKCYAN}{CONTEXT.name}{ENDC}{SNAPSHOTS}")
+        return
+    if ACTION in ("snapshot", "restore"):
+        LABEL = NAME or "default"
+        if ACTION == "snapshot":
+            try:
+                CURRENT.snapshot(LABEL, {**DECLARELIST, **MODULES})
+            except Exception as e:
+                print(f"{FAIL}Could not snapshot context {CURRENT.name}. Reason:\n\n{ENDC}{e}")
                 return
-        except Exception as e:
-            print(f"{FAIL}Could not run script {SCRIPT}. Reason:\n\n{ENDC}{e}")
+            print(f"{OKGREEN}Saved snapshot {OKCYAN}{LABEL} {OKGREEN}of context {OKCYAN}{CURRENT.name}{OKGREEN}.{ENDC}")
+        elif CURRENT.restore(LABEL, {**DECLARELIST, **MODULES}):
+            EVAL_CONTEXT = None # Rebuilt from the restored namespace on the next evaluation.
+            print(f"{OKGREEN}Restored context {OKCYAN}{CURRENT.name} {OKGREEN}to snapshot {OKCYAN}{LABEL}{OKGREEN}.{ENDC}")
+        else:
+            print(f"{WARNING}Context {CURRENT.name} has no snapshot named {LABEL}.{ENDC}")
+        return
+    if ACTION not in ("new", "use", "del") or not NAME:
+        print(f"{WARNING}Usage: python ctx new|use|del <name>, python ctx snapshot|restore [label] or python ctx list.{ENDC}")
+        return
+    if ACTION == "new":
+        if NAME in PYTHON_CONTEXTS:
+            print(f"{WARNING}Context {NAME} already exists. Use {OKBLUE}python ctx use {OKCYAN}{NAME} {WARNING}to switch to it.{ENDC}")
             return
-    if prompt.startswith("python run "):
-        COMMAND = prompt.removeprefix("python run ")
-        if COMMAND == "":
-            print(f"{WARNING}Please run a valid command.{ENDC}")
+        PYTHON_CONTEXTS[NAME] = PythonContext(NAME, __context_base())
+    elif NAME not in PYTHON_CONTEXTS:
+        print(f"{WARNING}Context {NAME} does not exist. Use {OKBLUE}python ctx list {WARNING}to see the available contexts.{ENDC}")
+        return
+    if ACTION == "del":
+        if NAME == "main" or NAME == PYTHON_CONTEXT_NAME:
+            print(f"{FAIL}Cannot delete the main context or the context in use.{ENDC}")
             return
+        del PYTHON_CONTEXTS[NAME]
+        print(f"{OKGREEN}Deleted context {OKCYAN}{NAME}{OKGREEN}.{ENDC}")
+        return
+    PYTHON_CONTEXT_NAME = NAME
+    PYTHON_CONTEXT = PYTHON_CONTEXTS[NAME].namespace
+    EVAL_CONTEXT = None # check, echo and varmake follow the context in use.
+    print(f"{OKGREEN}{'Created and switched to' if ACTION == 'new' else 'Switched to'} context {OKCYAN}{NAME}{OKGREEN}.{ENDC}")
+
+@__command("python block !x")
+def __cmd_python_block(prompt: str, args: str):
+    BLOCK = prompt.startswith("python block !x ")
+    __run_python_block(prompt, BLOCK)
+    return
+
+@__command("cd", bare=True)
+def __cmd_cd(prompt: str, args: str):
+    print(f"{OKCYAN}Please use {OKBLUE}chgpath {OKCYAN}<path_name> {ENDC}instead.")
+    return
+
+@__command("cls", args=False, bare=True)
+def __cmd_cls(prompt: str, args: str):
+    print(f"{OKCYAN}Please use {OKBLUE}wipe {ENDC}instead.")
+    return
+
+@__command("exit", args=False, bare=True)
+def __cmd_exit(prompt: str, args: str):
+    print(f"{OKCYAN}Please use {OKBLUE}close {ENDC}instead.")
+    return
+
+@__command("process")
+def __cmd_process(prompt: str, args: str):
+    import subprocess
+    if prompt == "process shutdown":
+        print(f"{WARNING}The process command may be empty or incomplete. Try again.\n{ENDC}")
+        return
+    if "shutdown" in prompt:
+        cmd = ["shutdown"]
+        if "!r" in prompt:
+            cmd.append("/r")
+        elif "!s" in prompt:
+            cmd.append("/s")
+        elif "!h" in prompt:
+            cmd.append("/h")
+        if "!f" in prompt:
+            cmd.append("/f")
+        if "!fw" in prompt:
+            cmd.append("/fw")
+        if "!o" in prompt:
+            cmd.append("/o")
+        if "!i" in prompt:
+            cmd.append("/i")
+        if "!sf" in prompt:
+            cmd.append("/soft")
+        if "!e" in prompt:
+            cmd.append("/e")
+        if "!l" in prompt and "!h" in prompt:
+            cmd.append("/l")
+        if "!t" in prompt:
+            parts = prompt.split()
+            if "!t" in parts:
+                t_index = parts.index("!t")
+                if t_index + 1 < len(parts):
+                    seconds = parts[t_index + 1]
+                    cmd += ["/t", str(seconds)]
+        full_cmd = " ".join(cmd)
+        result = subprocess.run(full_cmd, shell=True, text=True, capture_output=True)
+        output = result.stdout.strip() + result.stderr.strip()
+        if output.startswith("Usage:"):
+            output = f"{YELLOW}This command didn't seem to work, please try again.{ENDC}"
+        print(output)
+        return
+    elif "sleep" in prompt:
+        subprocess.run("rundll32.exe powrprof.dll,SetSuspendState 0,1,0", shell=True)
+        return
+
+@__command("set volume")
+def __cmd_set_volume(prompt: str, args: str):
+    VOLUME = args
+    try:
+        __set_volume(VOLUME)
+        return
+    except Exception as e:
+        print(f"{FAIL}An exception occurred while attempting to set current volume to {VOLUME}. Reason:\n\n{ENDC}{e}")
+        return
+
+@__command("mute volume", args=False, bare=True)
+def __cmd_mute_volume(prompt: str, args: str):
+    try:
+        __set_volume(0)
+        return
+    except Exception as e:
+        print(f"{FAIL}An exception occurred while attempting to mute volume. Reason:\n\n{ENDC}{e}")
+        return
+
+SHELL_TIMEOUT = None # Seconds before console and shell commands are stopped, None to wait for them.
+SHELL_LINE_LIMIT = 1024 * 1024 # Longest output line read at once, longer lines are written in pieces of this size.
+SHELL_NOT_FOUND = (127, 9009) # Exit codes of sh and cmd.exe for an unknown command.
+ProcessResult = collections.namedtuple("ProcessResult", "returncode elapsed timed_out")
+
+async def __pump_stream(STREAM, OUT, ENCODING):
+    # readline() drops what it has buffered when a line is over the limit, so readuntil() is used instead,
+    # which leaves the buffer alone. The decoder keeps characters split between two pieces together.
+    import asyncio
+    import codecs
+    DECODER = codecs.getincrementaldecoder(ENCODING)(errors="replace")
+    while True:
         try:
-            print(f"{BOLD}Executing command '{COMMAND}'...{ENDC}")
-            exec(COMMAND, PYTHON_CONTEXT)
-            print(f"{OKGREEN}Execution of command {COMMAND} succeeded.{ENDC}")
+            line = await STREAM.readuntil(b"\n")
+        except asyncio.IncompleteReadError as e:
+            line = e.partial # Output that does not end in a newline.
+        except asyncio.LimitOverrunError as e:
+            line = await STREAM.read(e.consumed)
+        if not line:
+            OUT.write(DECODER.decode(b"", final=True))
+            OUT.flush()
+            return
+        OUT.write(DECODER.decode(line))
+        OUT.flush()
+
+async def __stop_process(PROC, TASK):
+    # Stops the whole process tree, so children of the shell do not keep running or keep the output pipes open.
+    import asyncio
+    import signal
+    import subprocess
+    if os.name == "nt":
+        subprocess.run(["taskkill", "/F", "/T", "/PID", str(PROC.pid)], capture_output=True)
+    else:
+        try:
+            os.killpg(PROC.pid, signal.SIGTERM)
+            await asyncio.wait_for(asyncio.shield(TASK), 2)
             return
-        except Exception as e:
-            print(f"{FAIL}An exception has occurred while executing command '{COMMAND}.' Reason:\n\n{ENDC}{e}")
+        except asyncio.TimeoutError:
+            os.killpg(PROC.pid, signal.SIGKILL)
+        except ProcessLookupError:
+            pass
+    await TASK
+
+async def __run_process_async(CMD, TIMEOUT):
+    import asyncio
+    import locale
+    START = time.perf_counter()
+    SESSION = {} if os.name == "nt" else {"start_new_session": True} # Own process group, so it can be stopped as a whole.
+    PROC = await asyncio.create_subprocess_shell(CMD, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE, limit=SHELL_LINE_LIMIT, cwd=__cwd(), **SESSION)
+    ENCODING = locale.getpreferredencoding(False)
+    TASK = asyncio.ensure_future(asyncio.gather(
+        __pump_stream(PROC.stdout, sys.stdout, ENCODING),
+        __pump_stream(PROC.stderr, sys.stderr, ENCODING),
+        PROC.wait(),
+    ))
+    try:
+        DONE, _ = await asyncio.wait({TASK}, timeout=TIMEOUT)
+    except asyncio.CancelledError:
+        await __stop_process(PROC, TASK) # Ctrl+C cancels the run, pass it on to the process.
+        raise
+    if not DONE:
+        await __stop_process(PROC, TASK)
+        return ProcessResult(PROC.returncode, time.perf_counter() - START, True)
+    TASK.result()
+    return ProcessResult(PROC.returncode, time.perf_counter() - START, False)
+
+def __run_process(CMD, TIMEOUT=None) -> ProcessResult:
+    # Runs a shell command, streaming its stdout and stderr line by line as they arrive instead of buffering them.
+    import asyncio
+    return asyncio.run(__run_process_async(CMD, TIMEOUT))
+
+@__command("console")
+def __cmd_console(prompt: str, args: str):
+    CMD = args.strip()
+    TIMEOUT = SHELL_TIMEOUT
+    if CMD.startswith("!timeout "):
+        SECONDS, _, CMD = CMD.removeprefix("!timeout ").strip().partition(" ")
+        try:
+            TIMEOUT = float(SECONDS)
+        except ValueError:
+            print(f"{WARNING}Please give the timeout in seconds. Example: {OKBLUE}console {YELLOW}!timeout {OKCYAN}30 make{ENDC}")
             return
-    if prompt.startswith("python block !x "):
-        BLOCK = prompt.startswith("python block !x ")
-        __run_python_block(prompt, BLOCK)
+        CMD = CMD.strip()
+    try:
+        print(f"{WARNING}Attempting to execute console command {OKCYAN}'{CMD}'{WARNING}...{ENDC}")
+        result = __run_process(CMD, TIMEOUT)
+        if result.timed_out:
+            print(f"{FAIL}Console command {OKCYAN}'{CMD}' {FAIL}was stopped after {TIMEOUT:g}s.{ENDC}")
+        elif result.returncode == 0:
+            print(f"{OKGREEN}Successfully ran console command {OKCYAN}'{CMD}'{OKGREEN} (took {result.elapsed:.2f}s).{ENDC}")
+        else:
+            print(f"{FAIL}Console command {OKCYAN}'{CMD}' {FAIL}exited with code {result.returncode} (took {result.elapsed:.2f}s).{ENDC}")
+        return
+    except KeyboardInterrupt:
+        print(f"{WARNING}Console command {OKCYAN}'{CMD}' {WARNING}was interrupted.{ENDC}")
+        return
+    except Exception as e:
+        print(f"{FAIL}An exception occurred while attempting to execute console command {OKCYAN}'{CMD}'{FAIL}. Reason:\n\n{ENDC}{e}")
+        return
+
+JOB_OUTPUT_LIMIT = 10000 # Output chunks kept per job, older ones are dropped.
+JOBS: dict = {} # Job id -> Job, in the order they were started.
+JOB_THREADS: dict = {} # Thread ident -> Job running on that thread.
+JOBS_LOCK = threading.Lock()
+JOB_INPUT_ERROR = "Background jobs cannot ask for input. Run the command without & instead."
+CONSOLE_INPUT = None # The original builtins.input, replaced by __job_input once the first job starts.
+
+class JobKilled(BaseException):
+    """Raised inside a job thread by kill <id>."""
+
+class Job:
+    """A command running on its own thread, with its output kept in a buffer until it is shown."""
+    __slots__ = ("id", "prompt", "cwd", "thread", "output", "written", "shown", "started", "elapsed", "status", "foreground", "reported", "lock")
+
+    def __init__(self, id, prompt):
+        self.id = id
+        self.prompt = prompt
+        self.cwd = os.getcwd() # Relative paths of the job resolve against the path it was started in.
+        self.thread = None
+        self.output = collections.deque(maxlen=JOB_OUTPUT_LIMIT)
+        self.written = 0
+        self.shown = 0
+        self.started = time.perf_counter()
+        self.elapsed = None
+        self.status = "running"
+        self.foreground = False
+        self.reported = False
+        self.lock = threading.Lock()
+
+    def write(self, text):
+        with self.lock:
+            if self.foreground:
+                self.written += 1
+                self.shown = self.written
+                return False # Caller writes it to the console.
+            self.output.append(text)
+            self.written += 1
+            return True
+
+    def take_output(self) -> str:
+        # Output written since the last call, minus anything dropped from the buffer.
+        with self.lock:
+            NEW = min(self.written - self.shown, len(self.output))
+            self.shown = self.written
+            return "".join(itertools.islice(self.output, len(self.output) - NEW, None))
+
+    def duration(self) -> float:
+        return self.elapsed if self.elapsed is not None else time.perf_counter() - self.started
+
+class JobStream:
+    """Stands in for sys.stdout/sys.stderr, sending what job threads write to their own buffer."""
+
+    def __init__(self, stream):
+        self.stream = stream
+
+    def write(self, text):
+        JOB = JOB_THREADS.get(threading.get_ident())
+        if JOB is None or not JOB.write(text):
+            return self.stream.write(text)
+        return len(text)
+
+    def flush(self):
+        if threading.get_ident() not in JOB_THREADS:
+            self.stream.flush()
+
+    def __getattr__(self, name):
+        return getattr(self.stream, name)
+
+class JobInput:
+    """Stands in for sys.stdin, so a job that asks for input fails instead of competing with the prompt."""
+
+    def __init__(self, stream):
+        self.stream = stream
+
+    def readline(self, *args):
+        if threading.get_ident() in JOB_THREADS:
+            raise EOFError(JOB_INPUT_ERROR)
+        return self.stream.readline(*args)
+
+    def __getattr__(self, name):
+        return getattr(self.stream, name)
+
+def __cwd() -> str:
+    # The process has one working directory, so a chgpath in the foreground would move the files a running job works on.
+    # Commands resolve their relative paths with this instead, which gives job threads the path they were started in.
+    JOB = JOB_THREADS.get(threading.get_ident())
+    return JOB.cwd if JOB is not None else os.getcwd()
+
+def __job_input(prompt: object = "") -> str:
+    # input() reads a terminal through readline without looking at sys.stdin, so a confirmation asked by a job
+    # (fdel, dirdel, empty bin, ...) has to be refused here, or it would compete with the console prompt.
+    if threading.get_ident() in JOB_THREADS:
+        raise EOFError(JOB_INPUT_ERROR)
+    return CONSOLE_INPUT(prompt)
+
+def __run_job(JOB: Job):
+    JOB_THREADS[threading.get_ident()] = JOB
+    try:
+        __dispatch_prompt(JOB.prompt)
+        JOB.status = "done"
+    except JobKilled:
+        JOB.status = "killed"
+    except SystemExit as e:
+        # Security aborts and close exit the console. A job cannot do that, but it did not finish its work either.
+        JOB.status = "failed"
+        print(f"{FAIL}Job {JOB.id} tried to exit XCon{f' with code {e.code}' if e.code else ''}. The console keeps running.{ENDC}")
+    except BaseException as e:
+        JOB.status = "failed"
+        print(f"{FAIL}Job {JOB.id} failed. Reason:\n\n{ENDC}{e}")
+    finally:
+        JOB.elapsed = time.perf_counter() - JOB.started
+        del JOB_THREADS[threading.get_ident()]
+
+def __start_job(prompt: str):
+    if not prompt:
+        print(f"{WARNING}Please put a command before {OKBLUE}&{WARNING}.{ENDC}")
         return
-    if prompt == "cd" or prompt.startswith("cd "):
-        print(f"{OKCYAN}Please use {OKBLUE}chgpath {OKCYAN}<path_name> {ENDC}instead.")
+    global CONSOLE_INPUT
+    with JOBS_LOCK:
+        if not isinstance(sys.stdout, JobStream):
+            sys.stdout = JobStream(sys.stdout)
+            sys.stderr = JobStream(sys.stderr)
+            sys.stdin = JobInput(sys.stdin)
+        if CONSOLE_INPUT is None:
+            import builtins
+            CONSOLE_INPUT = builtins.input
+            builtins.input = __job_input
+        JOB = Job(max(JOBS, default=0) + 1, prompt)
+        JOBS[JOB.id] = JOB
+    JOB.thread = threading.Thread(target=__run_job, args=(JOB,), name=f"xcon-job-{JOB.id}", daemon=True)
+    JOB.thread.start()
+    print(f"{OKCYAN}[{JOB.id}] {ENDC}{prompt}")
+
+def __report_jobs():
+    # Tells about jobs that finished since the last prompt, like a shell does.
+    for JOB in list(JOBS.values()):
+        if JOB.status != "running" and not JOB.reported:
+            JOB.reported = True
+            COLOR = OKGREEN if JOB.status == "done" else FAIL
+            print(f"{OKCYAN}[{JOB.id}] {COLOR}{JOB.status.capitalize()} {COMMENT}({JOB.duration():.2f}s){ENDC} {JOB.prompt}")
+
+def __find_job(args: str):
+    try:
+        JOB = JOBS.get(int(args.strip().lstrip("%")))
+    except ValueError:
+        JOB = None
+    if JOB is None:
+        print(f"{WARNING}There is no job {args.strip()}. Use {OKBLUE}jobs {WARNING}to see the job ids.{ENDC}")
+    return JOB
+
+@__command("jobs", args=False, bare=True)
+def __cmd_jobs(prompt: str, args: str):
+    if not JOBS:
+        print(f"{WARNING}No jobs have been started. Put {OKBLUE}&{WARNING} after a command to run it in the background.{ENDC}")
         return
-    if prompt == "cls":
-        print(f"{OKCYAN}Please use {OKBLUE}wipe {ENDC}instead.")
+    print(f"{OKCYAN}{'ID':<6}{'STATUS':<10}{'TIME':>10}  COMMAND{ENDC}")
+    for JOB in JOBS.values():
+        COLOR = OKCYAN if JOB.status == "running" else OKGREEN if JOB.status == "done" else FAIL
+        print(f"{JOB.id:<6}{COLOR}{JOB.status:<10}{ENDC}{JOB.duration():>9.2f}s  {JOB.prompt}")
+        JOB.reported = JOB.reported or JOB.status != "running"
+
+@__command("wait")
+def __cmd_wait(prompt: str, args: str):
+    JOB = __find_job(args)
+    if JOB is None:
         return
-    if prompt == "exit":
-        print(f"{OKCYAN}Please use {OKBLUE}close {ENDC}instead.")
+    try:
+        JOB.thread.join()
+    except KeyboardInterrupt:
+        print(f"{WARNING}Stopped waiting for job {JOB.id}. It keeps running in the background.{ENDC}")
         return
-    if prompt.startswith("process "):
-        if prompt == "process shutdown":
-            print(f"{WARNING}The process command may be empty or incomplete. Try again.\n{ENDC}")
-            return
-        if "shutdown" in prompt:
-            cmd = ["shutdown"]
-            if "!r" in prompt:
-                cmd.append("/r")
-            elif "!s" in prompt:
-                cmd.append("/s")
-            elif "!h" in prompt:
-                cmd.append("/h")
-            if "!f" in prompt:
-                cmd.append("/f")
-            if "!fw" in prompt:
-                cmd.append("/fw")
-            if "!o" in prompt:
-                cmd.append("/o")
-            if "!i" in prompt:
-                cmd.append("/i")
-            if "!sf" in prompt:
-                cmd.append("/soft")
-            if "!e" in prompt:
-                cmd.append("/e")
-            if "!l" in prompt and "!h" in prompt:
-                cmd.append("/l")
-            if "!t" in prompt:
-                parts = prompt.split()
-                if "!t" in parts:
-                    t_index = parts.index("!t")
-                    if t_index + 1 < len(parts):
-                        seconds = parts[t_index + 1]
-                        cmd += ["/t", str(seconds)]
-            full_cmd = " ".join(cmd)
-            result = subprocess.run(full_cmd, shell=True, text=True, capture_output=True)
-            output = result.stdout.strip() + result.stderr.strip()
-            if output.startswith("Usage:"):
-                output = f"{YELLOW}This command didn't seem to work, please try again.{ENDC}"
-            print(output)
-            return
-        elif "sleep" in prompt:
-            subprocess.run("rundll32.exe powrprof.dll,SetSuspendState 0,1,0", shell=True)
-            return
-    if prompt.startswith("set volume "):
-        VOLUME = prompt.removeprefix("set volume ")
-        try:
-            __set_volume(VOLUME)
-            return
-        except Exception as e:
-            print(f"{FAIL}An exception occurred while attempting to set current volume to {VOLUME}. Reason:\n\n{ENDC}{e}")
-            return
-    if prompt == "mute volume":
-        try:
-            __set_volume(0)
-            return
-        except Exception as e:
-            print(f"{FAIL}An exception occurred while attempting to mute volume. Reason:\n\n{ENDC}{e}")
-            return
-    if prompt.startswith("console "):
-        CMD = prompt.removeprefix("console ").strip()
-        try:
-            print(f"{WARNING}Attempting to execute console command {OKCYAN}'{CMD}'{WARNING}...{ENDC}")
-            result = subprocess.run(CMD, shell=True, text=True, capture_output=True)
-            if result.returncode == 0:
-                print(result.stdout)
-                print(f"{OKGREEN}Successfully ran console command {OKCYAN}'{CMD}'{OKGREEN}.{ENDC}")
-            return
-        except Exception as e:
-            print(f"{FAIL}An exception occurred while attempting to execute console command {OKCYAN}'{CMD}'{FAIL}. Reason:\n\n{ENDC}{e}")
-            return
-    if prompt.startswith("fmake "):
-        FILE = prompt.removeprefix("fmake ").strip()
-        WRITE = "^ "
-        if WRITE in FILE:
-            path_part, CONTENT = FILE.split(WRITE, 1)
-            path_part = path_part.strip()
-            CONTENT = CONTENT.strip()
-        else:
-            path_part = FILE
-            CONTENT = ""
-        append = False
-        if CONTENT.endswith("| !append"):
-            append = True
-            CONTENT = CONTENT[:-len("| !append")].rstrip()
-        elif CONTENT.endswith("!append"):
-            append = True
-            CONTENT = CONTENT[:-len("!append")].rstrip()
-        if not prompt.endswith(" !nodef"):
-            print(f"{WARNING}No file extension given, defaulting to .txt file extension.{ENDC}")
-            if not path_part.endswith(".txt"):
-                path_part += ".txt"
-            else:
-                pass
+    print(JOB.take_output(), end="")
+    JOB.reported = False
+    __report_jobs()
+
+@__command("fg")
+def __cmd_fg(prompt: str, args: str):
+    JOB = __find_job(args)
+    if JOB is None:
+        return
+    with JOB.lock:
+        JOB.foreground = True
+    print(JOB.take_output(), end="")
+    try:
+        JOB.thread.join()
+    except KeyboardInterrupt:
+        print(f"\n{WARNING}Job {JOB.id} has been sent back to the background.{ENDC}")
+        return
+    finally:
+        with JOB.lock:
+            JOB.foreground = False
+    JOB.reported = False
+    __report_jobs()
+
+@__command("kill")
+def __cmd_kill(prompt: str, args: str):
+    ID = args.strip().lstrip("%")
+    if not ID.isdigit() or int(ID) not in JOBS:
+        __run_shell(prompt) # Not a job id, so it is meant for the kill of the system shell.
+        return
+    JOB = JOBS[int(ID)]
+    if JOB.status != "running":
+        print(f"{WARNING}Job {JOB.id} has already finished ({JOB.status}).{ENDC}")
+        return
+    # Raises JobKilled in the job thread as soon as it runs Python code again. A call blocked in C code finishes first.
+    import ctypes
+    THREAD = ctypes.c_ulong(JOB.thread.ident)
+    FOUND = ctypes.pythonapi.PyThreadState_SetAsyncExc(THREAD, ctypes.py_object(JobKilled))
+    if FOUND > 1:
+        ctypes.pythonapi.PyThreadState_SetAsyncExc(THREAD, ctypes.py_object(None)) # Should never match several threads, undo it.
+    if FOUND != 1:
+        print(f"{FAIL}Job {JOB.id} could not be stopped, its thread {'was not found' if FOUND == 0 else 'could not be told apart'}.{ENDC}")
+        return
+    print(f"{WARNING}Job {JOB.id} will stop at its next step.{ENDC}")
+
+# Only a flag at the end counts (possibly followed by the other flags), so content that mentions "!repeat 5" is written as is.
+FMAKE_REPEAT_PATTERN = re.compile(r"(?:\|\s*)?!repeat\s+(\d+)(?=(?:\s*(?:\|\s*)?!(?:append|nodef))*\s*$)")
+
+def __write_repeated(f, TEXT, REPEAT):
+    # Writes TEXT REPEAT times in blocks of about COPY_CHUNK characters, so big fixtures take few write calls.
+    if not TEXT or REPEAT < 1:
+        return
+    PER_BLOCK = max(1, COPY_CHUNK // len(TEXT))
+    BLOCK = TEXT * min(PER_BLOCK, REPEAT)
+    FULL, REST = divmod(REPEAT, min(PER_BLOCK, REPEAT))
+    for _ in range(FULL):
+        f.write(BLOCK)
+    if REST:
+        f.write(TEXT * REST)
+
+@__command("fmake")
+def __cmd_fmake(prompt: str, args: str):
+    import shutil
+    FILE = args.strip()
+    REPEAT = 1
+    MATCH = FMAKE_REPEAT_PATTERN.search(FILE)
+    if MATCH:
+        REPEAT = int(MATCH.group(1))
+        FILE = (FILE[:MATCH.start()] + FILE[MATCH.end():]).strip()
+    SOURCE = None
+    WRITE = "^ "
+    if "^< " in FILE:
+        path_part, CONTENT = FILE.split("^< ", 1)
+        path_part = path_part.strip()
+        CONTENT = CONTENT.strip()
+        SOURCE = True
+    elif WRITE in FILE:
+        path_part, CONTENT = FILE.split(WRITE, 1)
+        path_part = path_part.strip()
+        CONTENT = CONTENT.strip()
+    else:
+        path_part = FILE
+        CONTENT = ""
+    append = False
+    if CONTENT.endswith("| !append"):
+        append = True
+        CONTENT = CONTENT[:-len("| !append")].rstrip()
+    elif CONTENT.endswith("!append"):
+        append = True
+        CONTENT = CONTENT[:-len("!append")].rstrip()
+    if not FILE.endswith(" !nodef"):
+        print(f"{WARNING}No file extension given, defaulting to .txt file extension.{ENDC}")
+        if not path_part.endswith(".txt"):
+            path_part += ".txt"
         else:
-            path_part = path_part.removesuffix(" !nodef")
             pass
-        if CONTENT.endswith("!nodef"):
-                CONTENT = CONTENT[:-len("!nodef")].rstrip()
-        elif CONTENT.endswith("| !nodef"):
-            CONTENT = CONTENT[:-len("| !nodef")].rstrip()
-        PATH = os.path.join(os.getcwd(), path_part)
-        mode = "a" if append else "w"
-        try:
+    else:
+        path_part = path_part.removesuffix(" !nodef")
+        pass
+    if CONTENT.endswith("!nodef"):
+            CONTENT = CONTENT[:-len("!nodef")].rstrip()
+    elif CONTENT.endswith("| !nodef"):
+        CONTENT = CONTENT[:-len("| !nodef")].rstrip()
+    if SOURCE:
+        SOURCE, CONTENT = CONTENT, ""
+        if SOURCE in ("-", "stdin") and REPEAT > 1:
+            print(f"{WARNING}{OKCYAN}!repeat{WARNING} cannot be used when reading from stdin.{ENDC}")
+            return
+        if SOURCE not in ("-", "stdin"):
+            SOURCE_NAME, SOURCE = SOURCE, os.path.join(__cwd(), SOURCE)
+            if not os.path.isfile(SOURCE):
+                print(f"{WARNING}Source file {SOURCE_NAME} does not exist.{ENDC}")
+                return
+    PATH = os.path.join(__cwd(), path_part)
+    if SOURCE and os.path.abspath(SOURCE) == os.path.abspath(PATH):
+        print(f"{WARNING}A file cannot be written from itself.{ENDC}")
+        return
+    mode = "a" if append else "w"
+    try:
+        if SOURCE:
+            with open(PATH, mode + "b") as f:
+                if SOURCE in ("-", "stdin"):
+                    print(f"{OKCYAN}Reading content from stdin, end it with {OKBLUE}{'Ctrl+Z, Enter' if os.name == 'nt' else 'Ctrl+D'}{OKCYAN}.{ENDC}")
+                    shutil.copyfileobj(sys.stdin.buffer, f, COPY_CHUNK)
+                else:
+                    with open(SOURCE, "rb") as src:
+                        for _ in range(REPEAT):
+                            src.seek(0)
+                            shutil.copyfileobj(src, f, COPY_CHUNK)
+        else:
             with open(PATH, mode, encoding="utf-8") as f:
                 if CONTENT:
                     PLACEHOLDER = "__PIPE__"
                     temp_content = CONTENT.replace("||", PLACEHOLDER)
                     lines = temp_content.split("|")
-                    lines = [line.replace(PLACEHOLDER, "|").strip() for line in lines]
-                    for line in lines:
-                        f.write(line + "\n" if CONTENT else "")
-            ACTION = "appended to" if append else "written to"
-            print(f"{OKGREEN}File {os.path.basename(PATH)} successfully {ACTION} at {PATH}.")
-            return
-        except Exception as e:
-            print(f"{FAIL}Failed to write file {PATH}. Reason:\n\n{ENDC}{e}")
-        return
-    if prompt.startswith("fdel "):
-        FILE = prompt.removeprefix("fdel ")
-        if not prompt.endswith(" !nodef"):
-            if not os.path.splitext(FILE)[1]:
-                print(f"{WARNING}No file extension given, defaulting to .txt file extension.{ENDC}")
-                FILE += ".txt"
-            else:
+                    TEXT = "".join(line.replace(PLACEHOLDER, "|").strip() + "\n" for line in lines)
+                    __write_repeated(f, TEXT, REPEAT)
+        ACTION = "appended to" if append else "written to"
+        print(f"{OKGREEN}File {os.path.basename(PATH)} successfully {ACTION} at {PATH}.")
+        return
+    except Exception as e:
+        print(f"{FAIL}Failed to write file {PATH}. Reason:\n\n{ENDC}{e}")
+    return
+
+def __expand_pattern(PATTERN) -> list:
+    # Expands a pattern like "build/*/x.obj" the same way fcopy does, keeping files and links but no folders.
+    import glob
+    return [os.path.abspath(PATH) for PATH in glob.glob(os.path.join(__cwd(), PATTERN)) if os.path.islink(PATH) or not os.path.isdir(PATH)]
+
+@__command("fdel")
+def __cmd_fdel(prompt: str, args: str):
+    import glob
+    NODEF = prompt.endswith(" !nodef")
+    PATTERNS = args.removesuffix(" !nodef").split() if NODEF else args.split()
+    FILES = {}
+    for FILE in PATTERNS:
+        if glob.has_magic(FILE):
+            MATCHES = __expand_pattern(FILE)
+            if not MATCHES:
+                print(f"{WARNING}No files matching {FILE} found.{ENDC}")
+            for PATH in MATCHES:
+                FILES[PATH] = os.path.relpath(PATH, __cwd())
+            continue
+        if not NODEF and not os.path.splitext(FILE)[1]:
+            print(f"{WARNING}No file extension given, defaulting to .txt file extension.{ENDC}")
+            FILE += ".txt"
+        PATH = os.path.join(__cwd(), FILE)
+        if not os.path.isfile(PATH) and not os.path.islink(PATH):
+            print(f"{WARNING}File {FILE} does not exist or is not accessible.{ENDC}")
+            continue
+        FILES[os.path.abspath(PATH)] = FILE
+    if not FILES:
+        return
+    try:
+        print(f"{WARNING}[XCON_SECURITY] Checking {len(FILES)} {'path' if len(FILES) == 1 else 'paths'}...{ENDC}")
+        FLAGGED = PATH_GUARD.check_many(FILES)
+        if FLAGGED:
+            print(f"{FAIL}Tried to delete a file in a sensitive directory, as {OKCYAN}{', '.join(FILES[PATH] for PATH in FLAGGED[:5])} {FAIL}in {OKCYAN}{os.path.dirname(FLAGGED[0])} {FAIL}is a Windows and/or critical program file. Exiting XCon console for optimal safety.{ENDC}")
+            time.sleep(2.0)
+            sys.exit(-1)
+        SIZE = 0
+        for PATH in FILES:
+            try:
+                SIZE += os.lstat(PATH).st_size
+            except OSError:
                 pass
-        else:
-            FILE = FILE.removesuffix(" !nodef").strip()
-        PATH = os.path.join(os.getcwd(), FILE)
-        try:
-            if not os.path.exists(PATH):
-                print(f"{WARNING}File {FILE} does not exist or is not accessible.{ENDC}")
+        TARGET = f"file {next(iter(FILES.values()))}" if len(FILES) == 1 else f"{len(FILES)} files ({__format_size(SIZE)})"
+        CONFIRM = input(f"{OKCYAN}Are you sure you want to remove {TARGET}? {OKGREEN}[y]{COMMENT}/{FAIL}[n]{ENDC} ").strip()
+        if CONFIRM.lower() == "y":
+            if len(FILES) == 1:
+                FILE, PATH = next(iter(FILES.values())), next(iter(FILES))
+                try:
+                    os.remove(PATH)
+                    print(f"{OKGREEN}File {FILE} at {PATH} successfully removed.{ENDC}")
+                except Exception as e:
+                    print(f"{FAIL}File {FILE} could not be removed. Reason:\n\n{ENDC}{e}")
                 return
-            if __is_protected(FILE):
-                print(f"{FAIL}Tried to delete a file in a sensitive directory, as {OKCYAN}{FILE} {FAIL}in {OKCYAN}{PATH} {FAIL}is a Windows and/or critical program file. Exiting XCon console for optimal safety.{ENDC}")
-                time.sleep(2.0)
-                sys.exit(-1)
-            else:
-                CONFIRM = input(f"{OKCYAN}Are you sure you want to remove file {FILE}? {OKGREEN}[y]{COMMENT}/{FAIL}[n]{ENDC} ").strip()
-                if CONFIRM.lower() == "y":
-                    try:
-                        os.remove(PATH)
-                        print(f"{OKGREEN}File {FILE} at {PATH} successfully removed.{ENDC}")
-                    except Exception as e:
-                        print(f"{FAIL}File {FILE} could not be removed. Reason:\n\n{ENDC}{e}")
-                    return
-                elif CONFIRM.lower() == "n":
-                    print(f"{OKCYAN}Deletion of file {FILE} stopped.{ENDC}")
-                    return
-                else:
-                    print(f"{WARNING}{CONFIRM} is not a valid answer, defaulting to deletion stop.{ENDC}")
-                    return
-        except Exception as e:
-            print(f"{FAIL}File {FILE} could not be removed. Reason:\n\n{ENDC}{e}")
+            if __remove_tree(list(FILES), [], SIZE):
+                print(f"{OKGREEN}{len(FILES)} files successfully removed.{ENDC}")
             return
-    if prompt.startswith("fcopy "):
-        ARGS = prompt.removeprefix("fcopy ").strip().split()
-        if len(ARGS) < 1:
-            print(f"{WARNING}Please setup the command properly. Usage: {OKBLUE}fcopy {OKCYAN}source_file dest_file{ENDC}")
+        elif CONFIRM.lower() == "n":
+            print(f"{OKCYAN}Deletion of {TARGET} stopped.{ENDC}")
             return
-        FILE = ARGS[0]
-        NEWDIR = os.path.join(os.getcwd(), "copy") if not len(ARGS) < 2 else ARGS[1]
-        if len(ARGS) > 1 and ARGS[1]:
-            NEWDIR = ARGS[1]
-        if not prompt.endswith(" !nodef"):
-            if not os.path.splitext(FILE)[1]:
-                print(f"{WARNING}!nodef not included and no file extension has been given, defaulting to .txt file extension.{ENDC}")
-                FILE += ".txt"
-        if not os.path.exists(FILE):
-            print(f"{WARNING}File {FILE} does not exist.{ENDC}")
+        else:
+            print(f"{WARNING}{CONFIRM} is not a valid answer, defaulting to deletion stop.{ENDC}")
             return
-        try:
-            if os.path.exists(NEWDIR):
-                print(f"{WARNING}{NEWDIR} already exists, choosing other generated directory name.{ENDC}")
-                for i in range(1, 21):
-                    NEWDIR_ITER = f"{NEWDIR}_{i}"
-                    if not os.path.exists(NEWDIR_ITER):
-                        os.makedirs(NEWDIR_ITER)
-                        NEWDIR = NEWDIR_ITER
-                        break
+    except Exception as e:
+        print(f"{FAIL}{'File' if len(FILES) == 1 else 'Files'} {', '.join(FILES.values())} could not be removed. Reason:\n\n{ENDC}{e}")
+        return
+
+COPY_CHUNK = 8 * 1024 * 1024
+
+def __print_progress(NAME, DONE, TOTAL, START):
+    ELAPSED = max(time.perf_counter() - START, 1e-6)
+    PERCENT = f"{DONE / TOTAL * 100:5.1f}%" if TOTAL else "100.0%"
+    print(f"\r{OKCYAN}{NAME}: {PERCENT} ({__format_size(DONE)} / {__format_size(TOTAL)}, {DONE / 1024 / 1024 / ELAPSED:.1f} MB/s){ENDC}   ", end="", flush=True)
+
+def __copy_file(SRC, DST, progress=True) -> int:
+    # Copies in COPY_CHUNK steps, inside the kernel (copy_file_range, then sendfile) where the OS supports it,
+    # and through one reused buffer elsewhere. Memory use doesn't depend on the size of the file.
+    SIZE = os.path.getsize(SRC)
+    NAME = os.path.basename(SRC)
+    START = time.perf_counter()
+    SHOWN = progress and SIZE > COPY_CHUNK
+    LAST_SHOWN = START
+    DONE = 0
+    with open(SRC, "rb") as fsrc, open(DST, "wb") as fdst:
+        for COPY in ("copy_file_range", "sendfile"):
+            if DONE or not hasattr(os, COPY) or not sys.platform.startswith("linux"):
+                continue
+            try:
+                while True:
+                    if COPY == "copy_file_range":
+                        SENT = os.copy_file_range(fsrc.fileno(), fdst.fileno(), COPY_CHUNK)
                     else:
-                        print(f"{WARNING}New directory {NEWDIR_ITER} already exists, choosing other directory name.")
-                    if i == 21:
-                        print(f"{FAIL}Creating non-existing directory failed, as all the directory names generated were already existing.\nPlease try again.{ENDC}")
-                        return
-            else:
-                os.makedirs(NEWDIR)
-            DST_PATH = os.path.join(NEWDIR, FILE)
-            with open(FILE, "rb") as srcf:
-                data = srcf.read()
-            with open(DST_PATH, "wb") as dstf:
-                dstf.write(data)
-            if "/" in DST_PATH:
-                READ_DST = DST_PATH.replace("/", "\\")
-            else:
-                READ_DST = DST_PATH
-            print(f"{OKGREEN}File successfully {FILE} copied to directory {READ_DST}.{ENDC}")
-        except Exception as e:
-            print(f"{FAIL}An error has occurred while trying to copy file {FILE} to directory {READ_DST}. Reason:\n\n{ENDC}{e}")
+                        SENT = os.sendfile(fdst.fileno(), fsrc.fileno(), None, COPY_CHUNK)
+                    if not SENT:
+                        break
+                    DONE += SENT
+                    if SHOWN and time.perf_counter() - LAST_SHOWN > 0.1:
+                        LAST_SHOWN = time.perf_counter()
+                        __print_progress(NAME, DONE, SIZE, START)
+            except OSError:
+                if DONE:
+                    raise
+        if not DONE:
+            BUFFER = bytearray(COPY_CHUNK)
+            VIEW = memoryview(BUFFER)
+            while COUNT := fsrc.readinto(BUFFER):
+                fdst.write(VIEW[:COUNT])
+                DONE += COUNT
+                if SHOWN and time.perf_counter() - LAST_SHOWN > 0.1:
+                    LAST_SHOWN = time.perf_counter()
+                    __print_progress(NAME, DONE, SIZE, START)
+    if SHOWN:
+        __print_progress(NAME, DONE, SIZE, START)
+        print()
+    return DONE
+
+@__command("fcopy")
+def __cmd_fcopy(prompt: str, args: str):
+    import glob
+    NODEF = prompt.endswith(" !nodef")
+    ARGS = args.strip().removesuffix("!nodef").split()
+    if len(ARGS) < 1:
+        print(f"{WARNING}Please setup the command properly. Usage: {OKBLUE}fcopy {OKCYAN}source_file [source_file ...] dest_dir{ENDC}")
         return
-    if prompt.startswith("dirmake "):
-        DIR = prompt.removeprefix("dirmake ").strip()
-        PATH = os.path.join(os.getcwd(), DIR)
-        if not DIR:
-            print(f"{WARNING}Please input a valid directory name.{ENDC}")
-            return
-        if os.path.exists(DIR):
-            print(f"{OKCYAN}Directory {DIR} already exists at {PATH}. Overwriting directory {DIR}.{ENDC}")
-        try:
-            os.makedirs(PATH, exist_ok=True)
-            print(f"{OKGREEN}Directory '{DIR}' created successfully at {PATH}.{ENDC}")
-        except Exception as e:
-            print(f"{FAIL}Failed to create directory '{DIR}'. Reason:\n\n{ENDC}{e}")
+    BASE = __cwd()
+    NEWDIR = os.path.join(BASE, "copy")
+    if len(ARGS) > 1:
+        NEWDIR = os.path.join(BASE, ARGS.pop())
+    FILES = []
+    for FILE in ARGS:
+        if glob.has_magic(FILE):
+            MATCHES = [m for m in glob.glob(FILE, root_dir=BASE) if os.path.isfile(os.path.join(BASE, m))]
+            if not MATCHES:
+                print(f"{WARNING}No files matching {FILE} found.{ENDC}")
+            FILES.extend(MATCHES)
+            continue
+        if not NODEF and not os.path.splitext(FILE)[1]:
+            print(f"{WARNING}!nodef not included and no file extension has been given, defaulting to .txt file extension.{ENDC}")
+            FILE += ".txt"
+        if not os.path.isfile(os.path.join(BASE, FILE)):
+            print(f"{WARNING}File {FILE} does not exist.{ENDC}")
+            continue
+        FILES.append(FILE)
+    if not FILES:
         return
-    if prompt.startswith("dirdel "):
-        DIR = prompt.removeprefix("dirdel ").strip()
-        if not DIR:
-            print(f"{WARNING}Please input a valid directory name.{ENDC}")
-            return
-        try:
-            if DIR == "current":
-                TARGET_PATH = os.getcwd()
-                last_dirname = os.path.basename(TARGET_PATH)
-                if __is_sensitive(TARGET_PATH, True):
-                    print(f"{FAIL}ACCESS DENIED: Tried to remove sensitive or protected directory, as the sensitive directory {OKCYAN}{TARGET_PATH} {FAIL}was targeted for deletion.\nExiting XCon Console for optimal safety.{ENDC}")
-                    time.sleep(1.5)
-                    sys.exit(-1)
-                if TARGET_PATH == os.path.dirname(sys.executable if getattr(sys, 'frozen', False) else __file__):
-                    print(f"{FAIL}ACCESS DENIED: Tried to self destruct distribution folder where program is running.\nExiting XCon Console for optimal safety.{ENDC}")
-                    time.sleep(1.5)
-                    sys.exit(-1)
-                CONFIRM = input(f"{OKCYAN}Are you sure you want to remove the current directory {last_dirname}? {OKGREEN}[y]{COMMENT}/{FAIL}[n]{ENDC} ").strip()
-                if CONFIRM.lower() == "y":
-                    print(f"{WARNING}Removing current directory {TARGET_PATH}...{ENDC}")
-                    shutil.rmtree(TARGET_PATH)
-                    print(f"{OKGREEN}Directory {last_dirname} removed successfully.{ENDC}")
-                    return
-                elif CONFIRM.lower() == "n":
-                    print(f"{OKCYAN}Deletion of directory {last_dirname} stopped.{ENDC}")
-                    return
+    READ_DST = NEWDIR
+    try:
+        if os.path.exists(NEWDIR):
+            print(f"{WARNING}{NEWDIR} already exists, choosing other generated directory name.{ENDC}")
+            for i in range(1, 21):
+                NEWDIR_ITER = f"{NEWDIR}_{i}"
+                if not os.path.exists(NEWDIR_ITER):
+                    os.makedirs(NEWDIR_ITER)
+                    NEWDIR = NEWDIR_ITER
+                    break
                 else:
-                    print(f"{WARNING}{CONFIRM} is not a valid answer, defaulting to deletion stop.{ENDC}")
-                    return
+                    print(f"{WARNING}New directory {NEWDIR_ITER} already exists, choosing other directory name.")
             else:
-                TARGET_PATH = os.path.join(os.getcwd(), DIR)
-                if not os.path.exists(TARGET_PATH):
-                    print(f"{WARNING}Directory {DIR} does not exist. Please try again.{ENDC}")
-                    return
-                if __is_sensitive(TARGET_PATH, True):
-                    print(f"{FAIL}ACCESS DENIED: Tried to remove sensitive or protected directory, as the sensitive directory {OKCYAN}{TARGET_PATH} {FAIL}was targeted for deletion.\nExiting XCon Console for optimal safety.{ENDC}")
-                    time.sleep(1.5)
-                    sys.exit(-1)
-                CONFIRM = input(f"{OKCYAN}Are you sure you want to remove the directory {DIR}? {OKGREEN}[y]{COMMENT}/{FAIL}[n]{ENDC} ").strip()
-                if CONFIRM.lower() == "y":
-                    print(f"{WARNING}Removing directory {TARGET_PATH}...{ENDC}")
-                    shutil.rmtree(TARGET_PATH)
-                    print(f"{OKGREEN}Directory {DIR} at {TARGET_PATH} removed successfully.{ENDC}")
-                    return
-                elif CONFIRM.lower() == "n":
-                    print(f"{OKCYAN}Deletion of directory {DIR} stopped.{ENDC}")
-                    return
-                else:
-                    print(f"{WARNING}{CONFIRM} is not a valid answer, defaulting to deletion stop.{ENDC}")
-                    return
-        except Exception as e:
-            print(f"{FAIL}An exception has occurred while removing directory '{DIR}'. Reason:\n\n{ENDC}{e}")
-        return
-    if prompt.startswith("dircopy "):
-        DIRS = prompt.removeprefix("dircopy ")
-        DIR = DIRS.split(maxsplit=1)
-        SRC = DIR[0]
-        if len(DIR) < 2:
-            DEST = f"{SRC}_dir"
-            print(f"{WARNING}No second directory given, using alternative destination folder: {OKCYAN}{DEST}{WARNING}.{ENDC}")
+                print(f"{FAIL}Creating non-existing directory failed, as all the directory names generated were already existing.\nPlease try again.{ENDC}")
+                return
         else:
-            DEST = DIR[1]
-        DST_CHILD = os.path.join(DEST, os.path.basename(SRC))
-        for d in DIR:
-            if not os.path.exists(d):
-                if d == DST_CHILD:
-                    print(f"{WARNING}Directory {OKCYAN}{d} {WARNING}does not exist, creating folder {OKCYAN}{d}{WARNING}...{ENDC}")
-                    os.makedirs(d)
-                    print(f"{OKGREEN}Directory {OKCYAN}{d} {OKGREEN}successfully created.{ENDC}")
-                    continue
+            os.makedirs(NEWDIR)
+        READ_DST = NEWDIR.replace("/", "\\") if os.name == "nt" else NEWDIR
+        START = time.perf_counter()
+        COPIED = 0
+        TOTAL = 0
+        for FILE in FILES:
+            DST_PATH = os.path.join(NEWDIR, os.path.basename(FILE))
+            try:
+                TOTAL += __copy_file(os.path.join(BASE, FILE), DST_PATH)
+                COPIED += 1
+                print(f"{OKGREEN}File successfully {FILE} copied to directory {READ_DST}.{ENDC}")
+            except OSError as e:
+                print(f"{FAIL}An error has occurred while trying to copy file {FILE} to directory {READ_DST}. Reason:\n\n{ENDC}{e}")
+        ELAPSED = time.perf_counter() - START
+        if COPIED:
+            print(f"{OKCYAN}Copied {COPIED} {'file' if COPIED == 1 else 'files'} ({__format_size(TOTAL)}) in {ELAPSED:.2f}s at {TOTAL / 1024 / 1024 / max(ELAPSED, 1e-6):.1f} MB/s.{ENDC}")
+    except Exception as e:
+        print(f"{FAIL}An error has occurred while trying to copy {'file' if len(FILES) == 1 else 'files'} {', '.join(FILES)} to directory {READ_DST}. Reason:\n\n{ENDC}{e}")
+    return
+
+@__command("dirmake")
+def __cmd_dirmake(prompt: str, args: str):
+    DIR = args.strip()
+    PATH = os.path.join(__cwd(), DIR)
+    if not DIR:
+        print(f"{WARNING}Please input a valid directory name.{ENDC}")
+        return
+    if os.path.exists(PATH):
+        print(f"{OKCYAN}Directory {DIR} already exists at {PATH}. Overwriting directory {DIR}.{ENDC}")
+    try:
+        os.makedirs(PATH, exist_ok=True)
+        print(f"{OKGREEN}Directory '{DIR}' created successfully at {PATH}.{ENDC}")
+    except Exception as e:
+        print(f"{FAIL}Failed to create directory '{DIR}'. Reason:\n\n{ENDC}{e}")
+    return
+
+DELETE_BATCH = 256 # Files removed per task on the dirdel worker pool.
+
+def __scan_for_delete(PATH):
+    # Lists every file (and link) and folder in the tree without following links. Folders come with their depth,
+    # so they can be removed bottom-up once they are empty.
+    FILES = []
+    DIRS = [(0, PATH)]
+    SIZE = 0
+    STACK = [(0, PATH)]
+    while STACK:
+        DEPTH, DIR = STACK.pop()
+        with os.scandir(DIR) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    DIRS.append((DEPTH + 1, entry.path))
+                    STACK.append((DEPTH + 1, entry.path))
                 else:
-                    print(f"{WARNING}Directory {OKCYAN}{d} {WARNING}does not exist, Please input a valid directory name.{ENDC}")
-                return
-        if os.path.abspath(SRC) == os.path.abspath(DST_CHILD):
-            print(f"{WARNING}You cannot copy the same directory into itself.{ENDC}")
-            return
-        if not SRC or not DST_CHILD:
-            print(f"{WARNING}Setup failed. Please input 2 different directories, for example: dircopy folder1 folder2{ENDC}")
-            return
-        try:
-            shutil.copytree(SRC, DST_CHILD, dirs_exist_ok=True)
-            print(f"{OKGREEN}{OKCYAN}{SRC} {OKGREEN}has successfully been copied into {OKCYAN}{DEST} {OKGREEN}as {OKCYAN}{os.path.basename(SRC)}{OKGREEN}.{ENDC}")
-            return
-        except Exception as e:
-            print(f"{FAIL}An exception has occurred while copying directory {OKCYAN}{SRC} into {DEST}. Reason:\n\n{ENDC}{e}")
-            return
-    if prompt.startswith("varmake "):
-        VARDECL = prompt.removeprefix("varmake ").strip()
+                    FILES.append(entry.path)
+                    try:
+                        SIZE += entry.stat(follow_symlinks=False).st_size
+                    except OSError:
+                        pass
+    return FILES, DIRS, SIZE
+
+def __unlink_batch(PATHS, CANCEL):
+    REMOVED = 0
+    FAILED = []
+    for path in PATHS:
+        if CANCEL.is_set():
+            break
         try:
-            if "set" not in VARDECL:
-                print(f"{WARNING}Invalid variable setup. Example: varmake x set 1{ENDC}")
+            try:
+                os.unlink(path)
+            except PermissionError:
+                os.chmod(path, stat.S_IWRITE) # Read-only files on Windows.
+                os.unlink(path)
+            REMOVED += 1
+        except FileNotFoundError:
+            REMOVED += 1
+        except OSError as e:
+            FAILED.append((path, e))
+    return REMOVED, FAILED
+
+def __remove_tree(FILES, DIRS, SIZE) -> bool:
+    # Removes the files of a scanned tree in parallel, then the folders deepest first. Ctrl+C stops between files.
+    from concurrent.futures import ThreadPoolExecutor, as_completed
+    START = time.perf_counter()
+    CANCEL = threading.Event()
+    REMOVED = 0
+    FAILED = []
+    pool = ThreadPoolExecutor()
+    try:
+        FUTURES = [pool.submit(__unlink_batch, FILES[i:i + DELETE_BATCH], CANCEL) for i in range(0, len(FILES), DELETE_BATCH)]
+        LAST_SHOWN = START
+        for future in as_completed(FUTURES):
+            DONE, ERRORS = future.result()
+            REMOVED += DONE
+            FAILED.extend(ERRORS)
+            if time.perf_counter() - LAST_SHOWN > 0.1:
+                LAST_SHOWN = time.perf_counter()
+                print(f"\r{OKCYAN}Removed {REMOVED}/{len(FILES)} files ({REMOVED / (LAST_SHOWN - START):.0f} files/s)...{ENDC}   ", end="", flush=True)
+        for DEPTH, DIR in sorted(DIRS, key=lambda item: item[0], reverse=True):
+            try:
+                os.rmdir(DIR)
+            except OSError as e:
+                if not FAILED:
+                    FAILED.append((DIR, e))
+    except KeyboardInterrupt:
+        CANCEL.set()
+        pool.shutdown(wait=True, cancel_futures=True)
+        print(f"\n{WARNING}Deletion stopped after removing {REMOVED} of {len(FILES)} files.{ENDC}")
+        return False
+    finally:
+        pool.shutdown(wait=True)
+    ELAPSED = max(time.perf_counter() - START, 1e-6)
+    FOLDERS = f" and {len(DIRS)} {'folder' if len(DIRS) == 1 else 'folders'}" if DIRS else ""
+    print(f"\r{OKCYAN}Removed {REMOVED} {'file' if REMOVED == 1 else 'files'} ({__format_size(SIZE)}){FOLDERS} in {ELAPSED:.2f}s ({REMOVED / ELAPSED:.0f} files/s).{ENDC}")
+    for path, error in FAILED[:10]:
+        print(f"{FAIL}Could not remove {OKCYAN}{path}{FAIL}. Reason: {ENDC}{error}")
+    if len(FAILED) > 10:
+        print(f"{FAIL}...and {len(FAILED) - 10} more.{ENDC}")
+    return not FAILED
+
+def __deny_protected_tree(TARGET_PATH, PATHS) -> bool:
+    # Folders inside the target are only checked against the system folders. Protected names like music or desktop
+    # are common inside ordinary project trees, so they only count for the target itself.
+    FLAGGED = PATH_GUARD.check_many(PATHS, names=False)
+    if FLAGGED:
+        print(f"{FAIL}ACCESS DENIED: Tried to remove sensitive or protected directory, as {OKCYAN}{TARGET_PATH} {FAIL}contains the system {'directory' if len(FLAGGED) == 1 else 'directories'} {OKCYAN}{', '.join(FLAGGED[:5])}{FAIL}{' (and more)' if len(FLAGGED) > 5 else ''}. Nothing has been removed.{ENDC}")
+    return bool(FLAGGED)
+
+@__command("dirdel")
+def __cmd_dirdel(prompt: str, args: str):
+    DIR = args.strip()
+    if not DIR:
+        print(f"{WARNING}Please input a valid directory name.{ENDC}")
+        return
+    try:
+        if DIR == "current":
+            TARGET_PATH = __cwd()
+            last_dirname = os.path.basename(TARGET_PATH)
+            if __is_sensitive(TARGET_PATH, True):
+                print(f"{FAIL}ACCESS DENIED: Tried to remove sensitive or protected directory, as the sensitive directory {OKCYAN}{TARGET_PATH} {FAIL}was targeted for deletion.\nExiting XCon Console for optimal safety.{ENDC}")
+                time.sleep(1.5)
+                sys.exit(-1)
+            if TARGET_PATH == os.path.dirname(sys.executable if getattr(sys, 'frozen', False) else __file__):
+                print(f"{FAIL}ACCESS DENIED: Tried to self destruct distribution folder where program is running.\nExiting XCon Console for optimal safety.{ENDC}")
+                time.sleep(1.5)
+                sys.exit(-1)
+            print(f"{WARNING}Scanning directory {TARGET_PATH}...{ENDC}")
+            FILES, DIRS, SIZE = __scan_for_delete(TARGET_PATH)
+            if __deny_protected_tree(TARGET_PATH, [path for DEPTH, path in DIRS]):
                 return
-            split_VARDECL = VARDECL.split("set", 1)
-            if len(split_VARDECL) != 2:
-                print(f"{WARNING}Please put the keyword {OKCYAN}set {WARNING}in the right position: {OKBLUE}varmake {OKCYAN}x {YELLOW}set {OKCYAN}1{WARNING}, not {OKBLUE}varmake {YELLOW}set {OKCYAN}x {YELLOW}1 or {OKBLUE}varmake {OKCYAN}x {YELLOW}1 {OKBLUE}set or {OKBLUE}varmake {OKCYAN}1 {YELLOW}x {OKCYAN}set {WARNING}(or any other way).{ENDC}")
+            CONFIRM = input(f"{OKCYAN}Are you sure you want to remove the current directory {last_dirname} ({len(FILES)} {'file' if len(FILES) == 1 else 'files'}, {__format_size(SIZE)})? {OKGREEN}[y]{COMMENT}/{FAIL}[n]{ENDC} ").strip()
+            if CONFIRM.lower() == "y":
+                print(f"{WARNING}Removing current directory {TARGET_PATH}... (Press {OKCYAN}Ctrl+C{WARNING} to stop.){ENDC}")
+                if __remove_tree(FILES, DIRS, SIZE):
+                    print(f"{OKGREEN}Directory {last_dirname} removed successfully.{ENDC}")
                 return
-            VARVAL_RAW = split_VARDECL[1].strip()
-            VARNAME = split_VARDECL[0].strip()
-            try:
-                VARVAL = ast.literal_eval(VARVAL_RAW)
-            except Exception:
-                try:
-                    VARVAL = __safe_eval(VARVAL_RAW, PYTHON_CONTEXT)
-                except Exception as e:
-                    if VARVAL_RAW in DECLARELIST:
-                        VARVAL = DECLARELIST[VARVAL_RAW]
-                    else:
-                        print(f"{FAIL}Failed to initialize variable {OKCYAN}{VARNAME}{FAIL}, because it contains a invalid value: {OKCYAN}{VARVAL_RAW}{FAIL}. Error:\n\n{ENDC}{e}")
-                        result = input(f"{WARNING}Would you like to convert it to a string instead? {OKGREEN}[y]{COMMENT}/{FAIL}[n]{ENDC} ").strip()
-                        if result == "y":
-                            VARVAL = VARVAL_RAW
-                        elif result == "n":
-                            print(f"{WARNING}Variable {OKCYAN}{VARNAME} {WARNING}has not been announced has declared.{ENDC}")
-                            return
-            if VARNAME in globals():
-                print(f"{WARNING}Variable {VARNAME} already exists. Overwriting {VARNAME} with value {VARVAL}.{ENDC}")
-            if VARNAME in RESERVED:
-                print(f"{FAIL}You cannot overwrite a XCon command.{ENDC}")
+            elif CONFIRM.lower() == "n":
+                print(f"{OKCYAN}Deletion of directory {last_dirname} stopped.{ENDC}")
                 return
-            globals()[VARNAME] = VARVAL
-            DECLARELIST[VARNAME] = VARVAL
-            print(f"{OKGREEN}Declared variable {VARNAME} at address {id(VARVAL)} with value {VARVAL}.{ENDC}")
-            return
-        except Exception as e:
-            print(f"{FAIL}Variable not created, reason:\n\n{ENDC}{e}")
-            return
-    if prompt.startswith("vardel "):
-        VAR = prompt.removeprefix("vardel ").strip()
-        try:
-            if VAR == "all":
-                if not DECLARELIST:
-                    print(f"{WARNING}Please declare variables before removing any.{ENDC}")
-                    return
-                TEMPLIST = DECLARELIST.copy()
-                DELVARS = ', '.join(f"{OKCYAN}{varname} {OKGREEN}({varval!r})" for varname, varval in TEMPLIST.items())
-                for name in TEMPLIST:
-                    globals().pop(name, None)
-                    DECLARELIST.pop(name, None)
-                    print(f"{WARNING}Removing variable {name} in variable list...{ENDC}")
-                __save_vars()
-                print(f"{OKGREEN}Successfully removed all variables. (Deleted {'variables' if len(TEMPLIST) > 1 else 'variable'} {DELVARS}.){ENDC}")
-                del TEMPLIST
+            else:
+                print(f"{WARNING}{CONFIRM} is not a valid answer, defaulting to deletion stop.{ENDC}")
+                return
+        else:
+            TARGET_PATH = os.path.join(__cwd(), DIR)
+            if not os.path.exists(TARGET_PATH):
+                print(f"{WARNING}Directory {DIR} does not exist. Please try again.{ENDC}")
+                return
+            if __is_sensitive(TARGET_PATH, True):
+                print(f"{FAIL}ACCESS DENIED: Tried to remove sensitive or protected directory, as the sensitive directory {OKCYAN}{TARGET_PATH} {FAIL}was targeted for deletion.\nExiting XCon Console for optimal safety.{ENDC}")
+                time.sleep(1.5)
+                sys.exit(-1)
+            print(f"{WARNING}Scanning directory {TARGET_PATH}...{ENDC}")
+            FILES, DIRS, SIZE = __scan_for_delete(TARGET_PATH)
+            if __deny_protected_tree(TARGET_PATH, [path for DEPTH, path in DIRS]):
+                return
+            CONFIRM = input(f"{OKCYAN}Are you sure you want to remove the directory {DIR} ({len(FILES)} {'file' if len(FILES) == 1 else 'files'}, {__format_size(SIZE)})? {OKGREEN}[y]{COMMENT}/{FAIL}[n]{ENDC} ").strip()
+            if CONFIRM.lower() == "y":
+                print(f"{WARNING}Removing directory {TARGET_PATH}... (Press {OKCYAN}Ctrl+C{WARNING} to stop.){ENDC}")
+                if __remove_tree(FILES, DIRS, SIZE):
+                    print(f"{OKGREEN}Directory {DIR} at {TARGET_PATH} removed successfully.{ENDC}")
                 return
-            if VAR in globals() or VAR in DECLARELIST:
-                del globals()[VAR]
-                del DECLARELIST[VAR]
-                __save_vars()
-                print(f"{OKGREEN}Variable {VAR} has been removed successfully.{ENDC}")
+            elif CONFIRM.lower() == "n":
+                print(f"{OKCYAN}Deletion of directory {DIR} stopped.{ENDC}")
                 return
             else:
-                print(f"{WARNING}Variable {VAR} does not exist in the current context. Please try again.{ENDC}")
+                print(f"{WARNING}{CONFIRM} is not a valid answer, defaulting to deletion stop.{ENDC}")
                 return
-        except Exception as e:
-            target = f'variable {VAR}' if VAR != "all" else "all variables"
-            print(f"{FAIL}Something went wrong while removing {target}. Reason:\n\n{ENDC}{e}")
-            return
-    if prompt == "save vars":
-        VARS = ', '.join(f"{OKCYAN}{varname} {OKGREEN}({varval!r})" for varname, varval in DECLARELIST.items())
-        print(f"{WARNING}Attempting to force save variables {VARS}...")
+    except Exception as e:
+        print(f"{FAIL}An exception has occurred while removing directory '{DIR}'. Reason:\n\n{ENDC}{e}")
+    return
+
+SYNC_WINDOW = 256 # File copies queued ahead on the dircopy worker pool.
+
+def __file_digest(PATH) -> bytes:
+    import hashlib
+    DIGEST = hashlib.blake2b()
+    with open(PATH, "rb") as f:
+        while BLOCK := f.read(1024 * 1024):
+            DIGEST.update(BLOCK)
+    return DIGEST.digest()
+
+def __sync_file(SRC, DST, SRC_STAT, HASH):
+    # Copies SRC over DST unless DST already has the same size and modification time (or the same content with HASH).
+    import shutil
+    try:
         try:
-            __save_vars()
-            print(f"{OKGREEN}Variables {VARS} successfully saved inside of variable declaration file {OKCYAN}vardecl.json{OKGREEN}.{ENDC}")
-            return
-        except Exception as e:
-            print(f"{FAIL}An exception has occurred while trying to save variables {VARS}. Reason:\n\n{ENDC}{e}")
+            DST_STAT = os.stat(DST)
+        except FileNotFoundError:
+            DST_STAT = None
+        if DST_STAT is not None and DST_STAT.st_size == SRC_STAT.st_size:
+            if HASH:
+                if __file_digest(SRC) == __file_digest(DST):
+                    return "skipped", 0
+            elif DST_STAT.st_mtime_ns == SRC_STAT.st_mtime_ns: # copystat carries the full timestamp over.
+                return "skipped", 0
+        SIZE = __copy_file(SRC, DST, progress=False)
+        shutil.copystat(SRC, DST)
+        return "copied", SIZE
+    except OSError as e:
+        return "failed", e
+
+def __sync_tree(SRC, DST, HASH=False):
+    # Walks SRC with os.scandir, recreates its folders in DST and copies the files on a thread pool.
+    from concurrent.futures import ThreadPoolExecutor
+    COPIED = SKIPPED = TOTAL = 0
+    FAILED = []
+    def collect(path, future):
+        nonlocal COPIED, SKIPPED, TOTAL
+        STATUS, RESULT = future.result()
+        if STATUS == "copied":
+            COPIED += 1
+            TOTAL += RESULT
+        elif STATUS == "skipped":
+            SKIPPED += 1
+        else:
+            FAILED.append((path, RESULT))
+    with ThreadPoolExecutor() as pool:
+        PENDING = collections.deque()
+        STACK = [(SRC, DST)]
+        while STACK:
+            SRC_DIR, DST_DIR = STACK.pop()
+            try:
+                os.makedirs(DST_DIR, exist_ok=True)
+                with os.scandir(SRC_DIR) as entries:
+                    for entry in entries:
+                        TARGET = os.path.join(DST_DIR, entry.name)
+                        try:
+                            if entry.is_dir():
+                                STACK.append((entry.path, TARGET))
+                                continue
+                            STAT = entry.stat()
+                        except OSError as e:
+                            FAILED.append((entry.path, e))
+                            continue
+                        PENDING.append((entry.path, pool.submit(__sync_file, entry.path, TARGET, STAT, HASH)))
+                        if len(PENDING) >= SYNC_WINDOW:
+                            collect(*PENDING.popleft())
+            except OSError as e:
+                FAILED.append((SRC_DIR, e))
+        while PENDING:
+            collect(*PENDING.popleft())
+    return COPIED, SKIPPED, TOTAL, FAILED
+
+@__command("dircopy")
+def __cmd_dircopy(prompt: str, args: str):
+    DIRS = args.strip()
+    HASH = DIRS.endswith(" !hash")
+    DIRS = DIRS.removesuffix(" !hash")
+    DIR = DIRS.split(maxsplit=1)
+    SRC = DIR[0]
+    if len(DIR) < 2:
+        DEST = f"{SRC}_dir"
+        print(f"{WARNING}No second directory given, using alternative destination folder: {OKCYAN}{DEST}{WARNING}.{ENDC}")
+    else:
+        DEST = DIR[1]
+    DST_CHILD = os.path.join(DEST, os.path.basename(SRC))
+    BASE = __cwd()
+    for d in DIR:
+        if not os.path.exists(os.path.join(BASE, d)):
+            if d == DST_CHILD:
+                print(f"{WARNING}Directory {OKCYAN}{d} {WARNING}does not exist, creating folder {OKCYAN}{d}{WARNING}...{ENDC}")
+                os.makedirs(os.path.join(BASE, d))
+                print(f"{OKGREEN}Directory {OKCYAN}{d} {OKGREEN}successfully created.{ENDC}")
+                continue
+            else:
+                print(f"{WARNING}Directory {OKCYAN}{d} {WARNING}does not exist, Please input a valid directory name.{ENDC}")
             return
-    if prompt == "load vars":
-        VARS = ', '.join(f"{OKCYAN}{varname} {OKGREEN}({varval!r})" for varname, varval in DECLARELIST.items())
-        print(f"{WARNING}Attempting to force load variables {VARS}...")
-        try:
-            __save_vars()
-            print(f"{OKGREEN}Variables {VARS} successfully loaded from variable declaration file {OKCYAN}vardecl.json{OKGREEN}.{ENDC}")
+    SRC_REAL, DST_REAL = os.path.realpath(os.path.join(BASE, SRC)), os.path.realpath(os.path.join(BASE, DST_CHILD))
+    try:
+        INSIDE = os.path.commonpath([SRC_REAL, DST_REAL]) == SRC_REAL
+    except ValueError: # Different drives.
+        INSIDE = False
+    if INSIDE:
+        # The copy would show up in the walk of SRC and be copied again, until the path gets too long.
+        print(f"{WARNING}You cannot copy a directory into itself or into one of its subdirectories.{ENDC}")
+        return
+    if not SRC or not DST_CHILD:
+        print(f"{WARNING}Setup failed. Please input 2 different directories, for example: dircopy folder1 folder2{ENDC}")
+        return
+    try:
+        START = time.perf_counter()
+        COPIED, SKIPPED, TOTAL, FAILED = __sync_tree(os.path.join(BASE, SRC), os.path.join(BASE, DST_CHILD), HASH)
+        ELAPSED = time.perf_counter() - START
+        for path, error in FAILED[:10]:
+            print(f"{FAIL}Could not copy {OKCYAN}{path}{FAIL}. Reason: {ENDC}{error}")
+        if len(FAILED) > 10:
+            print(f"{FAIL}...and {len(FAILED) - 10} more.{ENDC}")
+        print(f"{OKCYAN}Copied {COPIED} {'file' if COPIED == 1 else 'files'} ({__format_size(TOTAL)}), skipped {SKIPPED} up to date {'file' if SKIPPED == 1 else 'files'}{f', {len(FAILED)} failed' if FAILED else ''} in {ELAPSED:.2f}s.{ENDC}")
+        if FAILED:
+            return
+        print(f"{OKGREEN}{OKCYAN}{SRC} {OKGREEN}has successfully been copied into {OKCYAN}{DEST} {OKGREEN}as {OKCYAN}{os.path.basename(SRC)}{OKGREEN}.{ENDC}")
+        return
+    except Exception as e:
+        print(f"{FAIL}An exception has occurred while copying directory {OKCYAN}{SRC} into {DEST}. Reason:\n\n{ENDC}{e}")
+        return
+
+@__command("varmake")
+def __cmd_varmake(prompt: str, args: str):
+    VARDECL = args.strip()
+    try:
+        if "set" not in VARDECL:
+            print(f"{WARNING}Invalid variable setup. Example: varmake x set 1{ENDC}")
             return
-        except Exception as e:
-            print(f"{FAIL}An exception has occurred while trying to load variables {VARS}. Reason:\n\n{ENDC}{e}")
+        split_VARDECL = VARDECL.split("set", 1)
+        if len(split_VARDECL) != 2:
+            print(f"{WARNING}Please put the keyword {OKCYAN}set {WARNING}in the right position: {OKBLUE}varmake {OKCYAN}x {YELLOW}set {OKCYAN}1{WARNING}, not {OKBLUE}varmake {YELLOW}set {OKCYAN}x {YELLOW}1 or {OKBLUE}varmake {OKCYAN}x {YELLOW}1 {OKBLUE}set or {OKBLUE}varmake {OKCYAN}1 {YELLOW}x {OKCYAN}set {WARNING}(or any other way).{ENDC}")
             return
-    if prompt.startswith("see "):
-        VAR = prompt.removeprefix("see ").strip()
-        if VAR == "globals":
-            print(f"{OKCYAN}Global variables:\n{', '.join([var for var in globals() if var not in RESERVED])}{ENDC}")
+        VARVAL_RAW = split_VARDECL[1].strip()
+        VARNAME = split_VARDECL[0].strip()
+        import ast
+        try:
+            VARVAL = ast.literal_eval(VARVAL_RAW)
+        except Exception:
+            try:
+                VARVAL = __safe_eval(VARVAL_RAW)
+            except Exception as e:
+                if VARVAL_RAW in DECLARELIST or __load_var(VARVAL_RAW):
+                    VARVAL = DECLARELIST[VARVAL_RAW]
+                else:
+                    print(f"{FAIL}Failed to initialize variable {OKCYAN}{VARNAME}{FAIL}, because it contains a invalid value: {OKCYAN}{VARVAL_RAW}{FAIL}. Error:\n\n{ENDC}{e}")
+                    result = input(f"{WARNING}Would you like to convert it to a string instead? {OKGREEN}[y]{COMMENT}/{FAIL}[n]{ENDC} ").strip()
+                    if result == "y":
+                        VARVAL = VARVAL_RAW
+                    elif result == "n":
+                        print(f"{WARNING}Variable {OKCYAN}{VARNAME} {WARNING}has not been announced has declared.{ENDC}")
+                        return
+        if VARNAME in globals():
+            print(f"{WARNING}Variable {VARNAME} already exists. Overwriting {VARNAME} with value {VARVAL}.{ENDC}")
+        if VARNAME in RESERVED:
+            print(f"{FAIL}You cannot overwrite a XCon command.{ENDC}")
             return
-        if VAR == "declared":
-            if DECLARELIST == {}:
-                print(f"{WARNING}You haven't declared any variables yet. Please try again.{ENDC}")
-                return
-            else:
-                DECLVARS = ', '.join(f"{varname} ({varval!r})" for varname, varval in DECLARELIST.items())
-                print(f"{OKCYAN}Declared: {DECLVARS}{ENDC}")
+        __var_set(VARNAME, VARVAL)
+        print(f"{OKGREEN}Declared variable {VARNAME} at address {id(VARVAL)} with value {VARVAL}.{ENDC}")
+        return
+    except Exception as e:
+        print(f"{FAIL}Variable not created, reason:\n\n{ENDC}{e}")
+        return
+
+@__command("vardel")
+def __cmd_vardel(prompt: str, args: str):
+    VAR = args.strip()
+    try:
+        if VAR == "all":
+            __load_all_vars()
+            if not DECLARELIST:
+                print(f"{WARNING}Please declare variables before removing any.{ENDC}")
                 return
-        if VAR == "packages":
-            print(f"{OKCYAN}The packages in the current context installed: {', '.join(PACKAGELIST)}")
+            TEMPLIST = DECLARELIST.copy()
+            DELVARS = ', '.join(f"{OKCYAN}{varname} {OKGREEN}({varval!r})" for varname, varval in TEMPLIST.items())
+            for name in TEMPLIST:
+                print(f"{WARNING}Removing variable {name} in variable list...{ENDC}")
+            __var_clear()
+            print(f"{OKGREEN}Successfully removed all variables. (Deleted {'variables' if len(TEMPLIST) > 1 else 'variable'} {DELVARS}.){ENDC}")
+            del TEMPLIST
+            return
+        if VAR in globals() or VAR in DECLARELIST or VAR in VARS_INDEX:
+            __var_del(VAR)
+            print(f"{OKGREEN}Variable {VAR} has been removed successfully.{ENDC}")
             return
-        if VAR == "":
-            print(f"{WARNING}Please specify a variable name.{ENDC}")
+        else:
+            print(f"{WARNING}Variable {VAR} does not exist in the current context. Please try again.{ENDC}")
             return
-        if VAR in RESERVED:
-            print(f"{FAIL}You cannot access an XCon variable. (Tried to access variable {VAR}){ENDC}")
+    except Exception as e:
+        target = f'variable {VAR}' if VAR != "all" else "all variables"
+        print(f"{FAIL}Something went wrong while removing {target}. Reason:\n\n{ENDC}{e}")
+        return
+
+@__command("save vars", args=False, bare=True)
+def __cmd_save_vars(prompt: str, args: str):
+    __load_all_vars()
+    VARS = ', '.join(f"{OKCYAN}{varname} {OKGREEN}({varval!r})" for varname, varval in DECLARELIST.items())
+    print(f"{WARNING}Attempting to force save variables {VARS}...")
+    try:
+        __save_vars()
+        print(f"{OKGREEN}Variables {VARS} successfully saved inside of variable declaration file {OKCYAN}vardecl.json{OKGREEN}.{ENDC}")
+        return
+    except Exception as e:
+        print(f"{FAIL}An exception has occurred while trying to save variables {VARS}. Reason:\n\n{ENDC}{e}")
+        return
+
+@__command("load vars", args=False, bare=True)
+def __cmd_load_vars(prompt: str, args: str):
+    VARS = ', '.join(f"{OKCYAN}{varname}" for varname in [*DECLARELIST, *VARS_INDEX])
+    print(f"{WARNING}Attempting to force load variables {VARS}...")
+    try:
+        __load_vars()
+        return
+    except Exception as e:
+        print(f"{FAIL}An exception has occurred while trying to load variables {VARS}. Reason:\n\n{ENDC}{e}")
+        return
+
+@__command("see")
+def __cmd_see(prompt: str, args: str):
+    VAR = args.strip()
+    if VAR == "globals":
+        print(f"{OKCYAN}Global variables:\n{', '.join([var for var in globals() if var not in RESERVED])}{ENDC}")
+        return
+    if VAR == "declared":
+        __load_all_vars()
+        if DECLARELIST == {}:
+            print(f"{WARNING}You haven't declared any variables yet. Please try again.{ENDC}")
             return
-        if VAR in globals():
-            print(globals()[VAR])
         else:
-            print(f"{WARNING}Variable {ORANGE}'{VAR}' {WARNING}not found. Make sure to define your variable {VAR} before using {OKBLUE}see {OKCYAN}{VAR}{WARNING}.{ENDC}")
-        return
-    if prompt.startswith("command "):
-            global COMMAND_HISTORY
-            COMMAND_HISTORY = COMMAND_HISTORY[-100:]
-            flag = prompt.removeprefix("command ").strip()
-            if not COMMAND_HISTORY:
-                print(f"{WARNING}You haven't inputted any commands into the XCon console prompt yet, please prompt a command first before running the {OKBLUE}command history{WARNING} command.{ENDC}")
-                return
-            else:    
-                if flag == "history !r":
-                    print(f"{WARNING}Recent command history (reversed with {OKCYAN}!r{WARNING}):\n\n{ENDC}")
-                    for i, CMD in enumerate(reversed(COMMAND_HISTORY), start=1):
-                        print(f'{OKBLUE}{i}{ENDC}: {OKGREEN}{CMD}{ENDC}')
-                    return
-                elif flag == "history":
-                    print(f"{WARNING}Recent command history:\n\n{ENDC}")
-                    for i, CMD in enumerate(COMMAND_HISTORY, start=1):
-                        print(f'{OKBLUE}{i}{ENDC}: {OKGREEN}{CMD}{ENDC}')
+            DECLVARS = ', '.join(f"{varname} ({varval!r})" for varname, varval in DECLARELIST.items())
+            print(f"{OKCYAN}Declared: {DECLVARS}{ENDC}")
+            return
+    if VAR == "packages":
+        INSTALLED = sorted(__installed_packages().values(), key=lambda DIST: DIST.metadata["Name"].lower())
+        SESSION = {__normalize_package(p) for p in PACKAGELIST}
+        PACKAGES = ', '.join(f"{OKGREEN if __normalize_package(DIST.metadata['Name']) in SESSION else OKCYAN}{DIST.metadata['Name']} {COMMENT}{DIST.version}{OKCYAN}" for DIST in INSTALLED)
+        print(f"{OKCYAN}The packages in the current context installed ({len(INSTALLED)}): {PACKAGES}{ENDC}")
+        return
+    if VAR == "":
+        print(f"{WARNING}Please specify a variable name.{ENDC}")
+        return
+    if VAR in RESERVED:
+        print(f"{FAIL}You cannot access an XCon variable. (Tried to access variable {VAR}){ENDC}")
+        return
+    if VAR in globals():
+        print(globals()[VAR])
+    elif VAR in DECLARELIST or __load_var(VAR):
+        print(DECLARELIST[VAR])
+    else:
+        print(f"{WARNING}Variable {ORANGE}'{VAR}' {WARNING}not found. Make sure to define your variable {VAR} before using {OKBLUE}see {OKCYAN}{VAR}{WARNING}.{ENDC}")
+    return
+
+@__command("command")
+def __cmd_command(prompt: str, args: str):
+    global COMMAND_HISTORY
+    COMMAND_HISTORY = COMMAND_HISTORY[-100:]
+    flag = args.strip()
+    if not COMMAND_HISTORY:
+        print(f"{WARNING}You haven't inputted any commands into the XCon console prompt yet, please prompt a command first before running the {OKBLUE}command history{WARNING} command.{ENDC}")
+        return
+    else:    
+        if flag == "history !r":
+            print(f"{WARNING}Recent command history (reversed with {OKCYAN}!r{WARNING}):\n\n{ENDC}")
+            for i, CMD in enumerate(reversed(COMMAND_HISTORY), start=1):
+                print(f'{OKBLUE}{i}{ENDC}: {OKGREEN}{CMD}{ENDC}')
+            return
+        elif flag == "history":
+            print(f"{WARNING}Recent command history:\n\n{ENDC}")
+            for i, CMD in enumerate(COMMAND_HISTORY, start=1):
+                print(f'{OKBLUE}{i}{ENDC}: {OKGREEN}{CMD}{ENDC}')
+            return
+        elif flag.startswith("search "):
+            term = flag.removeprefix("search ").lower()
+            matches = [(i+1, cmd) for i, cmd in enumerate(COMMAND_HISTORY) if term == cmd.lower()]
+            print(f"{WARNING}Searching command in command history: {OKBLUE}{term}\n{ENDC}")
+            if matches:
+                for i, cmd in matches:
+                    print(f'{OKBLUE}{i}{ENDC}: {OKGREEN}{cmd}{ENDC}')
                     return
-                elif flag.startswith("search "):
-                    term = flag.removeprefix("search ").lower()
-                    matches = [(i+1, cmd) for i, cmd in enumerate(COMMAND_HISTORY) if term == cmd.lower()]
-                    print(f"{WARNING}Searching command in command history: {OKBLUE}{term}\n{ENDC}")
-                    if matches:
-                        for i, cmd in matches:
-                            print(f'{OKBLUE}{i}{ENDC}: {OKGREEN}{cmd}{ENDC}')
-                            return
-                    else:
-                        print(f"{WARNING}No commands matching {OKBLUE}{term} {WARNING}found.{ENDC}")
-                        return
-    match prompt:
-        case "info":
-            print(f"{OKCYAN}XCon 2025 Ltd.\n\nUses: {YELLOW}Python\n{OKCYAN}A testing console.{ENDC}")
-        case "close":
-            print(f"{OKGREEN}Thank you for using the XCon Console!\n{OKCYAN}XCon Console 2025 Ltd.{ENDC}")
-            __save_vars()
-            sys.exit(0)
-        case "wipe":
-            subprocess.run("cls" if os.name == "nt" else "clear", shell=True)
-        case "no color":
-            subprocess.run("color 8", shell=True)
-        case "empty bin":
-            CONFIRM = input(f"{WARNING}Are you sure you want to empty the recycle bin? {OKGREEN}[y]{COMMENT}/{FAIL}[n]{ENDC} ").strip()
-            if CONFIRM.lower() == "y":
-                __empty_bin()
-            elif CONFIRM.lower() == "n":
-                print(f"{OKCYAN}Recycle bin emptying stopped.{ENDC}")
             else:
-                print(f"{WARNING}{CONFIRM} is not a valid answer, defaulting to emptying stop.{ENDC}")
+                print(f"{WARNING}No commands matching {OKBLUE}{term} {WARNING}found.{ENDC}")
                 return
-        case "python":
-            print(f"You are already running Python, well, XCon Console code, silly. Try something else.\n") 
-        case "version":
-            print(f"You are running XCon Console {OKCYAN}v0.1.{ENDC}")
-        case "meow":
-            print(f"ฅ^•ﻌ•^ฅ {PINK}meow!{ENDC}")
-        case "nya":
-            print(f"/ᐠ˵- ⩊ -˵マ {PINK}nya~!{ENDC}")
-        case "malak":
-            print(f"""
+
+@__command("info", args=False, bare=True)
+def __cmd_info(prompt: str, args: str):
+    print(f"{OKCYAN}XCon 2025 Ltd.\n\nUses: {YELLOW}Python\n{OKCYAN}A testing console.{ENDC}")
+
+@__command("close", args=False, bare=True)
+def __cmd_close(prompt: str, args: str):
+    print(f"{OKGREEN}Thank you for using the XCon Console!\n{OKCYAN}XCon Console 2025 Ltd.{ENDC}")
+    __save_vars()
+    sys.exit(0)
+
+@__command("wipe", args=False, bare=True)
+def __cmd_wipe(prompt: str, args: str):
+    import subprocess
+    subprocess.run("cls" if os.name == "nt" else "clear", shell=True)
+
+@__command("no color", args=False, bare=True)
+def __cmd_no_color(prompt: str, args: str):
+    import subprocess
+    subprocess.run("color 8", shell=True)
+
+@__command("empty bin", args=False, bare=True)
+def __cmd_empty_bin(prompt: str, args: str):
+    CONFIRM = input(f"{WARNING}Are you sure you want to empty the recycle bin? {OKGREEN}[y]{COMMENT}/{FAIL}[n]{ENDC} ").strip()
+    if CONFIRM.lower() == "y":
+        __empty_bin()
+    elif CONFIRM.lower() == "n":
+        print(f"{OKCYAN}Recycle bin emptying stopped.{ENDC}")
+    else:
+        print(f"{WARNING}{CONFIRM} is not a valid answer, defaulting to emptying stop.{ENDC}")
+        return
+
+@__command("python", args=False, bare=True)
+def __cmd_python(prompt: str, args: str):
+    print(f"You are already running Python, well, XCon Console code, silly. Try something else.\n") 
+
+@__command("version", args=False, bare=True)
+def __cmd_version(prompt: str, args: str):
+    print(f"You are running XCon Console {OKCYAN}v0.1.{ENDC}")
+
+@__command("meow", args=False, bare=True)
+def __cmd_meow(prompt: str, args: str):
+    print(f"ฅ^•ﻌ•^ฅ {PINK}meow!{ENDC}")
+
+@__command("nya", args=False, bare=True)
+def __cmd_nya(prompt: str, args: str):
+    print(f"/ᐠ˵- ⩊ -˵マ {PINK}nya~!{ENDC}")
+
+@__command("malak", args=False, bare=True)
+def __cmd_malak(prompt: str, args: str):
+    print(f"""
                   Oh, you want to know about Malak, the creator of the console's true love?\nWell, that's pretty simple, but pretty complicated to explain at the same time, ahaha...
                   Long story short, she is the most perfect girl and the creator of the console is truly so happy\nin life with this girl. Every time he sees her in his presence, his lips don't just smile - His heart does as well.
                   His heart flutters upon her interacting with her and it feels like heaven...
@@ -1109,112 +3009,141 @@ def __handle_prompt(prompt: str):
                   Thanks for taking interest into it!
                   {PINK}If possible, make her feel happy as much as you can, I know she likes being appreciated <3!{ENDC}
                   """)
-        case "what is reality":
-            print(fr"""
+
+@__command("what is reality", args=False, bare=True)
+def __cmd_what_is_reality(prompt: str, args: str):
+    import subprocess
+    print(fr"""
                   {WARNING}The lyrics are on-beat depending on how fast the link opens for you, so please be cautious! :(""")
-            print(fr"""
+    print(fr"""
                   {OKCYAN}-- Sing along!""")
-            link = subprocess.run("start https://www.youtube.com/watch?v=CAL4WMpBNs0", shell=True)
-            result = input(f"Press any key to start the lyrics when the song starts!\nIf you want to exit, type {ORANGE}'exit'{OKCYAN}.")
-            if result == "exit":
-                return
-            if link.returncode == 0:
-                for i in range(10, 0, -1):
-                    print(f"Lyrics start in {i}...", end="\r", flush=True)
-                    time.sleep(1.0)
-                print(" " * 30, end='\r')
-                print(fr"""
+    link = subprocess.run("start https://www.youtube.com/watch?v=CAL4WMpBNs0", shell=True)
+    result = input(f"Press any key to start the lyrics when the song starts!\nIf you want to exit, type {ORANGE}'exit'{OKCYAN}.")
+    if result == "exit":
+        return
+    if link.returncode == 0:
+        for i in range(10, 0, -1):
+            print(f"Lyrics start in {i}...", end="\r", flush=True)
+            time.sleep(1.0)
+        print(" " * 30, end='\r')
+        print(fr"""
                       {PINK}Every day, I imagine a future where I can be with you""")
-                time.sleep(8.0)
-                print(fr"""
+        time.sleep(8.0)
+        print(fr"""
                       In my hand is a pen that will write a poem of me and you""")
-                time.sleep(9.25)
-                print(fr"""
+        time.sleep(9.25)
+        print(fr"""
                       The ink flows down into a dark puddle""")
-                time.sleep(4.75)
-                print(fr"""
+        time.sleep(4.75)
+        print(fr"""
                       Just move your hand, write the way into his heart""")
-                time.sleep(5.25)
-                print(fr"""
+        time.sleep(5.25)
+        print(fr"""
                       But in this world of infinite choices""")
-                time.sleep(4.25)
-                print(fr"""
+        time.sleep(4.25)
+        print(fr"""
                       What will it take just to find that special day?""")
-                time.sleep(4.25)
-                print(fr"""
+        time.sleep(4.25)
+        print(fr"""
                       What will it take just to find that special day?""")
-                time.sleep(13.75)
-                print(fr"""
+        time.sleep(13.75)
+        print(fr"""
                       Have I found everybody a fun assignment to do today?""")
-                time.sleep(9.25)
-                print(fr"""
+        time.sleep(9.25)
+        print(fr"""
                       When you're here, everything that we do is fun for them anyway""")
-                time.sleep(9.5)
-                print(fr"""
+        time.sleep(9.5)
+        print(fr"""
                       When I can't even read my own feelings""")
-                time.sleep(4.25)
-                print(fr"""
+        time.sleep(4.25)
+        print(fr"""
                       What good are words when a smile says it all?""")
-                time.sleep(4.25)
-                print(fr"""
+        time.sleep(4.25)
+        print(fr"""
                       And if this world won't write me an ending""")
-                time.sleep(5.0)
-                print(fr"""
+        time.sleep(5.0)
+        print(fr"""
                       What will it take just for me to have it all?""")
-                time.sleep(23.25)
-                print(fr"""
+        time.sleep(23.25)
+        print(fr"""
                       Does my pen only write bitter words for those who are dear to me?""")
-                time.sleep(10.0)
-                print(fr"""
+        time.sleep(10.0)
+        print(fr"""
                       Is it love if I take you, or is it love if I set you free?""")
-                time.sleep(12.75)
-                print(fr"""
+        time.sleep(12.75)
+        print(fr"""
                       The ink flows down into a dark puddle""")
-                time.sleep(4.75)
-                print(fr"""
+        time.sleep(4.75)
+        print(fr"""
                       How can I write love into reality?""")
-                time.sleep(5.25)
-                print(fr"""
+        time.sleep(5.25)
+        print(fr"""
                       If I can't hear the sound of your heartbeat""")
-                time.sleep(5.25)
-                print(fr"""
+        time.sleep(5.25)
+        print(fr"""
                       What do you call love in your reality?""")
-                time.sleep(4.25)
-                print(fr"""
+        time.sleep(4.25)
+        print(fr"""
                       And in your reality, if I don't know how to love you""")
-                time.sleep(12.25)
-                print(fr"""
+        time.sleep(12.25)
+        print(fr"""
                       I'll leave you be{ENDC} 
                 """)
-            else:
-                print(f"{FAIL}Monika did not want to sing for you... :({ENDC}")
-        case "path help":
-            print(fr"""
+    else:
+        print(f"{FAIL}Monika did not want to sing for you... :({ENDC}")
+
+@__command("path help", args=False, bare=True)
+def __cmd_path_help(prompt: str, args: str):
+    print(fr"""
                 -- Path
                 {OKBLUE}chgpath {OKCYAN}<path>{ENDC}                : Change the current path to execute commands from.
                 {OKBLUE}chgpath {OKCYAN}root{ENDC}                  : Change path to root directory (usually {OKCYAN}C:\{ENDC}).
                 {OKBLUE}chgpath {OKCYAN}up{ENDC}                    : Change to the parent folder of the current path.""")
-        case "inspect help":
-            print(fr"""
+
+@__command("inspect help", args=False, bare=True)
+def __cmd_inspect_help(prompt: str, args: str):
+    print(fr"""
                 -- Inspection
                 {OKBLUE}inspect folder {OKCYAN}<folder_name>{ENDC}  : Inspects all items in folder_name.
                 {OKBLUE}inspect folder {OKCYAN}<folder_name> {YELLOW}all {OKCYAN}<file_extension>{ENDC}           : Get all files in {OKCYAN}folder_name{ENDC}
                                                                               that have the file extension 
                                                                               {OKCYAN}file_extension{ENDC}.
+                {OKBLUE}inspect folder {OKCYAN}<folder_name> {ORANGE}!r{ENDC}  : Inspects folder_name recursively, showing the amount of files,
+                                                the total size and the largest files of every subfolder.
+                                                Can be combined with {YELLOW}all {OKCYAN}<file_extension>{ENDC}.
                 {OKBLUE}inspect file {OKCYAN}<file_name>{ENDC}      : Reads all lines from a file (if possible).
+                {OKBLUE}inspect file {OKCYAN}<file_name> {ORANGE}!head {OKCYAN}<n>{ENDC}      : Reads the first n lines of a file. {ORANGE}!tail {OKCYAN}<n>{ENDC} reads the last n lines
+                                                             without reading the rest of the file.
+                {OKBLUE}inspect file {OKCYAN}<file_name> {ORANGE}!range {OKCYAN}<a>:<b>{ENDC}  : Reads lines a up to and including b.
+                {OKBLUE}inspect file {OKCYAN}<file_name> {ORANGE}!page {OKCYAN}[n]{ENDC}       : Reads a file n lines (40 by default) at a time.
+                {OKBLUE}inspect grep {WARNING}<pattern> {OKCYAN}<path> {ORANGE}[{YELLOW}all {OKCYAN}<file_extension>{ORANGE}] [{OKCYAN}!max <n>{ORANGE}] [{OKCYAN}!count{ORANGE}]{ENDC} : Searches every file in path for the regular
+                                                             expression pattern and shows each match as file:line.
+                                                             Several quoted patterns match any of them. {OKCYAN}!count{ENDC} only
+                                                             shows the amount of matching lines per file.
                 {OKBLUE}inspect file text {WARNING}<text> {OKCYAN}<file_name>{ENDC}       : Reads a specific piece of text from the file
                                                              and returns the amount of times the text 
-                                                             has been repeated inside of {OKCYAN}file_name.""")
-        case "modules help":
-            print(fr"""
+                                                             has been repeated inside of {OKCYAN}file_name.
+                                                             {ENDC}Add {ORANGE}!lines{ENDC} to also show every matching line and its line number.""")
+
+@__command("modules help", args=False, bare=True)
+def __cmd_modules_help(prompt: str, args: str):
+    print(fr"""
                 -- Modules
                 {OKBLUE}access module {OKCYAN}<module_name>{ENDC}   : Access (or simpler, import) the module {OKCYAN}module_name{ENDC}.
+                                                Accessed modules are accessed again in the next sessions, and
+                                                only imported once they are first used.
                 {OKBLUE}module {OKCYAN}<module_name>{ENDC}          : Returns the type of {OKCYAN}module_name{ENDC}.
+                {OKBLUE}module timings{ENDC}                : Shows how long each accessed module took to import.
+                {OKBLUE}forget module {OKCYAN}<module_name>{ENDC}   : Stops accessing {OKCYAN}module_name{ENDC} automatically in the next sessions.
                 {OKBLUE}install {OKCYAN}<package_name>{ENDC}        : Attempts to install the global package {OKCYAN}package_name{ENDC}.
+                                                Several packages are installed together in one pip call.
                 {OKCYAN}<package_name> {OKBLUE}info{ENDC}           : Gathers information about the package {OKCYAN}package_name{ENDC}.
+                                                Several package names can be given at once.
                 {OKBLUE}installer {OKCYAN}upgrade{ENDC}             : Attempts to upgrade/update the installer to the latest version.""")
-        case "internal help":
-            print(fr"""
+
+@__command("internal help", args=False, bare=True)
+def __cmd_internal_help(prompt: str, args: str):
+    print(fr"""
                 -- Internal
                 {OKBLUE}process shutdown {ORANGE}!r{ENDC}           : Restart the computer.
                 Options: {ORANGE}[!f: close files] [!fw: firmware]
@@ -1235,9 +3164,12 @@ def __handle_prompt(prompt: str):
                 {OKBLUE}set volume {OKCYAN}<volume_value>{ENDC}     : Sets the current volume to {OKCYAN}volume_value{ENDC}.
                 {OKBLUE}mute volume{ENDC}                   : Mutes the volume.
                 {OKBLUE}console {OKCYAN}<command>{ENDC}             : Runs a command directly through the console. 
-                                                {WARNING}Note: Not all commands will run as expected through XCon.{ENDC}""")
-        case "io help":
-            print(fr"""
+                                                {WARNING}Note: Not all commands will run as expected through XCon.{ENDC}
+                {OKBLUE}console {YELLOW}!timeout {OKCYAN}<seconds> <command>{ENDC} : Runs a command, stopping it after {OKCYAN}seconds{ENDC}.""")
+
+@__command("io help", args=False, bare=True)
+def __cmd_io_help(prompt: str, args: str):
+    print(fr"""
                 -- File I/O
                 {OKBLUE}fmake {OKCYAN}<file_name> {ORANGE}[{OKCYAN}^ {WARNING}<content> {YELLOW}[{OKBLUE}| {YELLOW}<- multiline indc.]{ORANGE}] [{OKCYAN}!append {ORANGE}or {OKCYAN}| !append{ORANGE}] [{OKCYAN}!nodef{ORANGE}]{ENDC}   : Create 
                                                                          a file, optionally write content 
@@ -1250,12 +3182,18 @@ def __handle_prompt(prompt: str):
                                                                          file, so you'd have to put {OKCYAN}!nodef{ENDC}
                                                                          in the end if you'd want a file without a
                                                                          file extension.
+                {OKBLUE}fmake {OKCYAN}<file_name> {OKCYAN}^< {WARNING}<source_file>{ENDC}  : Write the content of {WARNING}source_file{ENDC} (or stdin with {OKCYAN}-{ENDC})
+                                                into {OKCYAN}file_name{ENDC}, streamed in blocks. Works with {OKCYAN}!append{ENDC} as well.
+                {OKBLUE}fmake {ORANGE}... {OKCYAN}!repeat {WARNING}<n>{ENDC}            : Writes the content (or source file) n times, for example
+                                                to generate large test files.
                 {OKBLUE}fdel {OKCYAN}<file_name> {ORANGE}[{OKCYAN}!nodef{ORANGE}]{ENDC}     : Delete a file in the current path. 
                                                 The file automatically defaults to a .txt
                                                 file, so you'd have to put {OKCYAN}!nodef{ENDC}
                                                 in the end if you'd want a file without a
                                                 file extension.
                                                 (You need to confirm in order to delete the file first.)
+                                                Multiple files and patterns like {OKCYAN}*.obj{ENDC} can be removed at once,
+                                                with a single confirmation.
                 {OKBLUE}fcopy {OKCYAN}<file_name> {YELLOW}<dir_name> {ORANGE}[{OKCYAN}!nodef{ORANGE}]{ENDC}     : Copy the file {OKCYAN}file_name{ENDC} into
                                                             the directory {OKCYAN}dir_name{ENDC}.
                                                             If there is no directory name specified,
@@ -1264,17 +3202,25 @@ def __handle_prompt(prompt: str):
                                                             {ENDC}assures that the file name doesn't include
                                                             a file extension. If the directory {OKCYAN}dir_name 
                                                             {ENDC}already exists, it will check for available directory names.
+                                                            Multiple files and patterns like {OKCYAN}*.log{ENDC} can be copied at once,
+                                                            for example {OKBLUE}fcopy {OKCYAN}a.txt *.log {YELLOW}dir_name{ENDC}.
                 {OKBLUE}dirmake {OKCYAN}<dir_name>{ENDC}            : Create a directory in the current path.
                 {OKBLUE}dirdel {OKCYAN}<dir_name>{ENDC}             : Delete a directory in the current path.
                                                 If a directory is protected (for example, {OKCYAN}C:\Users\user1\Documents{ENDC}), 
                                                 this will not run and will quit the console instead.
                 {OKBLUE}dirdel {OKCYAN}current{ENDC}                : Delete the current console path.
+                {OKBLUE}dircopy {OKCYAN}<dir_name> {YELLOW}<dest_dir> {ORANGE}[{OKCYAN}!hash{ORANGE}]{ENDC} : Copy the directory {OKCYAN}dir_name{ENDC} into {OKCYAN}dest_dir{ENDC}.
+                                                Files that are already up to date (same size and modification
+                                                time) are skipped. {OKCYAN}!hash{ENDC} compares the content of the files instead.
                 {OKBLUE}<file_name>{ENDC}                   : Opens the file {OKCYAN}file_name{ENDC}.""")
-        case "script help":
-            print(fr"""
+
+@__command("script help", args=False, bare=True)
+def __cmd_script_help(prompt: str, args: str):
+    print(fr"""
                 -- Script
                 {OKBLUE}xcon script {OKCYAN}<script_file>{ENDC}     : Runs a XCon script from a file inside the console. 
                                                 (Make sure your file is a {YELLOW}.xcon{ENDC} file!)
+                {OKBLUE}xcon script {OKCYAN}-{ENDC}                 : Runs a XCon script piped in through stdin, line by line.
                 {OKBLUE}python script {OKCYAN}<script_file>{ENDC}   : Runs a Python script from a file inside the console. 
                                                 (Make sure your file is a {YELLOW}.py{ENDC} file!)
                 {OKBLUE}python run {OKCYAN}<python_command>{ENDC}   : Runs a Python command through the console.
@@ -1283,9 +3229,17 @@ def __handle_prompt(prompt: str):
                                                                       {OKBLUE}'python block {YELLOW}!x {ORANGE} {OKCYAN}<func>:'{ENDC}.
                 {OKBLUE}python block {OKCYAN}!x <block>{ENDC}       : Runs a Python block, automatically indenting for you.
                                                                       To make your code block run, type {OKCYAN}!end{ENDC}
-                                                                      at the end of your code block.""")
-        case "variables help":
-            print(fr"""
+                                                                      at the end of your code block.
+                {OKBLUE}python ctx new {OKCYAN}<name>{ENDC}         : Creates a new Python context and switches to it.
+                {OKBLUE}python ctx use {OKCYAN}<name>{ENDC}         : Switches python run and python block to another context.
+                {OKBLUE}python ctx list{ENDC}                : Lists the Python contexts.
+                {OKBLUE}python ctx del {OKCYAN}<name>{ENDC}         : Deletes a Python context.
+                {OKBLUE}python ctx snapshot {OKCYAN}[label]{ENDC}   : Saves a copy of the current context, for example after loading data.
+                {OKBLUE}python ctx restore {OKCYAN}[label]{ENDC}    : Puts the current context back the way it was at the snapshot.""")
+
+@__command("variables help", args=False, bare=True)
+def __cmd_variables_help(prompt: str, args: str):
+    print(fr"""
                 -- Variables
                 {OKBLUE}varmake {OKCYAN}<var_name> {YELLOW}set {OKCYAN}<var_value>{ENDC}   : Declare a variable with a value. 
                                                        (You can also set an existing variable to an other value.)
@@ -1304,13 +3258,16 @@ def __handle_prompt(prompt: str):
                 {OKBLUE}see {OKCYAN}globals{ENDC}                   : Displays all the global values in the current context.
                 {OKBLUE}see {OKCYAN}declared{ENDC}                  : Displays all defined variables in the current context. 
                                                 This will only display something if you have any variables declared.
-                {OKBLUE}see {OKCYAN}packages{ENDC}                  : Displays all packages manually installed with 
-                                                                      {OKBLUE}install {OKCYAN}<package_name>{ENDC}.
+                {OKBLUE}see {OKCYAN}packages{ENDC}                  : Displays all installed packages and their versions. Packages
+                                                                      installed with {OKBLUE}install {OKCYAN}<package_name>{ENDC} this session are marked.
                 {HEADER}@variable{ENDC}                     : Gets evaluated as a variable. You won't need this with
                                                 commands like {OKBLUE}see {OKCYAN}<var_name>{ENDC}, but you
-                                                can use this for other commands that don't support it.""")
-        case "conditions help":
-            print(fr"""
+                                                can use this for other commands that don't support it.
+                {HEADER}@@{ENDC}                            : Escape sequence for a genuine at sign (@), which won't get evaluated.""")
+
+@__command("conditions help", args=False, bare=True)
+def __cmd_conditions_help(prompt: str, args: str):
+    print(fr"""
                 -- Conditions
                 {OKBLUE}check {OKCYAN}<condition>{ENDC}             : Checks if a certain condition is true or not.
                 {OKBLUE}check {OKCYAN}<any>{ENDC}                   : This can be anything, for example, this can check the
@@ -1318,10 +3275,13 @@ def __handle_prompt(prompt: str):
                                                 to get a certain value that hasn't been paired with a 
                                                 variable yet.
                 {OKBLUE}check type {OKCYAN}<var_name>{ENDC}             : Checks what type {OKCYAN}var_name{ENDC} is.
+                {OKBLUE}check deps {OKCYAN}<condition>{ENDC}        : Lists the declared variables a condition depends on.
                 {OKBLUE}check {OKCYAN}<file_name> {WARNING}exists{ENDC}      : Checks if a certain file exists in the current context.
                 {OKBLUE}check {OKCYAN}<dir_name> {WARNING}exists{ENDC}       : Checks if a certain directory exists in the current context.""")
-        case "utilities help":
-            print(fr"""
+
+@__command("utilities help", args=False, bare=True)
+def __cmd_utilities_help(prompt: str, args: str):
+    print(fr"""
                 -- Utilities & Extra's
                 {OKBLUE}echo {OKCYAN}<text>{ENDC}                   : Prints out text to the stream. 
                                                 For variables, you might just want to use {OKBLUE}see {OKCYAN}<var_name>{ENDC},
@@ -1336,6 +3296,11 @@ def __handle_prompt(prompt: str):
                                                 In order to escape comments and make a genuine dollar sign ($),
                                                 you'll need to use the escape sequence instead of a single $,
                                                 {OKBLUE}$${ENDC}.
+                {OKCYAN}<command> {OKBLUE}&{ENDC}                   : Runs any command in the background as a job.
+                {OKBLUE}jobs{ENDC}                          : Lists the background jobs.
+                {OKBLUE}wait {OKCYAN}<job_id>{ENDC}                 : Waits for a job to finish and shows its output.
+                {OKBLUE}fg {OKCYAN}<job_id>{ENDC}                   : Shows the output of a job live until it finishes. Ctrl+C sends it back.
+                {OKBLUE}kill {OKCYAN}<job_id>{ENDC}                 : Stops a job at its next step.
                 {OKBLUE}info{ENDC}                          : Show console information.
                 {OKBLUE}version{ENDC}                       : Show the current version.
                 {OKBLUE}wipe{ENDC}                          : Clears everything off the console screen.
@@ -1346,8 +3311,10 @@ def __handle_prompt(prompt: str):
                 {OKBLUE}meow{ENDC}                          : Cat says meow back!
                 {OKBLUE}nya{ENDC}                           : {PINK}Nya~!{ENDC}
                 {OKBLUE}what is reality{ENDC}               : What {BOLD}is{ENDC} reality? What's your reality?""")
-        case "help":
-            print(fr"""
+
+@__command("help", args=False, bare=True)
+def __cmd_help(prompt: str, args: str):
+    print(fr"""
             {OKCYAN}XCon Console Help:{ENDC}
                 ------------------
 
@@ -1361,16 +3328,34 @@ def __handle_prompt(prompt: str):
                 {OKBLUE}inspect folder {OKCYAN}<folder_name> {YELLOW}all {OKCYAN}<file_extension>{ENDC}           : Get all files in {OKCYAN}folder_name{ENDC}
                                                                               that have the file extension 
                                                                               {OKCYAN}file_extension{ENDC}.
+                {OKBLUE}inspect folder {OKCYAN}<folder_name> {ORANGE}!r{ENDC}  : Inspects folder_name recursively, showing the amount of files,
+                                                the total size and the largest files of every subfolder.
+                                                Can be combined with {YELLOW}all {OKCYAN}<file_extension>{ENDC}.
                 {OKBLUE}inspect file {OKCYAN}<file_name>{ENDC}      : Reads all lines from a file (if possible).
+                {OKBLUE}inspect file {OKCYAN}<file_name> {ORANGE}!head {OKCYAN}<n>{ENDC}      : Reads the first n lines of a file. {ORANGE}!tail {OKCYAN}<n>{ENDC} reads the last n lines
+                                                             without reading the rest of the file.
+                {OKBLUE}inspect file {OKCYAN}<file_name> {ORANGE}!range {OKCYAN}<a>:<b>{ENDC}  : Reads lines a up to and including b.
+                {OKBLUE}inspect file {OKCYAN}<file_name> {ORANGE}!page {OKCYAN}[n]{ENDC}       : Reads a file n lines (40 by default) at a time.
+                {OKBLUE}inspect grep {WARNING}<pattern> {OKCYAN}<path> {ORANGE}[{YELLOW}all {OKCYAN}<file_extension>{ORANGE}] [{OKCYAN}!max <n>{ORANGE}] [{OKCYAN}!count{ORANGE}]{ENDC} : Searches every file in path for the regular
+                                                             expression pattern and shows each match as file:line.
+                                                             Several quoted patterns match any of them. {OKCYAN}!count{ENDC} only
+                                                             shows the amount of matching lines per file.
                 {OKBLUE}inspect file text {WARNING}<text> {OKCYAN}<file_name>{ENDC}       : Reads a specific piece of text from the file
                                                              and returns the amount of times the text 
                                                              has been repeated inside of {OKCYAN}file_name.
+                                                             {ENDC}Add {ORANGE}!lines{ENDC} to also show every matching line and its line number.
 
                 -- Modules
                 {OKBLUE}access module {OKCYAN}<module_name>{ENDC}   : Access (or simpler, import) the module {OKCYAN}module_name{ENDC}.
+                                                Accessed modules are accessed again in the next sessions, and
+                                                only imported once they are first used.
                 {OKBLUE}module {OKCYAN}<module_name>{ENDC}          : Returns the type of {OKCYAN}module_name{ENDC}.
+                {OKBLUE}module timings{ENDC}                : Shows how long each accessed module took to import.
+                {OKBLUE}forget module {OKCYAN}<module_name>{ENDC}   : Stops accessing {OKCYAN}module_name{ENDC} automatically in the next sessions.
                 {OKBLUE}install {OKCYAN}<package_name>{ENDC}        : Attempts to install the global package {OKCYAN}package_name{ENDC}.
+                                                Several packages are installed together in one pip call.
                 {OKCYAN}<package_name> {OKBLUE}info{ENDC}           : Gathers information about the package {OKCYAN}package_name{ENDC}.
+                                                Several package names can be given at once.
                 {OKBLUE}installer {OKCYAN}upgrade{ENDC}             : Attempts to upgrade/update the installer to the latest version.
                 
                 -- Internal
@@ -1394,6 +3379,7 @@ def __handle_prompt(prompt: str):
                 {OKBLUE}mute volume{ENDC}                   : Mutes the volume.
                 {OKBLUE}console {OKCYAN}<command>{ENDC}             : Runs a command directly through the console. 
                                                 {WARNING}Note: Not all commands will run as expected through XCon.{ENDC}
+                {OKBLUE}console {YELLOW}!timeout {OKCYAN}<seconds> <command>{ENDC} : Runs a command, stopping it after {OKCYAN}seconds{ENDC}.
 
                 -- File I/O
                 {OKBLUE}fmake {OKCYAN}<file_name> {ORANGE}[{OKCYAN}^ {WARNING}<content> {YELLOW}[{OKBLUE}| {YELLOW}<- multiline indc.]{ORANGE}] [{OKCYAN}!append {ORANGE}or {OKCYAN}| !append{ORANGE}] [{OKCYAN}!nodef{ORANGE}]{ENDC}   : Create 
@@ -1407,12 +3393,18 @@ def __handle_prompt(prompt: str):
                                                                          file, so you'd have to put {OKCYAN}!nodef{ENDC}
                                                                          in the end if you'd want a file without a
                                                                          file extension.
+                {OKBLUE}fmake {OKCYAN}<file_name> {OKCYAN}^< {WARNING}<source_file>{ENDC}  : Write the content of {WARNING}source_file{ENDC} (or stdin with {OKCYAN}-{ENDC})
+                                                into {OKCYAN}file_name{ENDC}, streamed in blocks. Works with {OKCYAN}!append{ENDC} as well.
+                {OKBLUE}fmake {ORANGE}... {OKCYAN}!repeat {WARNING}<n>{ENDC}            : Writes the content (or source file) n times, for example
+                                                to generate large test files.
                 {OKBLUE}fdel {OKCYAN}<file_name> {ORANGE}[{OKCYAN}!nodef{ORANGE}]{ENDC}     : Delete a file in the current path. 
                                                 The file automatically defaults to a .txt
                                                 file, so you'd have to put {OKCYAN}!nodef{ENDC}
                                                 in the end if you'd want a file without a
                                                 file extension.
                                                 (You need to confirm in order to delete the file first.)
+                                                Multiple files and patterns like {OKCYAN}*.obj{ENDC} can be removed at once,
+                                                with a single confirmation.
                 {OKBLUE}fcopy {OKCYAN}<file_name> {YELLOW}<dir_name> {ORANGE}[{OKCYAN}!nodef{ORANGE}]{ENDC}     : Copy the file {OKCYAN}file_name{ENDC} into
                                                             the directory {OKCYAN}dir_name{ENDC}.
                                                             If there is no directory name specified,
@@ -1421,16 +3413,22 @@ def __handle_prompt(prompt: str):
                                                             {ENDC}assures that the file name doesn't include
                                                             a file extension. If the directory {OKCYAN}dir_name 
                                                             {ENDC}already exists, it will check for available directory names.
+                                                            Multiple files and patterns like {OKCYAN}*.log{ENDC} can be copied at once,
+                                                            for example {OKBLUE}fcopy {OKCYAN}a.txt *.log {YELLOW}dir_name{ENDC}.
                 {OKBLUE}dirmake {OKCYAN}<dir_name>{ENDC}            : Create a directory in the current path.
                 {OKBLUE}dirdel {OKCYAN}<dir_name>{ENDC}             : Delete a directory in the current path.
                                                 If a directory is protected (for example, {OKCYAN}C:\Users\user1\Documents{ENDC}), 
                                                 this will not run and will quit the console instead.
                 {OKBLUE}dirdel {OKCYAN}current{ENDC}                : Delete the current console path.
+                {OKBLUE}dircopy {OKCYAN}<dir_name> {YELLOW}<dest_dir> {ORANGE}[{OKCYAN}!hash{ORANGE}]{ENDC} : Copy the directory {OKCYAN}dir_name{ENDC} into {OKCYAN}dest_dir{ENDC}.
+                                                Files that are already up to date (same size and modification
+                                                time) are skipped. {OKCYAN}!hash{ENDC} compares the content of the files instead.
                 {OKBLUE}<file_name>{ENDC}                   : Opens the file {OKCYAN}file_name{ENDC}.
                 
                 -- Script
                 {OKBLUE}xcon script {OKCYAN}<script_file>{ENDC}     : Runs a XCon script from a file inside the console. 
                                                 (Make sure your file is a {YELLOW}.xcon{ENDC} file!)
+                {OKBLUE}xcon script {OKCYAN}-{ENDC}                 : Runs a XCon script piped in through stdin, line by line.
                 {OKBLUE}python script {OKCYAN}<script_file>{ENDC}   : Runs a Python script from a file inside the console. 
                                                 (Make sure your file is a {YELLOW}.py{ENDC} file!)
                 {OKBLUE}python run {OKCYAN}<python_command>{ENDC}   : Runs a Python command through the console.
@@ -1440,6 +3438,12 @@ def __handle_prompt(prompt: str):
                 {OKBLUE}python block {OKCYAN}!x <block>{ENDC}       : Runs a Python block, automatically indenting for you.
                                                                       To make your code block run, type {OKCYAN}!end{ENDC}
                                                                       at the end of your code block.
+                {OKBLUE}python ctx new {OKCYAN}<name>{ENDC}         : Creates a new Python context and switches to it.
+                {OKBLUE}python ctx use {OKCYAN}<name>{ENDC}         : Switches python run and python block to another context.
+                {OKBLUE}python ctx list{ENDC}                : Lists the Python contexts.
+                {OKBLUE}python ctx del {OKCYAN}<name>{ENDC}         : Deletes a Python context.
+                {OKBLUE}python ctx snapshot {OKCYAN}[label]{ENDC}   : Saves a copy of the current context, for example after loading data.
+                {OKBLUE}python ctx restore {OKCYAN}[label]{ENDC}    : Puts the current context back the way it was at the snapshot.
 
                 -- Variables
                 {OKCYAN}Note: Variables get saved and loaded back in every session. There is no need to redefine them.{ENDC} 
@@ -1461,6 +3465,7 @@ def __handle_prompt(prompt: str):
                 {HEADER}@variable{ENDC}                     : Gets evaluated as a variable. You won't need this with
                                                 commands like {OKBLUE}see {OKCYAN}<var_name>{ENDC}, but you
                                                 can use this for other commands that don't support it.
+                {HEADER}@@{ENDC}                            : Escape sequence for a genuine at sign (@), which won't get evaluated.
                 -- Conditions
                 {OKBLUE}check {OKCYAN}<condition>{ENDC}             : Checks if a certain condition is true or not.
                 {OKBLUE}check {OKCYAN}<any>{ENDC}                   : This can be anything, for example, this can check the
@@ -1468,6 +3473,7 @@ def __handle_prompt(prompt: str):
                                                 to get a certain value that hasn't been paired with a 
                                                 variable yet.
                 {OKBLUE}check type {OKCYAN}<var_name>{ENDC}         : Checks what type {OKCYAN}var_name{ENDC} is.
+                {OKBLUE}check deps {OKCYAN}<condition>{ENDC}        : Lists the declared variables a condition depends on.
                 {OKBLUE}check {OKCYAN}<file_name> {WARNING}exists{ENDC}      : Checks if a certain file exists in the current context.
                 {OKBLUE}check {OKCYAN}<dir_name> {WARNING}exists{ENDC}       : Checks if a certain directory exists in the current context.
 
@@ -1485,6 +3491,11 @@ def __handle_prompt(prompt: str):
                                                 In order to escape comments and make a genuine dollar sign ($),
                                                 you'll need to use the escape sequence instead of a single $,
                                                 {OKBLUE}$${ENDC}.
+                {OKCYAN}<command> {OKBLUE}&{ENDC}                   : Runs any command in the background as a job.
+                {OKBLUE}jobs{ENDC}                          : Lists the background jobs.
+                {OKBLUE}wait {OKCYAN}<job_id>{ENDC}                 : Waits for a job to finish and shows its output.
+                {OKBLUE}fg {OKCYAN}<job_id>{ENDC}                   : Shows the output of a job live until it finishes. Ctrl+C sends it back.
+                {OKBLUE}kill {OKCYAN}<job_id>{ENDC}                 : Stops a job at its next step.
                 {OKBLUE}info{ENDC}                          : Show console information.
                 {OKBLUE}version{ENDC}                       : Show the current version.
                 {OKBLUE}wipe{ENDC}                          : Clears everything off the console screen.
@@ -1512,25 +3523,37 @@ def __handle_prompt(prompt: str):
 
                 XCon 2025 Ltd.
                 """)
-        case _:
-            if prompt:
-                try:
-                    result = subprocess.run(prompt, shell=True, capture_output=True, text=True)
-                    if result.returncode != 0:
-                        print(f"{prompt} is not recognized by the XCon Console.")
-                    else:
-                        pass
-                except Exception as e:
-                    print(f"An exception occurred while trying to run command. Cause:\n\n{e}")
+
+def __run_shell(prompt: str):
+    if prompt:
+        try:
+            result = __run_process(prompt, SHELL_TIMEOUT)
+            if result.timed_out:
+                print(f"{FAIL}{prompt} was stopped after {SHELL_TIMEOUT:g}s.{ENDC}")
+            elif result.returncode in SHELL_NOT_FOUND:
+                print(f"{prompt} is not recognized by the XCon Console.")
+            elif result.returncode != 0:
+                print(f"{WARNING}{prompt} exited with code {result.returncode}.{ENDC}")
+        except KeyboardInterrupt:
+            print(f"{WARNING}{prompt} was interrupted.{ENDC}")
+        except Exception as e:
+            print(f"An exception occurred while trying to run command. Cause:\n\n{e}")
     
 def __console():
     global LAST
     global RESERVED
     __load_vars()
+    __load_modules()
     print(f"{OKCYAN}>>>>> {HEADER}XCon Console Ltd. 2025\nUse for educational purposes.")
     while True:
         try:
-            PROMPT = input(f"{ENDC}{os.getcwd()} >{OKBLUE} ").strip()
+            __report_jobs()
+            try:
+                PROMPT = input(f"{ENDC}{os.getcwd()} >{OKBLUE} ").strip()
+            except EOFError:
+                # The end of a piped script, or Ctrl+D (Ctrl+Z on Windows). There are no more prompts to read, so leave like close does.
+                print()
+                __cmd_close("close", "")
             if PROMPT:
                 if not PROMPT.startswith("command history"):
                     COMMAND_HISTORY.append(PROMPT)